@@ -41,6 +41,7 @@ from loguru import logger
 from api.config import api_config
 from api.tasks import task_manager
 from api.dependencies import shutdown_pixelle_video
+from pixelle_video.services.browser_pool import close_render_pool
 
 # Import routers
 from api.routers import (
@@ -75,6 +76,7 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 Shutting down Pixelle-Video API...")
     await task_manager.stop()
     await shutdown_pixelle_video()
+    await close_render_pool()
     logger.info("✅ Pixelle-Video API shutdown complete")
 
 
@@ -165,8 +167,15 @@ if __name__ == "__main__":
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    parser.add_argument(
+        "--task-execution",
+        choices=["inline", "worker"],
+        default=api_config.task_execution,
+        help="Run async tasks in this process (inline) or in `python -m pixelle_video.worker` processes (worker)"
+    )
     
     args = parser.parse_args()
+    api_config.task_execution = args.task_execution
     
     # Print startup banner
     print(f"""
@@ -14,7 +14,7 @@
 API Configuration
 """
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel
 
 
@@ -31,13 +31,27 @@ class APIConfig(BaseModel):
     cors_origins: list[str] = ["*"]
     
     # Task settings
-    max_concurrent_tasks: int = 5
+    max_concurrent_tasks: int = 5      # Worker pool size (tasks beyond this wait in the queue)
+    task_max_attempts: int = 2         # Runs per task; tasks interrupted by a restart are retried until exhausted
+    task_db_file: str = "tasks.db"     # Task queue database (under data/)
+    task_event_buffer_size: int = 50   # Recent progress events kept per task for late subscribers
+    event_keepalive_interval: float = 15.0  # Seconds between keepalives on idle event streams
+    task_execution: Literal["inline", "worker"] = "inline"  # "worker": tasks run by python -m pixelle_video.worker
+    
+    # Worker process settings (task_execution = "worker")
+    worker_poll_interval: float = 1.0       # Seconds between queue polls when idle
+    worker_heartbeat_interval: float = 2.0  # Seconds between heartbeats / cancellation checks
+    worker_stale_after: float = 60.0        # Running tasks without heartbeat for this long are recovered
     task_cleanup_interval: int = 3600  # Clean completed tasks every hour
     task_retention_time: int = 86400   # Keep task results for 24 hours
     
     # File upload settings
     max_upload_size: int = 100 * 1024 * 1024  # 100MB
     
+    # File serving settings (/api/files)
+    file_cache_max_age: int = 31536000            # Cache lifetime of versioned file URLs (?v=...), 1 year
+    file_accel_redirect: Optional[str] = None     # e.g. "/internal/": reverse proxy sends files (X-Accel-Redirect)
+    
     # API settings
     api_prefix: str = "/api"
     docs_url: Optional[str] = "/docs"
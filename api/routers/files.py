@@ -14,18 +14,58 @@
 File service endpoints
 
 Provides access to generated files (videos, images, audio) and resource files.
+
+Responses carry ETag/Last-Modified validators (conditional requests get a
+304) and support single and multi-range requests, so video scrubbing only
+fetches the bytes it needs. URLs carrying the current version (?v=, see
+file_version) are cached as immutable, which lets a CDN keep them for good;
+a re-render changes the version and therefore the URL.
 """
 
+import os
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, Response
 from loguru import logger
 
+from api.config import api_config
+
 router = APIRouter(prefix="/files", tags=["Files"])
 
 
-@router.get("/{file_path:path}")
-async def get_file(file_path: str):
+def file_version(stat_result: os.stat_result) -> str:
+    """
+    Version token of a file (changes whenever the file is rewritten)
+    
+    Used as the ETag value and as the ?v= parameter of versioned file URLs.
+    """
+    return f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+
+
+def _is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the current file"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence; weak comparison is fine for GET/HEAD
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    
+    return False
+
+
+@router.api_route("/{file_path:path}", methods=["GET", "HEAD"])
+async def get_file(file_path: str, request: Request, v: Optional[str] = None):
     """
     Get file by path
     
@@ -39,6 +79,8 @@ async def get_file(file_path: str):
     - resources/ - Other resources (images, fonts, etc.)
     
     - **file_path**: File path relative to allowed directories
+    - **v**: Optional file version; when it matches the current file, the
+      response is cacheable as immutable
     
     Examples:
     - "abc123.mp4" → output/abc123.mp4
@@ -47,7 +89,7 @@ async def get_file(file_path: str):
     - "bgm/default.mp3" → bgm/default.mp3
     - "resources/example.png" → resources/example.png
     
-    Returns file for download or preview.
+    Returns file for download or preview (Range requests supported).
     """
     try:
         # Define allowed directories (in priority order)
@@ -108,16 +150,42 @@ async def get_file(file_path: str):
             '.gif': 'image/gif',
             '.html': 'text/html',
             '.json': 'application/json',
+            '.m3u8': 'application/vnd.apple.mpegurl',
+            '.ts': 'video/mp2t',
         }
         media_type = media_types.get(suffix, 'application/octet-stream')
         
-        # Use inline disposition for browser preview
+        stat_result = abs_path.stat()
+        version = file_version(stat_result)
+        headers = {
+            # Use inline disposition for browser preview
+            "Content-Disposition": f'inline; filename="{abs_path.name}"',
+            "ETag": f'"{version}"',
+            "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "Accept-Ranges": "bytes",
+            # Versioned URLs never change content; others must revalidate (cheap 304)
+            "Cache-Control": (
+                f"public, max-age={api_config.file_cache_max_age}, immutable"
+                if v == version else "no-cache"
+            ),
+        }
+        
+        if _is_not_modified(request, headers["ETag"], stat_result.st_mtime):
+            headers.pop("Content-Disposition")
+            return Response(status_code=304, headers=headers)
+        
+        # Let the reverse proxy send the file (sendfile, ranges) instead of Python
+        if api_config.file_accel_redirect:
+            headers["X-Accel-Redirect"] = quote(api_config.file_accel_redirect.rstrip("/") + "/" + rel_path.as_posix())
+            return Response(media_type=media_type, headers=headers)
+        
+        # FileResponse handles Range/If-Range (single and multipart/byteranges)
+        # and uses zero-copy "pathsend" on ASGI servers that support it
         return FileResponse(
             path=str(abs_path),
             media_type=media_type,
-            headers={
-                "Content-Disposition": f'inline; filename="{abs_path.name}"'
-            }
+            headers=headers,
+            stat_result=stat_result
         )
         
     except HTTPException:
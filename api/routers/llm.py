@@ -18,7 +18,7 @@ from fastapi import APIRouter, HTTPException
 from loguru import logger
 
 from api.dependencies import PixelleVideoDep
-from api.schemas.llm import LLMChatRequest, LLMChatResponse
+from api.schemas.llm import LLMChatRequest, LLMChatResponse, LLMMetricsResponse
 
 router = APIRouter(prefix="/llm", tags=["Basic Services"])
 
@@ -49,12 +49,25 @@ async def llm_chat(
             max_tokens=request.max_tokens
         )
         
+        last_call = pixelle_video.llm.last_call
         return LLMChatResponse(
             content=response,
-            tokens_used=None  # Can add token counting if needed
+            tokens_used=last_call.total_tokens if last_call else None,
+            latency=round(last_call.latency, 3) if last_call else None
         )
         
     except Exception as e:
         logger.error(f"LLM chat error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/metrics", response_model=LLMMetricsResponse)
+async def llm_metrics(pixelle_video: PixelleVideoDep):
+    """
+    LLM call metrics
+    
+    Call counts, average latency and token usage since startup, in total
+    and per model. Metrics are kept per process (each render worker has
+    its own).
+    """
+    return LLMMetricsResponse(**pixelle_video.llm.metrics.snapshot())
@@ -20,7 +20,6 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from loguru import logger
 
-from api.dependencies import PixelleVideoDep
 from api.schemas.resources import (
     WorkflowInfo,
     WorkflowListResponse,
@@ -29,6 +28,7 @@ from api.schemas.resources import (
     BGMInfo,
     BGMListResponse,
 )
+from pixelle_video.services.workflow_registry import get_workflow_registry
 from pixelle_video.utils.os_util import list_resource_files, get_root_path, get_data_path
 from pixelle_video.utils.template_util import get_all_templates_with_info
 
@@ -36,7 +36,7 @@ router = APIRouter(prefix="/resources", tags=["Resources"])
 
 
 @router.get("/workflows/tts", response_model=WorkflowListResponse)
-async def list_tts_workflows(pixelle_video: PixelleVideoDep):
+async def list_tts_workflows():
     """
     List available TTS workflows
     
@@ -59,15 +59,8 @@ async def list_tts_workflows(pixelle_video: PixelleVideoDep):
     ```
     """
     try:
-        # Get all workflows from TTS service
-        all_workflows = pixelle_video.tts.list_workflows()
-        
-        # Filter to TTS workflows only (filename starts with "tts_")
-        tts_workflows = [
-            WorkflowInfo(**wf) 
-            for wf in all_workflows 
-            if wf["name"].startswith("tts_")
-        ]
+        # TTS workflows only (filename starts with "tts_"), from the shared registry
+        tts_workflows = [WorkflowInfo(**wf) for wf in get_workflow_registry().list("tts_")]
         
         return WorkflowListResponse(workflows=tts_workflows)
         
@@ -77,7 +70,7 @@ async def list_tts_workflows(pixelle_video: PixelleVideoDep):
 
 
 @router.get("/workflows/media", response_model=WorkflowListResponse)
-async def list_media_workflows(pixelle_video: PixelleVideoDep):
+async def list_media_workflows():
     """
     List available media workflows (both image and video)
     
@@ -108,10 +101,8 @@ async def list_media_workflows(pixelle_video: PixelleVideoDep):
     ```
     """
     try:
-        # Get all workflows from media service (includes both image and video)
-        all_workflows = pixelle_video.media.list_workflows()
-        
-        media_workflows = [WorkflowInfo(**wf) for wf in all_workflows]
+        # Media workflows from the shared registry (includes both image and video)
+        media_workflows = [WorkflowInfo(**wf) for wf in get_workflow_registry().list(("image_", "video_"))]
         
         return WorkflowListResponse(workflows=media_workflows)
         
@@ -122,21 +113,15 @@ async def list_media_workflows(pixelle_video: PixelleVideoDep):
 
 # Keep old endpoint for backward compatibility
 @router.get("/workflows/image", response_model=WorkflowListResponse)
-async def list_image_workflows(pixelle_video: PixelleVideoDep):
+async def list_image_workflows():
     """
     List available image workflows (deprecated, use /workflows/media instead)
     
     This endpoint is kept for backward compatibility but will filter to image_ workflows only.
     """
     try:
-        all_workflows = pixelle_video.media.list_workflows()
-        
-        # Filter to image workflows only (filename starts with "image_")
-        image_workflows = [
-            WorkflowInfo(**wf) 
-            for wf in all_workflows 
-            if wf["name"].startswith("image_")
-        ]
+        # Image workflows only (filename starts with "image_")
+        image_workflows = [WorkflowInfo(**wf) for wf in get_workflow_registry().list("image_")]
         
         return WorkflowListResponse(workflows=image_workflows)
         
@@ -14,12 +14,16 @@
 Task management endpoints
 
 Endpoints for managing async tasks (checking status, canceling, etc.)
+and for following their progress with Server-Sent Events or WebSocket.
 """
 
+import json
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
+from api.config import api_config
 from api.tasks import task_manager, Task, TaskStatus
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
@@ -90,7 +94,10 @@ async def cancel_task(task_id: str):
         success = task_manager.cancel_task(task_id)
         
         if not success:
-            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+            task = task_manager.get_task(task_id)
+            if task is None:
+                raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+            raise HTTPException(status_code=409, detail=f"Task {task_id} is already {task.status.value}")
         
         return {
             "success": True,
@@ -103,3 +110,107 @@ async def cancel_task(task_id: str):
         logger.error(f"Cancel task error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.post("/{task_id}/resume", response_model=Task)
+async def resume_task(task_id: str):
+    """
+    Resume task
+    
+    Queue a failed or cancelled task again. Video generation tasks continue
+    from their last checkpoint: completed steps (narrations, title, image
+    prompts) and finished frames are reused, only the remaining work runs.
+    
+    - **task_id**: Task ID
+    
+    Returns the re-queued task.
+    """
+    try:
+        task = task_manager.retry_task(task_id)
+        
+        if not task:
+            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+        
+        return task
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error(f"Resume task error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{task_id}/events")
+async def stream_task_events(
+    task_id: str,
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+    after: int = Query(0, ge=0, description="Only replay events with a higher sequence number")
+):
+    """
+    Stream task progress (Server-Sent Events)
+    
+    Pushes an event for every progress update and status change until the
+    task finishes. Recent events are replayed first, so late subscribers
+    get the current state; reconnecting clients resume from `Last-Event-ID`.
+    
+    - **task_id**: Task ID
+    
+    Each event has `id` (sequence number), `event` ("status" or "progress")
+    and JSON `data` with status, progress (including frame_current, step and
+    action) and error.
+    """
+    if not task_manager.get_task(task_id):
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+    
+    async def event_stream():
+        events = task_manager.subscribe(
+            task_id,
+            last_seq=last_event_id if last_event_id is not None else after,
+            keepalive=api_config.event_keepalive_interval
+        )
+        async for event in events:
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        }
+    )
+
+
+@router.websocket("/{task_id}/ws")
+async def task_events_websocket(websocket: WebSocket, task_id: str, after: int = 0):
+    """
+    Stream task progress (WebSocket)
+    
+    Same events as `/{task_id}/events`, sent as JSON messages. Idle
+    connections get `{"type": "keepalive"}` messages. The server closes the
+    connection after the final status event.
+    """
+    await websocket.accept()
+    
+    if not task_manager.get_task(task_id):
+        await websocket.close(code=4404, reason=f"Task {task_id} not found")
+        return
+    
+    try:
+        events = task_manager.subscribe(
+            task_id,
+            last_seq=after,
+            keepalive=api_config.event_keepalive_interval
+        )
+        async for event in events:
+            await websocket.send_json(event if event is not None else {"type": "keepalive"})
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.debug(f"Event subscriber for task {task_id} disconnected")
+    except Exception as e:
+        # Sending to a connection that dropped without a close frame
+        logger.debug(f"Event stream for task {task_id} closed: {e}")
@@ -17,21 +17,24 @@ Supports both synchronous and asynchronous video generation.
 """
 
 import os
+from typing import Union
 from fastapi import APIRouter, HTTPException, Request
 from loguru import logger
 
-from api.dependencies import PixelleVideoDep
+from api.dependencies import PixelleVideoDep, get_pixelle_video
 from api.schemas.video import (
     VideoGenerateRequest,
     VideoGenerateResponse,
     VideoGenerateAsyncResponse,
 )
-from api.tasks import task_manager, TaskType
+from api.tasks import task_manager, Task, TaskType
+from pixelle_video.services.live_preview import get_preview_playlist_path
+from pixelle_video.utils.os_util import create_task_id
 
 router = APIRouter(prefix="/video", tags=["Video Generation"])
 
 
-def path_to_url(request: Request, file_path: str) -> str:
+def path_to_url(request: Union[Request, str], file_path: str) -> str:
     """
     Convert file path to accessible URL
     
@@ -39,11 +42,12 @@ def path_to_url(request: Request, file_path: str) -> str:
     to the output directory for URL construction.
     
     Args:
-        request: FastAPI Request object (provides base_url from actual request)
+        request: FastAPI Request object (provides base_url from actual request),
+                 or a base URL string recorded from an earlier request
         file_path: Absolute or relative file path
     
     Returns:
-        Full URL to access the file
+        Full URL to access the file (with ?v=<version> if the file exists)
     
     Examples:
         Windows: G:\\...\\output\\20251205_233630_c939\\final.mp4
@@ -56,6 +60,10 @@ def path_to_url(request: Request, file_path: str) -> str:
     """
     from pathlib import Path
     import os
+    from api.routers.files import file_version
+    
+    # Versioned URL (cacheable as immutable) when the file is available locally
+    query = f"?v={file_version(os.stat(file_path))}" if os.path.isfile(file_path) else ""
     
     # Normalize path separators to forward slashes first (for cross-platform compatibility)
     file_path = file_path.replace("\\", "/")
@@ -81,8 +89,117 @@ def path_to_url(request: Request, file_path: str) -> str:
             file_path = file_path[7:]  # Remove "output/"
     
     # Build URL using request's base_url (automatically matches the request host)
-    base_url = str(request.base_url).rstrip('/')
-    return f"{base_url}/api/files/{file_path}"
+    base_url = str(request.base_url if isinstance(request, Request) else request).rstrip('/')
+    return f"{base_url}/api/files/{file_path}{query}"
+
+
+def build_video_params(request_body: VideoGenerateRequest) -> dict:
+    """
+    Build pipeline parameters for a video generation request
+    
+    Args:
+        request_body: Video generation request
+    
+    Returns:
+        Keyword arguments for PixelleVideoCore.generate_video()
+    """
+    # Auto-determine media_width and media_height from template meta tags (required)
+    if not request_body.frame_template:
+        raise ValueError("frame_template is required to determine media size")
+    
+    from pixelle_video.services.frame_html import HTMLFrameGenerator
+    from pixelle_video.utils.template_util import resolve_template_path
+    template_path = resolve_template_path(request_body.frame_template)
+    generator = HTMLFrameGenerator(template_path)
+    media_width, media_height = generator.get_media_size()
+    logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
+    
+    # Build video generation parameters
+    video_params = {
+        "text": request_body.text,
+        "mode": request_body.mode,
+        "title": request_body.title,
+        "n_scenes": request_body.n_scenes,
+        "min_narration_words": request_body.min_narration_words,
+        "max_narration_words": request_body.max_narration_words,
+        "min_image_prompt_words": request_body.min_image_prompt_words,
+        "max_image_prompt_words": request_body.max_image_prompt_words,
+        "media_width": media_width,
+        "media_height": media_height,
+        "media_workflow": request_body.media_workflow,
+        "video_fps": request_body.video_fps,
+        "segment_encode_mode": request_body.segment_encode_mode,
+        "render_mode": request_body.render_mode,
+        "frame_template": request_body.frame_template,
+        "prompt_prefix": request_body.prompt_prefix,
+        "bgm_path": request_body.bgm_path,
+        "bgm_volume": request_body.bgm_volume,
+        "bgm_fade_in": request_body.bgm_fade_in,
+        "bgm_fade_out": request_body.bgm_fade_out,
+        "bgm_ducking": request_body.bgm_ducking,
+    }
+    
+    # Add TTS workflow if specified
+    if request_body.tts_workflow:
+        video_params["tts_workflow"] = request_body.tts_workflow
+    
+    # Add ref_audio if specified
+    if request_body.ref_audio:
+        video_params["ref_audio"] = request_body.ref_audio
+    
+    # Legacy voice_id support (deprecated)
+    if request_body.voice_id:
+        logger.warning("voice_id parameter is deprecated, please use tts_workflow instead")
+        video_params["voice_id"] = request_body.voice_id
+    
+    # Add custom template parameters if specified
+    if request_body.template_params:
+        video_params["template_params"] = request_body.template_params
+    
+    return video_params
+
+
+async def run_video_generation_task(task: Task) -> dict:
+    """
+    Execute a queued video generation task
+    
+    Everything needed is read from the stored task, so tasks recovered
+    after a restart run the same way as fresh ones. If an earlier attempt
+    left a pipeline checkpoint, generation resumes from it.
+    """
+    request_body = VideoGenerateRequest(**task.request_params)
+    pixelle_video = await get_pixelle_video()
+    progress_callback = lambda event: task_manager.report_event(task.task_id, event)
+    
+    # Output task ID is fixed up front, so later attempts can find the checkpoint
+    context = task.context if task.context is not None else {}
+    pipeline_task_id = context.setdefault("pipeline_task_id", create_task_id())
+    task.context = context
+    
+    if await pixelle_video.persistence.load_checkpoint(pipeline_task_id):
+        logger.info(f"Task {task.task_id}: resuming from checkpoint {pipeline_task_id}")
+        result = await pixelle_video.resume(pipeline_task_id, progress_callback=progress_callback)
+    else:
+        result = await pixelle_video.generate_video(
+            **build_video_params(request_body),
+            task_id=pipeline_task_id,
+            progress_callback=progress_callback
+        )
+    
+    # Get file size
+    file_size = os.path.getsize(result.video_path) if os.path.exists(result.video_path) else 0
+    
+    # Convert path to URL
+    video_url = path_to_url(task.context["base_url"], result.video_path)
+    
+    return {
+        "video_url": video_url,
+        "duration": result.duration,
+        "file_size": file_size
+    }
+
+
+task_manager.register_handler(TaskType.VIDEO_GENERATION, run_video_generation_task)
 
 
 @router.post("/generate/sync", response_model=VideoGenerateResponse)
@@ -107,53 +224,7 @@ async def generate_video_sync(
     try:
         logger.info(f"Sync video generation: {request_body.text[:50]}...")
         
-        # Auto-determine media_width and media_height from template meta tags (required)
-        if not request_body.frame_template:
-            raise ValueError("frame_template is required to determine media size")
-        
-        from pixelle_video.services.frame_html import HTMLFrameGenerator
-        from pixelle_video.utils.template_util import resolve_template_path
-        template_path = resolve_template_path(request_body.frame_template)
-        generator = HTMLFrameGenerator(template_path)
-        media_width, media_height = generator.get_media_size()
-        logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
-        
-        # Build video generation parameters
-        video_params = {
-            "text": request_body.text,
-            "mode": request_body.mode,
-            "title": request_body.title,
-            "n_scenes": request_body.n_scenes,
-            "min_narration_words": request_body.min_narration_words,
-            "max_narration_words": request_body.max_narration_words,
-            "min_image_prompt_words": request_body.min_image_prompt_words,
-            "max_image_prompt_words": request_body.max_image_prompt_words,
-            "media_width": media_width,
-            "media_height": media_height,
-            "media_workflow": request_body.media_workflow,
-            "video_fps": request_body.video_fps,
-            "frame_template": request_body.frame_template,
-            "prompt_prefix": request_body.prompt_prefix,
-            "bgm_path": request_body.bgm_path,
-            "bgm_volume": request_body.bgm_volume,
-        }
-        
-        # Add TTS workflow if specified
-        if request_body.tts_workflow:
-            video_params["tts_workflow"] = request_body.tts_workflow
-        
-        # Add ref_audio if specified
-        if request_body.ref_audio:
-            video_params["ref_audio"] = request_body.ref_audio
-        
-        # Legacy voice_id support (deprecated)
-        if request_body.voice_id:
-            logger.warning("voice_id parameter is deprecated, please use tts_workflow instead")
-            video_params["voice_id"] = request_body.voice_id
-        
-        # Add custom template parameters if specified
-        if request_body.template_params:
-            video_params["template_params"] = request_body.template_params
+        video_params = build_video_params(request_body)
         
         # Call video generator service
         result = await pixelle_video.generate_video(**video_params)
@@ -187,12 +258,18 @@ async def generate_video_async(
     Creates a background task for video generation.
     Returns immediately with a task_id for tracking progress.
     
+    Tasks are queued and run by a fixed worker pool (higher `priority` first,
+    FIFO otherwise); queued and interrupted tasks are resumed after a restart.
+    
     **Workflow:**
     1. Submit video generation request
     2. Receive task_id in response
     3. Poll `/api/tasks/{task_id}` to check status
     4. When status is "completed", retrieve video from result
     
+    While the task runs, `preview_url` (HLS playlist) becomes playable as soon
+    as the first frame is rendered, and grows with each finished frame.
+    
     Request body includes all video generation parameters.
     See VideoGenerateRequest schema for details.
     
@@ -201,87 +278,21 @@ async def generate_video_async(
     try:
         logger.info(f"Async video generation: {request_body.text[:50]}...")
         
-        # Create task
+        # Create task (stored, so it survives a server restart)
+        pipeline_task_id = create_task_id()
         task = task_manager.create_task(
             task_type=TaskType.VIDEO_GENERATION,
-            request_params=request_body.model_dump()
+            request_params=request_body.model_dump(),
+            priority=request_body.priority,
+            context={"base_url": str(request.base_url), "pipeline_task_id": pipeline_task_id}
         )
         
-        # Define async execution function
-        async def execute_video_generation():
-            """Execute video generation in background"""
-            # Auto-determine media_width and media_height from template meta tags (required)
-            if not request_body.frame_template:
-                raise ValueError("frame_template is required to determine media size")
-            
-            from pixelle_video.services.frame_html import HTMLFrameGenerator
-            from pixelle_video.utils.template_util import resolve_template_path
-            template_path = resolve_template_path(request_body.frame_template)
-            generator = HTMLFrameGenerator(template_path)
-            media_width, media_height = generator.get_media_size()
-            logger.debug(f"Auto-determined media size from template: {media_width}x{media_height}")
-            
-            # Build video generation parameters
-            video_params = {
-                "text": request_body.text,
-                "mode": request_body.mode,
-                "title": request_body.title,
-                "n_scenes": request_body.n_scenes,
-                "min_narration_words": request_body.min_narration_words,
-                "max_narration_words": request_body.max_narration_words,
-                "min_image_prompt_words": request_body.min_image_prompt_words,
-                "max_image_prompt_words": request_body.max_image_prompt_words,
-                "media_width": media_width,
-                "media_height": media_height,
-                "media_workflow": request_body.media_workflow,
-                "video_fps": request_body.video_fps,
-                "frame_template": request_body.frame_template,
-                "prompt_prefix": request_body.prompt_prefix,
-                "bgm_path": request_body.bgm_path,
-                "bgm_volume": request_body.bgm_volume,
-                # Progress callback can be added here if needed
-                # "progress_callback": lambda event: task_manager.update_progress(...)
-            }
-            
-            # Add TTS workflow if specified
-            if request_body.tts_workflow:
-                video_params["tts_workflow"] = request_body.tts_workflow
-            
-            # Add ref_audio if specified
-            if request_body.ref_audio:
-                video_params["ref_audio"] = request_body.ref_audio
-            
-            # Legacy voice_id support (deprecated)
-            if request_body.voice_id:
-                logger.warning("voice_id parameter is deprecated, please use tts_workflow instead")
-                video_params["voice_id"] = request_body.voice_id
-            
-            # Add custom template parameters if specified
-            if request_body.template_params:
-                video_params["template_params"] = request_body.template_params
-            
-            result = await pixelle_video.generate_video(**video_params)
-            
-            # Get file size
-            file_size = os.path.getsize(result.video_path) if os.path.exists(result.video_path) else 0
-            
-            # Convert path to URL
-            video_url = path_to_url(request, result.video_path)
-            
-            return {
-                "video_url": video_url,
-                "duration": result.duration,
-                "file_size": file_size
-            }
-        
-        # Start execution
-        await task_manager.execute_task(
-            task_id=task.task_id,
-            coro_func=execute_video_generation
-        )
+        # Queue for execution (see run_video_generation_task)
+        task_manager.submit(task.task_id)
         
         return VideoGenerateAsyncResponse(
-            task_id=task.task_id
+            task_id=task.task_id,
+            preview_url=path_to_url(request, get_preview_playlist_path(pipeline_task_id))
         )
         
     except Exception as e:
@@ -14,7 +14,7 @@
 LLM API schemas
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 
 
@@ -40,4 +40,23 @@ class LLMChatResponse(BaseModel):
     message: str = "Success"
     content: str = Field(..., description="Generated response")
     tokens_used: Optional[int] = Field(None, description="Tokens used (if available)")
+    latency: Optional[float] = Field(None, description="Request latency in seconds")
+
+
+class LLMModelMetrics(BaseModel):
+    """Aggregated LLM call metrics"""
+    calls: int = Field(0, description="Number of calls")
+    failures: int = Field(0, description="Number of failed calls")
+    avg_latency: float = Field(0.0, description="Average request latency in seconds")
+    avg_wait: float = Field(0.0, description="Average time queued behind concurrency/rate limits in seconds")
+    prompt_tokens: int = Field(0, description="Prompt tokens used")
+    completion_tokens: int = Field(0, description="Completion tokens used")
+    total_tokens: int = Field(0, description="Total tokens used")
+
+
+class LLMMetricsResponse(LLMModelMetrics):
+    """LLM metrics response (totals and per-model breakdown)"""
+    success: bool = True
+    message: str = "Success"
+    models: Dict[str, LLMModelMetrics] = Field(default_factory=dict, description="Metrics per model")
 
@@ -62,6 +62,14 @@ class VideoGenerateRequest(BaseModel):
     
     # === Video Parameters ===
     video_fps: int = Field(30, ge=15, le=60, description="Video FPS")
+    segment_encode_mode: Literal["standard", "still"] = Field(
+        "standard",
+        description="Encoder for image frames: 'standard' (full-rate x264 encode) or 'still' (fast path for static frames)"
+    )
+    render_mode: Literal["segments", "timeline"] = Field(
+        "segments",
+        description="Final render: 'segments' (per-frame segments + concat) or 'timeline' (single ffmpeg pass for image frames)"
+    )
     
     # === Frame Template (determines video size) ===
     frame_template: Optional[str] = Field(
@@ -82,6 +90,12 @@ class VideoGenerateRequest(BaseModel):
     # === BGM ===
     bgm_path: Optional[str] = Field(None, description="Background music path")
     bgm_volume: float = Field(0.3, ge=0.0, le=1.0, description="BGM volume (0.0-1.0)")
+    bgm_fade_in: float = Field(0.0, ge=0.0, le=30.0, description="BGM fade-in duration in seconds")
+    bgm_fade_out: float = Field(0.0, ge=0.0, le=30.0, description="BGM fade-out duration in seconds")
+    bgm_ducking: bool = Field(False, description="Lower the BGM while narration is playing (sidechain compression)")
+    
+    # === Queue ===
+    priority: int = Field(0, ge=-10, le=10, description="Queue priority for async generation (higher runs first)")
     
     class Config:
         json_schema_extra = {
@@ -113,4 +127,8 @@ class VideoGenerateAsyncResponse(BaseModel):
     success: bool = True
     message: str = "Task created successfully"
     task_id: str = Field(..., description="Task ID for tracking progress")
+    preview_url: Optional[str] = Field(
+        None,
+        description="Live HLS preview playlist, available (404 until then) once the first frame is rendered"
+    )
 
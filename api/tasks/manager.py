@@ -13,72 +13,160 @@
 """
 Task Manager
 
-In-memory task management for video generation jobs.
+Durable task queue for video generation jobs.
 """
 
 import asyncio
+import itertools
+import time
 import uuid
+from collections import deque
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import Any, AsyncIterator, Awaitable, Deque, Dict, List, Optional, Callable, Set, Tuple
 from loguru import logger
 
+from pixelle_video.models.progress import ProgressEvent
+
 from api.tasks.models import Task, TaskStatus, TaskType, TaskProgress
+from api.tasks.store import TaskStore
 from api.config import api_config
 
+# Handler that (re)runs a task from its stored request_params/context
+TaskHandler = Callable[[Task], Awaitable[Any]]
+
+FINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
 
 class TaskManager:
     """
     Task manager for handling async video generation tasks
     
     Features:
-    - In-memory storage (can be replaced with Redis later)
-    - Task lifecycle management
-    - Progress tracking
+    - Tasks persisted to SQLite (data/tasks.db), restored on startup
+    - Fixed worker pool (api_config.max_concurrent_tasks), priority + FIFO ordering
+    - Interrupted running tasks are re-queued (up to task_max_attempts) or failed explicitly
+    - Progress tracking, pushed to subscribers (see subscribe) with a
+      per-task ring buffer of recent events for late subscribers
     - Auto cleanup of old tasks
+    
+    Tasks survive a restart only if a handler is registered for their type
+    (see register_handler); tasks started with an in-process coroutine via
+    execute_task are failed on recovery.
+    
+    With api_config.task_execution = "worker" the API process only enqueues
+    and reads status; tasks are run by separate processes started with
+    `python -m pixelle_video.worker` (see run_worker), which relay progress
+    back through the task database.
     """
     
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
         self._task_futures: Dict[str, asyncio.Task] = {}
+        self._callables: Dict[str, Tuple[Callable, tuple, dict]] = {}
+        self._handlers: Dict[TaskType, TaskHandler] = {}
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._queue_keys: Dict[str, Tuple[int, int]] = {}  # Pending task_id -> (-priority, seq)
+        self._seq = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        self._store: Optional[TaskStore] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
+        self._external = False                # Tasks run by separate worker processes
+        self._worker_name: Optional[str] = None
+        self._progress_flushed: Dict[str, float] = {}
+        
+        # Event streaming: per-task ring buffer, sequence counter and subscriber queues
+        self._events: Dict[str, Deque[dict]] = {}
+        self._event_seq: Dict[str, int] = {}
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._relay_task: Optional[asyncio.Task] = None
+    
+    @property
+    def _db_path(self) -> str:
+        from pixelle_video.utils.os_util import get_data_path
+        return get_data_path(api_config.task_db_file)
+    
+    def register_handler(self, task_type: TaskType, handler: TaskHandler):
+        """
+        Register the handler that executes tasks of a given type
+        
+        Handlers receive the Task and must rely only on its request_params
+        and context, so queued tasks can be run again after a restart.
+        """
+        self._handlers[task_type] = handler
     
     async def start(self):
-        """Start task manager and cleanup scheduler"""
+        """Start task manager, recover stored tasks and start workers"""
         if self._running:
             logger.warning("Task manager already running")
             return
         
         self._running = True
+        self._store = TaskStore(self._db_path)
+        self._external = api_config.task_execution == "worker"
+        
+        if self._external:
+            # Worker processes claim tasks from the store and recover stale ones;
+            # their progress reaches subscribers through the relay loop
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+            self._relay_task = asyncio.create_task(self._relay_loop())
+            logger.info("✅ Task manager started (tasks run by external workers)")
+            return
+        
+        self._queue = asyncio.PriorityQueue()
+        self._recover_tasks()
+        
+        self._workers = [
+            asyncio.create_task(self._worker_loop())
+            for _ in range(api_config.max_concurrent_tasks)
+        ]
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-        logger.info("✅ Task manager started")
+        logger.info(f"✅ Task manager started ({api_config.max_concurrent_tasks} workers)")
     
     async def stop(self):
-        """Stop task manager and cancel all tasks"""
+        """
+        Stop task manager
+        
+        Running tasks are cancelled but stay "running" in the store, so they
+        are recovered on the next start.
+        """
         self._running = False
         
-        # Cancel cleanup task
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel cleanup task and workers
+        background = [t for t in [self._cleanup_task, self._relay_task, *self._workers] if t]
+        for t in background:
+            t.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
         
         # Cancel all running tasks
+        running = [f for f in self._task_futures.values() if not f.done()]
         for task_id, future in self._task_futures.items():
             if not future.done():
                 future.cancel()
-                logger.info(f"Cancelled task: {task_id}")
+                logger.info(f"Interrupted task: {task_id}")
+        await asyncio.gather(*running, return_exceptions=True)
+        
+        if self._store:
+            self._store.close()
+            self._store = None
         
         self._tasks.clear()
         self._task_futures.clear()
+        self._callables.clear()
+        self._queue_keys.clear()
+        self._events.clear()
+        self._event_seq.clear()
+        self._workers = []
+        self._relay_task = None
         logger.info("✅ Task manager stopped")
     
     def create_task(
         self,
         task_type: TaskType,
-        request_params: Optional[dict] = None
+        request_params: Optional[dict] = None,
+        priority: int = 0,
+        context: Optional[dict] = None
     ) -> Task:
         """
         Create a new task
@@ -86,7 +174,9 @@ class TaskManager:
         Args:
             task_type: Type of task
             request_params: Original request parameters
-            
+            priority: Queue priority (higher runs first)
+            context: Extra data the task handler needs to run it
+        
         Returns:
             Created task
         """
@@ -96,12 +186,37 @@ class TaskManager:
             task_type=task_type,
             status=TaskStatus.PENDING,
             request_params=request_params,
+            priority=priority,
+            context=context,
         )
         
         self._tasks[task_id] = task
+        self._save(task)
         logger.info(f"Created task {task_id} ({task_type})")
         return task
     
+    def submit(self, task_id: str):
+        """
+        Queue a task for execution by its registered handler
+        
+        Args:
+            task_id: Task ID
+        """
+        task = self._tasks.get(task_id)
+        if not task:
+            logger.error(f"Task {task_id} not found")
+            return
+        
+        if task.task_type not in self._handlers:
+            raise ValueError(f"No handler registered for task type {task.task_type}")
+        
+        if self._external:
+            # Already stored as pending: the next free worker process picks it up
+            logger.debug(f"Task {task_id} queued for external workers")
+            return
+        
+        self._enqueue(task)
+    
     async def execute_task(
         self,
         task_id: str,
@@ -110,7 +225,10 @@ class TaskManager:
         **kwargs
     ):
         """
-        Execute task asynchronously
+        Queue task for execution with an in-process coroutine function
+        
+        Such tasks cannot be re-run after a restart; prefer register_handler
+        + submit for durable tasks.
         
         Args:
             task_id: Task ID
@@ -123,35 +241,18 @@ class TaskManager:
             logger.error(f"Task {task_id} not found")
             return
         
-        # Create async task
-        async def _execute():
-            try:
-                task.status = TaskStatus.RUNNING
-                task.started_at = datetime.now()
-                logger.info(f"Task {task_id} started")
-                
-                # Execute the actual work
-                result = await coro_func(*args, **kwargs)
-                
-                # Update task with result
-                task.status = TaskStatus.COMPLETED
-                task.result = result
-                task.completed_at = datetime.now()
-                logger.info(f"Task {task_id} completed")
-                
-            except Exception as e:
-                task.status = TaskStatus.FAILED
-                task.error = str(e)
-                task.completed_at = datetime.now()
-                logger.error(f"Task {task_id} failed: {e}")
+        if self._external:
+            raise RuntimeError("execute_task runs in-process; use register_handler + submit in worker mode")
         
-        # Start execution
-        future = asyncio.create_task(_execute())
-        self._task_futures[task_id] = future
+        self._callables[task_id] = (coro_func, args, kwargs)
+        self._enqueue(task)
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID"""
-        return self._tasks.get(task_id)
+        task = self._store.load(task_id) if self._external else self._tasks.get(task_id)
+        if task:
+            self._update_queue_info([task])
+        return task
     
     def list_tasks(
         self,
@@ -164,10 +265,15 @@ class TaskManager:
         Args:
             status: Filter by status
             limit: Maximum number of tasks to return
-            
+        
         Returns:
             List of tasks
         """
+        if self._external:
+            tasks = self._store.list(status=status, limit=limit)
+            self._update_queue_info(tasks)
+            return tasks
+        
         tasks = list(self._tasks.values())
         
         if status:
@@ -176,7 +282,9 @@ class TaskManager:
         # Sort by created_at descending
         tasks.sort(key=lambda t: t.created_at, reverse=True)
         
-        return tasks[:limit]
+        tasks = tasks[:limit]
+        self._update_queue_info(tasks)
+        return tasks
     
     def update_progress(
         self,
@@ -205,32 +313,495 @@ class TaskManager:
             percentage=percentage,
             message=message
         )
+        self._progress_changed(task)
+    
+    def report_event(self, task_id: str, event: ProgressEvent):
+        """
+        Update task progress from a pipeline ProgressEvent
+        
+        Unlike update_progress, frame and step details are kept.
+        
+        Args:
+            task_id: Task ID
+            event: Progress event emitted by the pipeline
+        """
+        task = self._tasks.get(task_id)
+        if not task:
+            return
+        
+        task.progress = TaskProgress(
+            current=int(event.progress * 100),
+            total=100,
+            percentage=event.progress * 100,
+            message=event.event_type,
+            **{k: v for k, v in asdict(event).items() if k != "progress"}
+        )
+        self._progress_changed(task)
+    
+    def _progress_changed(self, task: Task):
+        """Push new progress to subscribers (or to the store in a worker process)"""
+        if self._worker_name:
+            # Worker processes relay progress to the API through the store (throttled)
+            if self._store:
+                now = time.monotonic()
+                done = task.progress.current >= task.progress.total
+                if done or now - self._progress_flushed.get(task.task_id, 0) >= 0.5:
+                    self._progress_flushed[task.task_id] = now
+                    self._store.heartbeat(task.task_id, task.progress)
+            return
+        
+        self._publish(task, "progress")
     
     def cancel_task(self, task_id: str) -> bool:
         """
-        Cancel a running task
+        Cancel a running or queued task
         
         Args:
             task_id: Task ID
-            
+        
         Returns:
-            True if cancelled, False otherwise
+            True if cancelled, False if the task doesn't exist or has already finished
         """
+        if self._external:
+            # The worker running it stops on its next heartbeat
+            cancelled = self._store.cancel(task_id)
+            if cancelled:
+                logger.info(f"Cancelled task {task_id}")
+            return cancelled
+        
         task = self._tasks.get(task_id)
-        if not task:
+        if not task or task.status not in (TaskStatus.PENDING, TaskStatus.RUNNING):
             return False
         
+        # Update task status (a queued task is skipped when dequeued)
+        task.status = TaskStatus.CANCELLED
+        task.completed_at = datetime.now()
+        self._queue_keys.pop(task_id, None)
+        self._save(task)
+        
         # Cancel future if running
         future = self._task_futures.get(task_id)
         if future and not future.done():
             future.cancel()
         
-        # Update task status
-        task.status = TaskStatus.CANCELLED
-        task.completed_at = datetime.now()
         logger.info(f"Cancelled task {task_id}")
         return True
     
+    def retry_task(self, task_id: str) -> Optional[Task]:
+        """
+        Queue a failed or cancelled task again
+        
+        The handler decides what can be reused: video generation tasks resume
+        from their pipeline checkpoint instead of starting over.
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            The re-queued task, or None if it doesn't exist
+        
+        Raises:
+            ValueError: Task is not failed/cancelled, or has no registered handler
+        """
+        task = self._store.load(task_id) if self._external else self._tasks.get(task_id)
+        if not task:
+            return None
+        
+        if task.status not in (TaskStatus.FAILED, TaskStatus.CANCELLED):
+            raise ValueError(f"Task {task_id} is {task.status.value}, only failed or cancelled tasks can be retried")
+        if task.task_type not in self._handlers:
+            raise ValueError(f"No handler registered for task type {task.task_type}")
+        
+        task.status = TaskStatus.PENDING
+        task.progress = None
+        task.result = None
+        task.error = None
+        task.attempts = 0
+        task.started_at = None
+        task.completed_at = None
+        
+        self._tasks[task_id] = task
+        self._save(task)
+        if not self._external:
+            self._enqueue(task)
+        
+        logger.info(f"Re-queued task {task_id}")
+        return task
+    
+    # ========================================================================
+    # Queue & Execution
+    # ========================================================================
+    
+    def _enqueue(self, task: Task):
+        """Put a pending task on the queue"""
+        if self._queue is None:
+            raise RuntimeError("Task manager is not started")
+        
+        key = (-task.priority, next(self._seq))
+        self._queue_keys[task.task_id] = key
+        self._queue.put_nowait((*key, task.task_id))
+        logger.debug(f"Queued task {task.task_id} (pending: {len(self._queue_keys)})")
+    
+    def _update_queue_info(self, tasks: List[Task]):
+        """Fill queue_position and wait_time on tasks before returning them"""
+        order = sorted(self._queue_keys.values())
+        now = datetime.now()
+        
+        for task in tasks:
+            if self._external:
+                task.queue_position = self._store.queue_position(task.task_id)
+            else:
+                key = self._queue_keys.get(task.task_id)
+                task.queue_position = order.index(key) if key is not None else None
+            
+            if task.status == TaskStatus.PENDING:
+                task.wait_time = (now - task.created_at).total_seconds()
+            elif task.started_at:
+                task.wait_time = (task.started_at - task.created_at).total_seconds()
+    
+    async def _worker_loop(self):
+        """Take tasks off the queue and run them one at a time"""
+        while True:
+            _, _, task_id = await self._queue.get()
+            self._queue_keys.pop(task_id, None)
+            
+            task = self._tasks.get(task_id)
+            if not task or task.status != TaskStatus.PENDING:
+                # Cancelled (or cleaned up) while queued
+                continue
+            
+            future = asyncio.create_task(self._run_task(task))
+            self._task_futures[task_id] = future
+            # wait() doesn't raise if the task itself is cancelled
+            await asyncio.wait({future})
+    
+    async def _run_task(self, task: Task, claimed: bool = False):
+        """
+        Execute a task and record its outcome
+        
+        Args:
+            task: Task to run
+            claimed: Task was already marked running by TaskStore.claim_next
+        """
+        task_id = task.task_id
+        
+        try:
+            if not claimed:
+                task.status = TaskStatus.RUNNING
+                task.started_at = datetime.now()
+                task.attempts += 1
+                self._save(task)
+            logger.info(f"Task {task_id} started (attempt {task.attempts})")
+            
+            # Execute the actual work
+            call = self._callables.get(task_id)
+            if call:
+                coro_func, args, kwargs = call
+                result = await coro_func(*args, **kwargs)
+            else:
+                result = await self._handlers[task.task_type](task)
+            
+            # Update task with result
+            task.status = TaskStatus.COMPLETED
+            task.result = result
+            task.completed_at = datetime.now()
+            self._save_final(task)
+            logger.info(f"Task {task_id} completed")
+        
+        except asyncio.CancelledError:
+            # User cancellation is recorded by cancel_task; on shutdown the task
+            # stays "running" in the store and is recovered on next start
+            raise
+        
+        except Exception as e:
+            task.status = TaskStatus.FAILED
+            task.error = str(e)
+            task.completed_at = datetime.now()
+            self._save_final(task)
+            logger.error(f"Task {task_id} failed: {e}")
+        
+        finally:
+            self._callables.pop(task_id, None)
+            self._progress_flushed.pop(task_id, None)
+    
+    def _recover_tasks(self):
+        """Load stored tasks and re-queue or fail the unfinished ones"""
+        recovered = 0
+        
+        for task in self._store.load_all():
+            self._tasks[task.task_id] = task
+            
+            if task.status not in [TaskStatus.PENDING, TaskStatus.RUNNING]:
+                continue
+            
+            if task.task_type not in self._handlers:
+                self._fail_interrupted(task, "Interrupted by server restart (task is not resumable)")
+                continue
+            
+            if task.status == TaskStatus.RUNNING:
+                if task.attempts >= api_config.task_max_attempts:
+                    self._fail_interrupted(
+                        task, f"Interrupted by server restart after {task.attempts} attempt(s)"
+                    )
+                    continue
+                
+                logger.warning(f"Task {task.task_id} was interrupted, re-queueing")
+                task.status = TaskStatus.PENDING
+                task.started_at = None
+                task.progress = None
+                self._save(task)
+            
+            self._enqueue(task)
+            recovered += 1
+        
+        if recovered:
+            logger.info(f"Recovered {recovered} queued tasks")
+    
+    def _fail_interrupted(self, task: Task, error: str):
+        task.status = TaskStatus.FAILED
+        task.error = error
+        task.completed_at = datetime.now()
+        self._save(task)
+        logger.warning(f"Task {task.task_id} failed: {error}")
+    
+    def _save(self, task: Task):
+        """Persist task state (failures are logged, not raised)"""
+        if not self._store:
+            return
+        try:
+            self._store.save(task)
+        except Exception as e:
+            logger.error(f"Failed to persist task {task.task_id}: {e}")
+        self._publish(task, "status")
+    
+    def _save_final(self, task: Task):
+        """Persist the outcome of a running task unless it was cancelled meanwhile"""
+        if not self._store:
+            return
+        try:
+            if not self._store.finish(task):
+                logger.info(f"Task {task.task_id} was cancelled, discarding its result")
+                return
+        except Exception as e:
+            logger.error(f"Failed to persist task {task.task_id}: {e}")
+        self._publish(task, "status")
+    
+    # ========================================================================
+    # Event Streaming
+    # ========================================================================
+    
+    def _publish(self, task: Task, event_type: str):
+        """Record an event in the task's ring buffer and push it to subscribers"""
+        if self._worker_name:
+            return
+        
+        seq = self._event_seq.get(task.task_id, 0) + 1
+        self._event_seq[task.task_id] = seq
+        event = self._make_event(task, event_type, seq)
+        
+        buffer = self._events.get(task.task_id)
+        if buffer is None:
+            buffer = deque(maxlen=api_config.task_event_buffer_size)
+            self._events[task.task_id] = buffer
+        buffer.append(event)
+        
+        for queue in self._subscribers.get(task.task_id, ()):
+            queue.put_nowait(event)
+    
+    def _make_event(self, task: Task, event_type: str, seq: int) -> dict:
+        return {
+            "seq": seq,
+            "type": event_type,                 # "status" or "progress"
+            "task_id": task.task_id,
+            "status": task.status.value,
+            "progress": task.progress.model_dump() if task.progress else None,
+            "error": task.error,
+            "timestamp": datetime.now().isoformat(),
+        }
+    
+    async def subscribe(
+        self,
+        task_id: str,
+        last_seq: int = 0,
+        keepalive: Optional[float] = None
+    ) -> AsyncIterator[Optional[dict]]:
+        """
+        Stream events of a task until it finishes
+        
+        Buffered events newer than last_seq are replayed first (or a snapshot
+        of the current state if none are buffered), then live events follow.
+        The stream ends after the final status event. Sequence numbers live in
+        memory and restart after a server restart, so a last_seq beyond the
+        current one is stale and the client gets everything again.
+        
+        Args:
+            task_id: Task ID (must exist)
+            last_seq: Last event sequence number the client has seen
+            keepalive: If set, yield None after this many idle seconds
+        
+        Yields:
+            Event dicts (see _make_event), or None as keepalive
+        """
+        if last_seq > self._event_seq.get(task_id, 0):
+            logger.debug(f"Stale Last-Event-ID {last_seq} for task {task_id}, replaying from start")
+            last_seq = 0
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(task_id, set()).add(queue)
+        
+        try:
+            history = [e for e in self._events.get(task_id, ()) if e["seq"] > last_seq]
+            if not history:
+                task = self.get_task(task_id)
+                if task is None:
+                    return
+                history = [self._make_event(task, "status", self._event_seq.get(task_id, 0))]
+            
+            for event in history:
+                last_seq = max(last_seq, event["seq"])
+                yield event
+            if history[-1]["type"] == "status" and history[-1]["status"] in FINAL_STATUSES:
+                return
+            
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                
+                if event["seq"] <= last_seq:
+                    continue
+                last_seq = event["seq"]
+                yield event
+                
+                if event["type"] == "status" and event["status"] in FINAL_STATUSES:
+                    return
+        finally:
+            subscribers = self._subscribers.get(task_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[task_id]
+    
+    async def _relay_loop(self):
+        """Worker mode: turn store changes of subscribed tasks into events"""
+        last_seen: Dict[str, Tuple[str, Optional[str]]] = {}
+        
+        while self._running:
+            try:
+                await asyncio.sleep(api_config.worker_poll_interval)
+                
+                for task_id in list(self._subscribers):
+                    task = self._store.load(task_id)
+                    if task is None:
+                        continue
+                    
+                    state = (task.status.value, task.progress.model_dump_json() if task.progress else None)
+                    previous = last_seen.get(task_id)
+                    if state == previous:
+                        continue
+                    
+                    last_seen[task_id] = state
+                    status_changed = previous is None or previous[0] != state[0]
+                    self._publish(task, "status" if status_changed else "progress")
+                
+                # Forget tasks nobody follows any more
+                for task_id in list(last_seen):
+                    if task_id not in self._subscribers:
+                        del last_seen[task_id]
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in event relay loop: {e}")
+    
+    # ========================================================================
+    # Worker Process Mode
+    # ========================================================================
+    
+    async def run_worker(self, name: str):
+        """
+        Run tasks from the shared store until cancelled (worker process entry)
+        
+        Claims one pending task at a time, sends heartbeats while it runs,
+        stops it when it is cancelled through the API and recovers tasks of
+        workers that died. A task interrupted by shutting the worker down goes
+        back to the queue.
+        
+        Args:
+            name: Worker name recorded on claimed tasks
+        """
+        self._running = True
+        self._worker_name = name
+        self._store = TaskStore(self._db_path)
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        logger.info(f"✅ Worker {name} started")
+        
+        try:
+            while self._running:
+                recovered = self._store.requeue_stale(
+                    stale_after=api_config.worker_stale_after,
+                    max_attempts=api_config.task_max_attempts
+                )
+                if recovered:
+                    logger.warning(f"Recovered {len(recovered)} tasks from unresponsive workers")
+                
+                task = self._store.claim_next(name)
+                if task is None:
+                    await asyncio.sleep(api_config.worker_poll_interval)
+                    continue
+                
+                if task.task_type not in self._handlers:
+                    task.status = TaskStatus.FAILED
+                    task.error = f"No handler registered for task type {task.task_type}"
+                    task.completed_at = datetime.now()
+                    self._save_final(task)
+                    continue
+                
+                self._tasks[task.task_id] = task
+                future = asyncio.create_task(self._run_task(task, claimed=True))
+                self._task_futures[task.task_id] = future
+                try:
+                    # wait() doesn't raise if the task itself is cancelled (via the API)
+                    await asyncio.wait({future})
+                except asyncio.CancelledError:
+                    # Worker shutting down: stop the task and give it back to the queue
+                    future.cancel()
+                    await asyncio.gather(future, return_exceptions=True)
+                    self._store.release(task)
+                    logger.info(f"Released task {task.task_id} back to the queue")
+                    raise
+                finally:
+                    self._tasks.pop(task.task_id, None)
+                    self._task_futures.pop(task.task_id, None)
+        finally:
+            self._running = False
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            self._store.close()
+            self._store = None
+            logger.info(f"✅ Worker {name} stopped")
+    
+    async def _heartbeat_loop(self):
+        """Keep claimed tasks alive in the store and stop tasks cancelled via the API"""
+        while True:
+            await asyncio.sleep(api_config.worker_heartbeat_interval)
+            for task_id, future in list(self._task_futures.items()):
+                if future.done():
+                    continue
+                try:
+                    status = self._store.heartbeat(task_id)
+                except Exception as e:
+                    logger.error(f"Heartbeat failed for task {task_id}: {e}")
+                    continue
+                if status == TaskStatus.CANCELLED:
+                    logger.info(f"Task {task_id} cancelled via API, stopping")
+                    future.cancel()
+    
+    # ========================================================================
+    # Cleanup
+    # ========================================================================
+    
     async def _cleanup_loop(self):
         """Periodically clean up old completed tasks"""
         while self._running:
@@ -246,21 +817,28 @@ class TaskManager:
         """Remove old completed/failed tasks"""
         cutoff_time = datetime.now() - timedelta(seconds=api_config.task_retention_time)
         
+        # In worker mode the store is the source of truth
+        tasks = self._store.load_all() if self._external else self._tasks.values()
+        
         tasks_to_remove = []
-        for task_id, task in self._tasks.items():
+        for task in tasks:
+            task_id = task.task_id
             if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
                 if task.completed_at and task.completed_at < cutoff_time:
                     tasks_to_remove.append(task_id)
         
         for task_id in tasks_to_remove:
-            del self._tasks[task_id]
+            self._tasks.pop(task_id, None)
+            self._events.pop(task_id, None)
+            self._event_seq.pop(task_id, None)
             if task_id in self._task_futures:
                 del self._task_futures[task_id]
         
         if tasks_to_remove:
+            if self._store:
+                self._store.delete(tasks_to_remove)
             logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
 
 
 # Global task manager instance
 task_manager = TaskManager()
-
@@ -40,6 +40,14 @@ class TaskProgress(BaseModel):
     total: int = 0
     percentage: float = 0.0
     message: str = ""
+    
+    # Pipeline ProgressEvent details (when reported via report_event)
+    event_type: Optional[str] = None
+    frame_current: Optional[int] = None
+    frame_total: Optional[int] = None
+    step: Optional[int] = None
+    action: Optional[str] = None
+    extra_info: Optional[str] = None
 
 
 class Task(BaseModel):
@@ -51,6 +59,12 @@ class Task(BaseModel):
     # Progress tracking
     progress: Optional[TaskProgress] = None
     
+    # Queueing
+    priority: int = 0                      # Higher runs first; FIFO within the same priority
+    attempts: int = 0                      # Number of times execution was started
+    queue_position: Optional[int] = None   # Pending tasks ahead of this one (0 = next), None when not queued
+    wait_time: Optional[float] = None      # Seconds spent queued (so far, if still pending)
+    
     # Result
     result: Optional[Any] = None
     error: Optional[str] = None
@@ -60,9 +74,12 @@ class Task(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
-    # Request parameters (for reference)
+    # Request parameters (for reference, and to re-run the task after a restart)
     request_params: Optional[dict] = None
     
+    # Extra execution context needed to re-run the task (e.g. request base URL)
+    context: Optional[dict] = None
+    
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
@@ -0,0 +1,327 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Task Store
+
+SQLite persistence for API tasks, so queued and running jobs survive a
+server restart. The database is also the queue shared between the API and
+separate worker processes (see pixelle_video.worker).
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from api.tasks.models import Task, TaskProgress, TaskStatus
+
+TASK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,  -- Submission order (FIFO tie-break)
+    task_id      TEXT NOT NULL UNIQUE,
+    status       TEXT NOT NULL,
+    priority     INTEGER NOT NULL DEFAULT 0,
+    created_at   TEXT NOT NULL,
+    data         TEXT NOT NULL,                      -- Task model as JSON
+    progress     TEXT,                               -- Latest TaskProgress as JSON (written by workers)
+    worker       TEXT,                               -- Worker running the task
+    heartbeat_at REAL                                -- Last worker heartbeat (unix time)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_queue ON tasks (status, priority DESC, seq);
+"""
+
+
+class TaskStore:
+    """
+    Durable task storage backed by SQLite (WAL mode)
+
+    Safe to share between processes: claiming a task happens in a write
+    transaction, so each pending task goes to exactly one worker.
+
+    Usage:
+        store = TaskStore("data/tasks.db")
+        store.save(task)
+        tasks = store.load_all()  # In submission order
+        task = store.claim_next("worker-1")
+        store.delete([task_id])
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize task store
+
+        Args:
+            db_path: SQLite database file path
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(TASK_SCHEMA)
+        self._conn.commit()
+
+    def save(self, task: Task):
+        """Insert or update a task (submission order is kept on update)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO tasks (task_id, status, priority, created_at, data)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    status = excluded.status,
+                    priority = excluded.priority,
+                    data = excluded.data
+                """,
+                (
+                    task.task_id,
+                    task.status.value,
+                    task.priority,
+                    task.created_at.isoformat(),
+                    task.model_dump_json(),
+                )
+            )
+
+    def finish(self, task: Task) -> bool:
+        """
+        Store the final state of a running task
+
+        Returns:
+            False if the task is no longer running (e.g. it was cancelled)
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = ?, data = ?, worker = NULL WHERE task_id = ? AND status = ?",
+                (task.status.value, task.model_dump_json(), task.task_id, TaskStatus.RUNNING.value)
+            )
+            return cursor.rowcount > 0
+
+    def load(self, task_id: str) -> Optional[Task]:
+        """Load a task by ID (with the latest worker progress)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, progress FROM tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        return self._row_to_task(row) if row else None
+
+    def load_all(self) -> List[Task]:
+        """Load all stored tasks in submission order"""
+        with self._lock:
+            rows = self._conn.execute("SELECT data, progress FROM tasks ORDER BY seq").fetchall()
+        return [self._row_to_task(row) for row in rows]
+
+    def list(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[Task]:
+        """List tasks, newest first"""
+        where, params = ("WHERE status = ?", (status.value,)) if status else ("", ())
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data, progress FROM tasks {where} ORDER BY created_at DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [self._row_to_task(row) for row in rows]
+
+    def queue_position(self, task_id: str) -> Optional[int]:
+        """Number of pending tasks that run before this one (None if not pending)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT seq, priority FROM tasks WHERE task_id = ? AND status = ?",
+                (task_id, TaskStatus.PENDING.value)
+            ).fetchone()
+            if not row:
+                return None
+            seq, priority = row
+            return self._conn.execute(
+                """
+                SELECT COUNT(*) FROM tasks
+                WHERE status = ? AND (priority > ? OR (priority = ? AND seq < ?))
+                """,
+                (TaskStatus.PENDING.value, priority, priority, seq)
+            ).fetchone()[0]
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Mark a pending or running task as cancelled
+
+        Workers notice the status change on their next heartbeat. Read and
+        write happen in one transaction, so a worker finishing the task at the
+        same time either wins (nothing is cancelled) or sees the cancellation.
+
+        Returns:
+            False if the task doesn't exist or has already finished
+        """
+        active = (TaskStatus.PENDING.value, TaskStatus.RUNNING.value)
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT data FROM tasks WHERE task_id = ? AND status IN (?, ?)",
+                    (task_id, *active)
+                ).fetchone()
+                if not row:
+                    self._conn.commit()
+                    return False
+
+                task = Task.model_validate_json(row[0])
+                task.status = TaskStatus.CANCELLED
+                task.completed_at = datetime.now()
+
+                cursor = self._conn.execute(
+                    "UPDATE tasks SET status = ?, data = ? WHERE task_id = ? AND status IN (?, ?)",
+                    (task.status.value, task.model_dump_json(), task_id, *active)
+                )
+                self._conn.commit()
+                return cursor.rowcount > 0
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def claim_next(self, worker: str) -> Optional[Task]:
+        """
+        Atomically take the next pending task (highest priority, then oldest)
+
+        Args:
+            worker: Worker name recorded on the task
+
+        Returns:
+            The claimed task, already marked running, or None if the queue is empty
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    """
+                    SELECT data FROM tasks WHERE status = ?
+                    ORDER BY priority DESC, seq LIMIT 1
+                    """,
+                    (TaskStatus.PENDING.value,)
+                ).fetchone()
+                if not row:
+                    self._conn.commit()
+                    return None
+
+                task = Task.model_validate_json(row[0])
+                task.status = TaskStatus.RUNNING
+                task.started_at = datetime.now()
+                task.attempts += 1
+                task.progress = None
+
+                self._conn.execute(
+                    """
+                    UPDATE tasks SET status = ?, data = ?, progress = NULL, worker = ?, heartbeat_at = ?
+                    WHERE task_id = ?
+                    """,
+                    (task.status.value, task.model_dump_json(), worker, time.time(), task.task_id)
+                )
+                self._conn.commit()
+                return task
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def heartbeat(self, task_id: str, progress: Optional[TaskProgress] = None) -> Optional[TaskStatus]:
+        """
+        Record that a worker is still running a task (and its latest progress)
+
+        Returns:
+            Current stored status (CANCELLED tells the worker to stop)
+        """
+        with self._lock, self._conn:
+            if progress is not None:
+                self._conn.execute(
+                    "UPDATE tasks SET heartbeat_at = ?, progress = ? WHERE task_id = ?",
+                    (time.time(), progress.model_dump_json(), task_id)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE tasks SET heartbeat_at = ? WHERE task_id = ?",
+                    (time.time(), task_id)
+                )
+            row = self._conn.execute("SELECT status FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return TaskStatus(row[0]) if row else None
+
+    def requeue_stale(self, stale_after: float, max_attempts: int) -> List[str]:
+        """
+        Recover running tasks whose worker stopped sending heartbeats
+
+        Tasks with attempts left go back to pending, the others are failed.
+
+        Args:
+            stale_after: Seconds without heartbeat before a task is considered abandoned
+            max_attempts: Max runs per task
+
+        Returns:
+            IDs of recovered tasks
+        """
+        cutoff = time.time() - stale_after
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT data FROM tasks WHERE status = ? AND COALESCE(heartbeat_at, 0) < ?",
+                    (TaskStatus.RUNNING.value, cutoff)
+                ).fetchall()
+
+                for (data,) in rows:
+                    task = Task.model_validate_json(data)
+                    if task.attempts >= max_attempts:
+                        task.status = TaskStatus.FAILED
+                        task.error = f"Worker stopped responding after {task.attempts} attempt(s)"
+                        task.completed_at = datetime.now()
+                    else:
+                        task.status = TaskStatus.PENDING
+                        task.started_at = None
+                        task.progress = None
+
+                    self._conn.execute(
+                        "UPDATE tasks SET status = ?, data = ?, progress = NULL, worker = NULL WHERE task_id = ?",
+                        (task.status.value, task.model_dump_json(), task.task_id)
+                    )
+                self._conn.commit()
+                return [Task.model_validate_json(data).task_id for (data,) in rows]
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def release(self, task: Task):
+        """Put a task interrupted by a worker shutdown back in the queue"""
+        task.status = TaskStatus.PENDING
+        task.started_at = None
+        task.progress = None
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE tasks SET status = ?, data = ?, progress = NULL, worker = NULL
+                WHERE task_id = ? AND status = ?
+                """,
+                (task.status.value, task.model_dump_json(), task.task_id, TaskStatus.RUNNING.value)
+            )
+
+    def delete(self, task_ids: List[str]):
+        """Delete tasks by ID"""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM tasks WHERE task_id = ?", [(t,) for t in task_ids])
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _row_to_task(self, row) -> Task:
+        task = Task.model_validate_json(row[0])
+        if row[1]:
+            task.progress = TaskProgress.model_validate_json(row[1])
+        return task
@@ -24,6 +24,8 @@ class LLMConfig(BaseModel):
     api_key: str = Field(default="", description="LLM API Key")
     base_url: str = Field(default="", description="LLM API Base URL")
     model: str = Field(default="", description="LLM Model Name")
+    max_concurrency: int = Field(default=4, ge=1, le=32, description="Max concurrent LLM requests per provider")
+    requests_per_minute: int = Field(default=0, ge=0, description="Request rate limit per provider (0 = unlimited)")
 
 
 class TTSLocalConfig(BaseModel):
@@ -86,6 +88,44 @@ class TemplateConfig(BaseModel):
         default="1080x1920/default.html",
         description="Default frame template path"
     )
+    render_pool_size: int = Field(
+        default=2, ge=0, le=16,
+        description="Warm headless browser pages per template size (0 = launch a browser per frame)"
+    )
+
+
+class StageConcurrencyConfig(BaseModel):
+    """Worker count per frame production stage (pipelined frame processing)"""
+    tts_local: int = Field(default=3, ge=1, le=16, description="TTS workers for local Edge TTS")
+    tts_selfhost: int = Field(default=1, ge=1, le=16, description="TTS workers for selfhost ComfyUI workflows")
+    media_selfhost: int = Field(default=1, ge=1, le=16, description="Media workers for selfhost ComfyUI workflows")
+    compose: int = Field(default=2, ge=1, le=16, description="HTML frame composition workers")
+    encode: int = Field(default=2, ge=1, le=16, description="Video segment encode (ffmpeg) workers")
+    analysis: int = Field(default=2, ge=1, le=16, description="Asset analysis workers for selfhost ComfyUI workflows")
+
+
+class PipelineConfig(BaseModel):
+    """Frame production pipeline configuration"""
+    concurrency: StageConcurrencyConfig = Field(
+        default_factory=StageConcurrencyConfig,
+        description="Per-stage worker counts (RunningHub stages use runninghub_concurrent_limit)"
+    )
+    queue_size: int = Field(default=4, ge=1, le=64, description="Bounded queue size between stages")
+    ffmpeg_slots: int = Field(default=0, ge=0, le=64, description="Max concurrent ffmpeg processes (0 = number of CPU cores)")
+    download_concurrency: int = Field(default=4, ge=1, le=32, description="Max simultaneous media downloads")
+    download_retries: int = Field(default=3, ge=0, le=10, description="Retries (with resume) for interrupted downloads")
+    live_preview: bool = Field(default=False, description="Write an HLS playlist (output/{task_id}/preview/) that grows as frames finish (one extra remux per frame)")
+    live_preview_target_duration: int = Field(default=10, ge=2, le=60, description="Max preview chunk length in seconds (HLS target duration); longer frames are split at keyframes")
+
+
+class CacheConfig(BaseModel):
+    """On-disk caches for generated assets (stored under data/cache/)"""
+    tts_enabled: bool = Field(default=True, description="Reuse TTS audio for identical text and voice settings")
+    tts_max_size_mb: int = Field(default=512, ge=16, le=102400, description="Max TTS cache size in MB (LRU eviction)")
+    media_enabled: bool = Field(default=False, description="Reuse generated images/videos for identical prompt and workflow parameters")
+    media_max_size_mb: int = Field(default=4096, ge=16, le=1024000, description="Max media cache size in MB (LRU eviction)")
+    analysis_enabled: bool = Field(default=True, description="Reuse image/video analysis results for identical file content")
+    analysis_max_size_mb: int = Field(default=64, ge=1, le=10240, description="Max analysis cache size in MB (LRU eviction)")
 
 
 class PixelleVideoConfig(BaseModel):
@@ -94,6 +134,8 @@ class PixelleVideoConfig(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig)
     comfyui: ComfyUIConfig = Field(default_factory=ComfyUIConfig)
     template: TemplateConfig = Field(default_factory=TemplateConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     
     def is_llm_configured(self) -> bool:
         """Check if LLM is properly configured"""
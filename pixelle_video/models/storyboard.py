@@ -38,6 +38,8 @@ class StoryboardConfig:
     
     # Video parameters (fps only, size is determined by frame template)
     video_fps: int = 30                        # Frame rate
+    segment_encode_mode: str = "standard"      # Image segment encoder: "standard" or "still" (fast path for static frames)
+    render_mode: str = "segments"              # Final render: "segments" (per-frame MP4 + concat) or "timeline" (single ffmpeg pass)
     
     # Audio parameters
     tts_inference_mode: str = "local"          # TTS inference mode: "local" or "comfyui"
@@ -68,6 +70,8 @@ class StoryboardFrame:
     video_path: Optional[str] = None           # Original video path (for video type, before composition)
     composed_image_path: Optional[str] = None  # Composed image path (with subtitles, for image type)
     video_segment_path: Optional[str] = None   # Final video segment path
+    completed_stages: List[str] = field(default_factory=list)  # Finished frame stages (for resume)
+    fingerprints: Dict[str, str] = field(default_factory=dict)  # Stage → hash of the inputs its output was built from
     
     # Metadata
     duration: float = 0.0                      # Frame duration (seconds, from audio or video)
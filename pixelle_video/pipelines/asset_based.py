@@ -32,6 +32,7 @@ Example:
     )
 """
 
+import asyncio
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 
@@ -40,6 +41,12 @@ from pydantic import BaseModel, Field
 
 from pixelle_video.pipelines.linear import LinearVideoPipeline, PipelineContext
 from pixelle_video.models.progress import ProgressEvent
+from pixelle_video.models.storyboard import StoryboardFrame
+from pixelle_video.services.asset_cache import file_digest, get_analysis_cache, make_cache_key
+from pixelle_video.services.frame_scheduler import FrameScheduler
+from pixelle_video.services.media_info import probe_media
+from pixelle_video.services.video import VideoService
+from pixelle_video.utils.async_util import gather_limited
 from pixelle_video.utils.os_util import (
     create_task_output_dir,
     get_task_final_video_path
@@ -195,69 +202,41 @@ class AssetBasedPipeline(LinearVideoPipeline):
             extra_info="start"
         ))
         
-        self.asset_index = {}
+        # Analyze assets concurrently (each call is a full ComfyUI/RunningHub round trip);
+        # results are collected by position, so the index keeps the upload order
+        analysis_source = context.request.get("source", "runninghub")
+        completed = 0
         
-        for i, asset_path in enumerate(assets, 1):
+        async def analyze(asset_path: str) -> Optional[Dict[str, Any]]:
+            nonlocal completed
             asset_path_obj = Path(asset_path)
             
             if not asset_path_obj.exists():
                 logger.warning(f"Asset not found: {asset_path}")
-                continue
+                return None
             
-            logger.info(f"Analyzing asset {i}/{total_assets}: {asset_path_obj.name}")
+            entry = await self._analyze_asset(asset_path, analysis_source)
+            
+            completed += 1
+            logger.info(f"Analyzed asset {completed}/{total_assets}: {asset_path_obj.name}")
             
             # Emit progress for this asset
-            progress = 0.01 + (i - 1) / total_assets * 0.14  # 1% - 15%
             self._emit_progress(ProgressEvent(
                 event_type="analyzing_asset",
-                progress=progress,
-                frame_current=i,
+                progress=0.01 + completed / total_assets * 0.14,  # 1% - 15%
+                frame_current=completed,
                 frame_total=total_assets,
                 extra_info=asset_path_obj.name
             ))
-            
-            # Determine asset type
-            asset_type = self._get_asset_type(asset_path_obj)
-            
-            if asset_type == "image":
-                # Analyze image using ImageAnalysisService
-                analysis_source = context.request.get("source", "runninghub")
-                description = await self.core.image_analysis(asset_path, source=analysis_source)
-                
-                self.asset_index[asset_path] = {
-                    "path": asset_path,
-                    "type": "image",
-                    "name": asset_path_obj.name,
-                    "description": description
-                }
-                
-                logger.info(f"✅ Image analyzed: {description[:50]}...")
-            
-            elif asset_type == "video":
-                # Analyze video using VideoAnalysisService
-                analysis_source = context.request.get("source", "runninghub")
-                try:
-                    description = await self.core.video_analysis(asset_path, source=analysis_source)
-                    
-                    self.asset_index[asset_path] = {
-                        "path": asset_path,
-                        "type": "video",
-                        "name": asset_path_obj.name,
-                        "description": description
-                    }
-                    
-                    logger.info(f"✅ Video analyzed: {description[:50]}...")
-                except Exception as e:
-                    logger.warning(f"Video analysis failed for {asset_path_obj.name}: {e}, using fallback")
-                    self.asset_index[asset_path] = {
-                        "path": asset_path,
-                        "type": "video",
-                        "name": asset_path_obj.name,
-                        "description": "Video asset (analysis failed)"
-                    }
-            
-            else:
-                logger.warning(f"Unknown asset type: {asset_path}")
+            return entry
+        
+        entries = await gather_limited(assets, analyze, self._get_analysis_concurrency(analysis_source))
+        
+        self.asset_index = {
+            entry["path"]: entry
+            for entry in entries
+            if entry is not None
+        }
         
         logger.success(f"✅ Asset analysis complete: {len(self.asset_index)} assets indexed")
         
@@ -275,6 +254,68 @@ class AssetBasedPipeline(LinearVideoPipeline):
         
         return context
     
+    def _get_analysis_concurrency(self, source: str) -> int:
+        """Max concurrent asset analyses (RunningHub shares the account-wide limit)"""
+        from pixelle_video.config import config_manager
+        app_config = config_manager.config
+        
+        if source == "runninghub":
+            return app_config.comfyui.runninghub_concurrent_limit or 1
+        return app_config.pipeline.concurrency.analysis
+    
+    async def _analyze_asset(self, asset_path: str, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a single asset (image or video), using the analysis cache
+        
+        Args:
+            asset_path: Asset file path (as provided, used as asset index key)
+            source: Workflow source ("runninghub" or "selfhost")
+        
+        Returns:
+            Asset index entry, or None for unsupported file types
+        """
+        asset_path_obj = Path(asset_path)
+        asset_type = self._get_asset_type(asset_path_obj)
+        
+        if asset_type not in ("image", "video"):
+            logger.warning(f"Unknown asset type: {asset_path}")
+            return None
+        
+        entry = {
+            "path": asset_path,
+            "type": asset_type,
+            "name": asset_path_obj.name,
+        }
+        
+        # Cached by file content, so the same photo re-uploaded under another name is a hit
+        cache = get_analysis_cache()
+        cache_key = None
+        if cache is not None:
+            digest = await asyncio.to_thread(file_digest, asset_path)
+            cache_key = make_cache_key(kind=asset_type, content=digest, source=source)
+            description = await cache.get(cache_key)
+            if description is not None:
+                logger.info(f"♻️  Analysis cache hit: {asset_path_obj.name}")
+                return {**entry, "description": description}
+        
+        if asset_type == "image":
+            # Analyze image using ImageAnalysisService
+            description = await self.core.image_analysis(asset_path, source=source)
+            logger.info(f"✅ Image analyzed: {description[:50]}...")
+        else:
+            # Analyze video using VideoAnalysisService
+            try:
+                description = await self.core.video_analysis(asset_path, source=source)
+                logger.info(f"✅ Video analyzed: {description[:50]}...")
+            except Exception as e:
+                logger.warning(f"Video analysis failed for {asset_path_obj.name}: {e}, using fallback")
+                return {**entry, "description": "Video asset (analysis failed)"}
+        
+        if cache_key is not None:
+            await cache.put(cache_key, description, extra={"name": asset_path_obj.name})
+        
+        return {**entry, "description": description}
+    
     async def determine_title(self, context: PipelineContext) -> PipelineContext:
         """
         Use user-provided title if available, otherwise leave empty
@@ -533,7 +574,12 @@ class AssetBasedPipeline(LinearVideoPipeline):
     
     async def produce_assets(self, context: PipelineContext) -> PipelineContext:
         """
-        Generate scene videos using FrameProcessor (asset + multiple narrations + template)
+        Generate scene videos (asset + multiple narrations + template)
+        
+        1. Scene audio: all narrations of all scenes are synthesized concurrently
+           (bounded like the TTS stage), then joined per scene in one ffmpeg pass
+        2. Compose + encode: frames go through FrameScheduler with the usual
+           per-stage worker counts (audio and media are already in place)
         
         Args:
             context: Pipeline context
@@ -547,146 +593,45 @@ class AssetBasedPipeline(LinearVideoPipeline):
         config = context.config
         total_frames = len(storyboard.frames)
         
-        # Progress range: 30% - 85% for frame production
+        # Progress range: 30% - 85% for frame production (audio 30-55%, frames 55-85%)
         base_progress = 0.30
-        progress_range = 0.55  # 85% - 30%
+        audio_progress_range = 0.25
         
-        for i, frame in enumerate(storyboard.frames, 1):
-            logger.info(f"Producing scene {i}/{total_frames}...")
+        # Worker counts from config.yaml → pipeline.concurrency (RunningHub shares one limiter)
+        scheduler = FrameScheduler.from_config(self.core.frame_processor, config)
+        audio_stage = scheduler.stages[0]
+        tts_limiter = audio_stage.limiter or asyncio.Semaphore(audio_stage.workers)
+        logger.info(f"🚀 Parallel scene production: tts×{audio_stage.workers}, {scheduler.describe()}")
+        
+        completed = 0
+        
+        async def produce_scene_audio(frame: StoryboardFrame):
+            nonlocal completed
+            await self._produce_scene_audio(frame, context, tts_limiter)
             
-            # Emit progress for this frame (each frame has 4 steps: audio, combine, duration, compose)
-            frame_progress = base_progress + (i - 1) / total_frames * progress_range
+            completed += 1
             self._emit_progress(ProgressEvent(
                 event_type="frame_step",
-                progress=frame_progress,
-                frame_current=i,
+                progress=base_progress + completed / total_frames * audio_progress_range,
+                frame_current=frame.index + 1,
                 frame_total=total_frames,
                 step=1,
                 action="audio"
             ))
-            
-            # Get scene data with narrations
-            scene = frame._scene_data
-            narrations = scene.get("narrations", [scene.get("narration", "")])
-            if isinstance(narrations, str):
-                narrations = [narrations]
-            
-            logger.info(f"Scene {i} has {len(narrations)} narration(s)")
-            
-            # Step 1: Generate audio for each narration and combine
-            narration_audios = []
-            for j, narration_text in enumerate(narrations, 1):
-                audio_path = Path(context.task_dir) / "frames" / f"{i:02d}_narration_{j}.mp3"
-                audio_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                await self.core.tts(
-                    text=narration_text,
-                    output_path=str(audio_path),
-                    voice_id=config.voice_id,
-                    speed=config.tts_speed
-                )
-                
-                narration_audios.append(str(audio_path))
-                logger.debug(f"  Narration {j}/{len(narrations)}: {narration_text[:30]}...")
-            
-            # Concatenate all narration audios for this scene
-            if len(narration_audios) > 1:
-                from pixelle_video.utils.os_util import get_task_frame_path
-                
-                # Emit progress for combining audio
-                frame_progress = base_progress + ((i - 1) + 0.25) / total_frames * progress_range
-                self._emit_progress(ProgressEvent(
-                    event_type="frame_step",
-                    progress=frame_progress,
-                    frame_current=i,
-                    frame_total=total_frames,
-                    step=2,
-                    action="audio"
-                ))
-                
-                combined_audio_path = Path(context.task_dir) / "frames" / f"{i:02d}_audio.mp3"
-                
-                # Use FFmpeg to concatenate audio files
-                import subprocess
-                
-                # Create a file list for FFmpeg concat
-                filelist_path = Path(context.task_dir) / "frames" / f"{i:02d}_audiolist.txt"
-                with open(filelist_path, 'w') as f:
-                    for audio_file in narration_audios:
-                        escaped_path = str(Path(audio_file).absolute()).replace("'", "'\\''")
-                        f.write(f"file '{escaped_path}'\n")
-                
-                # Concatenate audio files
-                concat_cmd = [
-                    'ffmpeg',
-                    '-f', 'concat',
-                    '-safe', '0',
-                    '-i', str(filelist_path),
-                    '-c', 'copy',
-                    '-y',
-                    str(combined_audio_path)
-                ]
-                
-                subprocess.run(concat_cmd, check=True, capture_output=True)
-                frame.audio_path = str(combined_audio_path)
-                
-                logger.info(f"✅ Combined {len(narration_audios)} narrations into one audio")
-            else:
-                frame.audio_path = narration_audios[0]
-            
-            # Step 2: Use FrameProcessor to generate composed frame and video
-            # FrameProcessor will handle:
-            # - Template rendering (with proper dimensions)
-            # - Subtitle composition
-            # - Video segment creation
-            # - Proper file naming in frames/
-            
-            # Since we already have the audio and image, we bypass some steps
-            # by manually calling the composition steps
-            
-            # Emit progress for duration calculation
-            frame_progress = base_progress + ((i - 1) + 0.5) / total_frames * progress_range
-            self._emit_progress(ProgressEvent(
-                event_type="frame_step",
-                progress=frame_progress,
-                frame_current=i,
-                frame_total=total_frames,
-                step=3,
-                action="compose"
-            ))
-            
-            # Get audio duration for frame duration
-            import subprocess
-            duration_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                frame.audio_path
-            ]
-            duration_result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-            frame.duration = float(duration_result.stdout.strip())
-            
-            # Emit progress for video composition
-            frame_progress = base_progress + ((i - 1) + 0.75) / total_frames * progress_range
-            self._emit_progress(ProgressEvent(
-                event_type="frame_step",
-                progress=frame_progress,
-                frame_current=i,
-                frame_total=total_frames,
-                step=4,
-                action="video"
-            ))
-            
-            # Use FrameProcessor for proper composition
-            processed_frame = await self.core.frame_processor(
-                frame=frame,
-                storyboard=storyboard,
-                config=config,
-                total_frames=total_frames
-            )
-            
-            logger.success(f"✅ Scene {i} complete")
+        
+        # TTS concurrency is bounded by tts_limiter inside each scene
+        await gather_limited(storyboard.frames, produce_scene_audio)
+        
+        logger.info(f"✅ Scene audio ready for {total_frames} scenes")
+        
+        # Compose and encode scenes concurrently
+        await scheduler.run(
+            storyboard,
+            config,
+            progress_callback=self._progress_callback,
+            base_progress=base_progress + audio_progress_range,
+            progress_range=0.30
+        )
         
         # Emit completion of frame production
         self._emit_progress(ProgressEvent(
@@ -698,6 +643,58 @@ class AssetBasedPipeline(LinearVideoPipeline):
         
         return context
     
+    async def _produce_scene_audio(
+        self,
+        frame: StoryboardFrame,
+        context: PipelineContext,
+        tts_limiter: asyncio.Semaphore
+    ):
+        """
+        Synthesize all narrations of a scene concurrently and join them
+        
+        Sets frame.audio_path and frame.duration.
+        """
+        config = context.config
+        scene_number = frame.index + 1
+        
+        # Get scene data with narrations
+        scene = frame._scene_data
+        narrations = scene.get("narrations", [scene.get("narration", "")])
+        if isinstance(narrations, str):
+            narrations = [narrations]
+        
+        logger.info(f"Scene {scene_number} has {len(narrations)} narration(s)")
+        
+        frames_dir = Path(context.task_dir) / "frames"
+        frames_dir.mkdir(parents=True, exist_ok=True)
+        
+        async def synthesize(j: int, narration_text: str) -> str:
+            audio_path = frames_dir / f"{scene_number:02d}_narration_{j}.mp3"
+            async with tts_limiter:
+                await self.core.tts(
+                    text=narration_text,
+                    output_path=str(audio_path),
+                    voice_id=config.voice_id,
+                    speed=config.tts_speed
+                )
+            logger.debug(f"  Scene {scene_number} narration {j}/{len(narrations)}: {narration_text[:30]}...")
+            return str(audio_path)
+        
+        # gather keeps narration order
+        narration_audios = await asyncio.gather(
+            *(synthesize(j, text) for j, text in enumerate(narrations, 1))
+        )
+        
+        if len(narration_audios) > 1:
+            combined_audio_path = frames_dir / f"{scene_number:02d}_audio.mp3"
+            frame.audio_path = await VideoService().concat_audios(narration_audios, str(combined_audio_path))
+            logger.info(f"✅ Scene {scene_number}: combined {len(narration_audios)} narrations into one audio")
+        else:
+            frame.audio_path = narration_audios[0]
+        
+        # Audio duration drives the frame duration (cached probe, shared with FrameProcessor/VideoService)
+        frame.duration = (await asyncio.to_thread(probe_media, frame.audio_path)).duration
+    
     async def post_production(self, context: PipelineContext) -> PipelineContext:
         """
         Concatenate scene videos and add BGM
@@ -731,16 +728,18 @@ class AssetBasedPipeline(LinearVideoPipeline):
         bgm_path = context.request.get("bgm_path")
         bgm_volume = context.request.get("bgm_volume", 0.2)
         bgm_mode = context.request.get("bgm_mode", "loop")
+        bgm_ducking = context.request.get("bgm_ducking", False)
         
         if bgm_path:
             logger.info(f"🎵 Adding BGM: {bgm_path} (volume={bgm_volume}, mode={bgm_mode})")
         
-        self.core.video.concat_videos(
+        await self.core.video.concat_videos(
             videos=scene_videos,
             output=str(final_video_path),
             bgm_path=bgm_path,
             bgm_volume=bgm_volume,
-            bgm_mode=bgm_mode
+            bgm_mode=bgm_mode,
+            bgm_ducking=bgm_ducking
         )
         
         context.final_video_path = str(final_video_path)
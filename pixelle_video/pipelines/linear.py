@@ -16,10 +16,15 @@ Linear Video Pipeline Base Class
 This module defines the template method pattern for linear video generation workflows.
 It introduces `PipelineContext` for state management and `LinearVideoPipeline` for
 process orchestration.
+
+Each completed lifecycle step is checkpointed to the task directory, so a failed
+run can be continued with `resume()` instead of starting over.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Callable
+import asyncio
+import time
+from dataclasses import dataclass, field, fields as dataclass_fields
+from typing import Optional, List, Dict, Any, Awaitable, Callable
 from loguru import logger
 
 from pixelle_video.pipelines.base import BasePipeline
@@ -31,6 +36,60 @@ from pixelle_video.models.storyboard import (
 from pixelle_video.models.progress import ProgressEvent
 
 
+# Min seconds between two checkpoint writes while frames are produced
+CHECKPOINT_INTERVAL = 2.0
+
+
+class CoalescedCheckpoint:
+    """
+    Coalesce frequent checkpoint requests into at most one write per interval
+    
+    Frame stages finish many times per second on short frames; each request
+    only marks the checkpoint dirty, and a background task writes the latest
+    state once the interval has passed. flush() writes what is pending
+    without waiting and must be awaited before the next direct save.
+    
+    Usage:
+        >>> checkpoint = CoalescedCheckpoint(lambda: self.save_checkpoint(ctx))
+        >>> await checkpoint.request()  # After each frame stage
+        >>> await checkpoint.flush()    # When frame production ends
+    """
+    
+    def __init__(self, save: Callable[[], Awaitable[None]], interval: float = CHECKPOINT_INTERVAL):
+        self._save = save
+        self._interval = interval
+        self._dirty = False
+        self._flushing = False
+        self._last_write = 0.0
+        self._wake = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+    
+    async def request(self):
+        """Mark the checkpoint dirty (returns immediately)"""
+        self._dirty = True
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_loop())
+    
+    async def flush(self):
+        """Write pending changes now and stop the background writer"""
+        self._flushing = True
+        self._wake.set()
+        if self._writer is not None:
+            await self._writer
+    
+    async def _write_loop(self):
+        while self._dirty:
+            delay = self._last_write + self._interval - time.monotonic()
+            if delay > 0 and not self._flushing:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            self._dirty = False
+            self._last_write = time.monotonic()
+            await self._save()
+
+
 @dataclass
 class PipelineContext:
     """
@@ -46,6 +105,7 @@ class PipelineContext:
     # === Task State ===
     task_id: Optional[str] = None
     task_dir: Optional[str] = None
+    completed_steps: List[str] = field(default_factory=list)
     
     # === Content ===
     title: Optional[str] = None
@@ -60,6 +120,7 @@ class PipelineContext:
     
     # === Output ===
     final_video_path: Optional[str] = None
+    live_preview: Optional[Any] = None  # LivePreview, when pipeline.live_preview is enabled
     result: Optional[VideoGenerationResult] = None
 
 
@@ -79,8 +140,23 @@ class LinearVideoPipeline(BasePipeline):
     
     Subclasses should override specific steps to customize behavior while maintaining
     the overall workflow structure.
+    
+    Steps 1-7 are checkpointed (checkpoint.json + storyboard.json in the task dir)
+    as they complete; `resume()` skips them and continues from there. Finalize
+    always runs.
     """
     
+    # Checkpointed lifecycle steps, in execution order
+    LIFECYCLE_STEPS = (
+        "setup_environment",
+        "generate_content",
+        "determine_title",
+        "plan_visuals",
+        "initialize_storyboard",
+        "produce_assets",
+        "post_production",
+    )
+    
     async def __call__(
         self,
         text: str,
@@ -97,30 +173,170 @@ class LinearVideoPipeline(BasePipeline):
             progress_callback=progress_callback
         )
         
+        return await self._run(ctx)
+    
+    async def resume(
+        self,
+        checkpoint: Dict[str, Any],
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None
+    ) -> VideoGenerationResult:
+        """
+        Continue a previous run from its checkpoint
+        
+        Args:
+            checkpoint: Checkpoint dict (PersistenceService.load_checkpoint)
+            progress_callback: Optional callback for progress updates
+        
+        Returns:
+            VideoGenerationResult
+        """
+        ctx = await self._context_from_checkpoint(checkpoint, progress_callback)
+        
+        logger.info(f"🔁 Resuming task {ctx.task_id} (completed: {', '.join(ctx.completed_steps) or 'none'})")
+        return await self._run(ctx)
+    
+    async def rerender(
+        self,
+        checkpoint: Dict[str, Any],
+        frame_updates: Optional[Dict[int, Dict[str, Any]]] = None,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        **overrides
+    ) -> VideoGenerationResult:
+        """
+        Re-render a finished (or failed) video after edits
+        
+        Frame production runs again, but every frame stage whose input
+        fingerprint is unchanged is skipped; concat and BGM always run.
+        Editing one narration costs one TTS call, one compose and one encode.
+        
+        Args:
+            checkpoint: Checkpoint dict (PersistenceService.load_checkpoint)
+            frame_updates: Per-frame edits, {frame_index: {"narration": ..., "image_prompt": ...}}
+            progress_callback: Optional callback for progress updates
+            **overrides: "title", StoryboardConfig fields (voice_id, frame_template,
+                template_params, ...) or post-production params (bgm_path, bgm_volume, ...)
+        
+        Returns:
+            VideoGenerationResult
+        
+        Raises:
+            ValueError: The task has no storyboard yet, or an edit is invalid
+        """
+        ctx = await self._context_from_checkpoint(checkpoint, progress_callback)
+        if ctx.storyboard is None:
+            raise ValueError(f"Task {ctx.task_id} has no storyboard to re-render, resume it instead")
+        
+        config_fields = {f.name for f in dataclass_fields(StoryboardConfig)} - {"task_id", "n_storyboard"}
+        
+        for index, updates in (frame_updates or {}).items():
+            if not 0 <= index < len(ctx.storyboard.frames):
+                raise ValueError(f"Frame index out of range: {index}")
+            frame = ctx.storyboard.frames[index]
+            for key, value in updates.items():
+                if key == "narration":
+                    frame.narration = value
+                    ctx.narrations[index] = value
+                elif key == "image_prompt":
+                    frame.image_prompt = value
+                    ctx.image_prompts[index] = value
+                else:
+                    raise ValueError(f"Unsupported frame update: {key}")
+        
+        for key, value in overrides.items():
+            if key == "title":
+                ctx.title = value
+                ctx.storyboard.title = value
+            elif key in config_fields:
+                setattr(ctx.config, key, value)
+            ctx.params[key] = value
+        
+        ctx.completed_steps = [
+            step for step in ctx.completed_steps
+            if step not in ("produce_assets", "post_production")
+        ]
+        
+        logger.info(f"✏️ Re-rendering task {ctx.task_id} ({len(frame_updates or {})} frame edits, overrides: {list(overrides)})")
+        return await self._run(ctx)
+    
+    async def _context_from_checkpoint(
+        self,
+        checkpoint: Dict[str, Any],
+        progress_callback: Optional[Callable[[ProgressEvent], None]]
+    ) -> PipelineContext:
+        """Rebuild the pipeline context (and storyboard, if created) from a checkpoint."""
+        ctx = PipelineContext(
+            input_text=checkpoint["input_text"],
+            params=checkpoint.get("params", {}),
+            progress_callback=progress_callback,
+            task_id=checkpoint["task_id"],
+            task_dir=checkpoint.get("task_dir"),
+            completed_steps=list(checkpoint.get("completed_steps", [])),
+            title=checkpoint.get("title"),
+            narrations=checkpoint.get("narrations", []),
+            image_prompts=checkpoint.get("image_prompts", []),
+            final_video_path=checkpoint.get("final_video_path"),
+        )
+        
+        if "initialize_storyboard" in ctx.completed_steps:
+            ctx.storyboard = await self.core.persistence.load_storyboard(ctx.task_id)
+            if ctx.storyboard is None:
+                # Storyboard lost: rebuild it (and produce frames again)
+                ctx.completed_steps = [
+                    step for step in ctx.completed_steps
+                    if self.LIFECYCLE_STEPS.index(step) < self.LIFECYCLE_STEPS.index("initialize_storyboard")
+                ]
+            else:
+                ctx.config = ctx.storyboard.config
+        
+        return ctx
+    
+    async def _run(self, ctx: PipelineContext) -> VideoGenerationResult:
+        """Run the lifecycle steps not yet completed, checkpointing after each one."""
         try:
-            # === Phase 1: Preparation ===
-            await self.setup_environment(ctx)
-            
-            # === Phase 2: Content Creation ===
-            await self.generate_content(ctx)
-            await self.determine_title(ctx)
-            
-            # === Phase 3: Visual Planning ===
-            await self.plan_visuals(ctx)
-            await self.initialize_storyboard(ctx)
-            
-            # === Phase 4: Asset Production ===
-            await self.produce_assets(ctx)
-            
-            # === Phase 5: Post Production ===
-            await self.post_production(ctx)
+            for step in self.LIFECYCLE_STEPS:
+                if step in ctx.completed_steps:
+                    logger.debug(f"Skipping completed step: {step}")
+                    continue
+                
+                await getattr(self, step)(ctx)
+                
+                ctx.completed_steps.append(step)
+                await self.save_checkpoint(ctx)
             
-            # === Phase 6: Finalization ===
             return await self.finalize(ctx)
             
         except Exception as e:
+            await self.save_checkpoint(ctx)
             await self.handle_exception(ctx, e)
             raise
+    
+    async def save_checkpoint(self, ctx: PipelineContext):
+        """
+        Persist pipeline progress (checkpoint.json and storyboard.json)
+        
+        Failures are logged, not raised: checkpointing must not break generation.
+        """
+        if not ctx.task_id:
+            return  # Task directory not created yet
+        
+        persistence = self.core.persistence
+        try:
+            await persistence.save_checkpoint(ctx.task_id, {
+                "pipeline": type(self).__name__,
+                "task_id": ctx.task_id,
+                "task_dir": ctx.task_dir,
+                "input_text": ctx.input_text,
+                "params": ctx.params,
+                "completed_steps": ctx.completed_steps,
+                "title": ctx.title,
+                "narrations": ctx.narrations,
+                "image_prompts": ctx.image_prompts,
+                "final_video_path": ctx.final_video_path,
+            })
+            if ctx.storyboard is not None:
+                await persistence.save_storyboard(ctx.task_id, ctx.storyboard)
+        except Exception as e:
+            logger.warning(f"Failed to save checkpoint for task {ctx.task_id}: {e}")
 
     # ==================== Lifecycle Methods ====================
     
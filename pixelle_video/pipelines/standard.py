@@ -21,12 +21,11 @@ Refactored to use LinearVideoPipeline (Template Method Pattern).
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, Literal, List
-import asyncio
 import shutil
 
 from loguru import logger
 
-from pixelle_video.pipelines.linear import LinearVideoPipeline, PipelineContext
+from pixelle_video.pipelines.linear import CoalescedCheckpoint, LinearVideoPipeline, PipelineContext
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import (
     Storyboard,
@@ -43,11 +42,14 @@ from pixelle_video.utils.content_generators import (
 )
 from pixelle_video.utils.os_util import (
     create_task_output_dir,
-    get_task_final_video_path
+    get_task_final_video_path,
+    get_task_frame_path
 )
 from pixelle_video.utils.template_util import get_template_type
 from pixelle_video.utils.prompt_helper import build_image_prompt
 from pixelle_video.services.video import VideoService
+from pixelle_video.services.frame_scheduler import FrameScheduler
+from pixelle_video.services.live_preview import LivePreview
 
 
 
@@ -83,8 +85,8 @@ class StandardPipeline(LinearVideoPipeline):
         logger.info(f"🚀 Starting StandardPipeline in '{mode}' mode")
         logger.info(f"   Text length: {len(text)} chars")
         
-        # Create isolated task directory
-        task_dir, task_id = create_task_output_dir()
+        # Create isolated task directory (task_id may be pre-assigned by the caller, e.g. the API)
+        task_dir, task_id = create_task_output_dir(ctx.params.get("task_id"))
         ctx.task_id = task_id
         ctx.task_dir = task_dir
         
@@ -260,6 +262,8 @@ class StandardPipeline(LinearVideoPipeline):
             min_image_prompt_words=ctx.params.get("min_image_prompt_words", 30),
             max_image_prompt_words=ctx.params.get("max_image_prompt_words", 60),
             video_fps=ctx.params.get("video_fps", 30),
+            segment_encode_mode=ctx.params.get("segment_encode_mode", "standard"),
+            render_mode=ctx.params.get("render_mode", "segments"),
             tts_inference_mode=tts_inference_mode or "local",
             voice_id=final_voice_id,
             tts_workflow=final_tts_workflow,
@@ -295,132 +299,96 @@ class StandardPipeline(LinearVideoPipeline):
         storyboard = ctx.storyboard
         config = ctx.config
         
-        # Check if using RunningHub workflows for parallel processing
-        is_runninghub = (
-            (config.tts_workflow and config.tts_workflow.startswith("runninghub/")) or
-            (config.media_workflow and config.media_workflow.startswith("runninghub/"))
-        )
+        # Pipelined production: TTS, media, compose and encode run as independent stages
+        # with their own worker counts (config.yaml → pipeline.concurrency, read per run
+        # so hot reload applies without restart)
+        scheduler = FrameScheduler.from_config(self.core.frame_processor, config)
+        logger.info(f"🚀 Pipelined frame production: {scheduler.describe()}")
         
-        # Get concurrent limit from config_manager (supports hot reload without restart)
+        # Progressive HLS preview: each frame's segment is published as soon as it's encoded
         from pixelle_video.config import config_manager
-        runninghub_concurrent_limit = config_manager.config.comfyui.runninghub_concurrent_limit or 1
+        if config_manager.config.pipeline.live_preview:
+            ctx.live_preview = LivePreview(
+                config.task_id,
+                [frame.index for frame in storyboard.frames],
+                target_duration=config_manager.config.pipeline.live_preview_target_duration
+            )
+            logger.info(f"📺 Live preview: {ctx.live_preview.playlist_path}")
         
-        if is_runninghub and runninghub_concurrent_limit > 1:
-            logger.info(f"🚀 Using parallel processing for RunningHub workflows (max {runninghub_concurrent_limit} concurrent)")
-            
-            semaphore = asyncio.Semaphore(runninghub_concurrent_limit)
-            completed_count = 0
-            
-            async def process_frame_with_semaphore(i: int, frame: StoryboardFrame):
-                nonlocal completed_count
-                async with semaphore:
-                    base_progress = 0.2
-                    frame_range = 0.6
-                    per_frame_progress = frame_range / len(storyboard.frames)
-                    
-                    # Create frame-specific progress callback
-                    def frame_progress_callback(event: ProgressEvent):
-                        overall_progress = base_progress + (per_frame_progress * completed_count) + (per_frame_progress * event.progress)
-                        if ctx.progress_callback:
-                            adjusted_event = ProgressEvent(
-                                event_type=event.event_type,
-                                progress=overall_progress,
-                                frame_current=i+1,
-                                frame_total=len(storyboard.frames),
-                                step=event.step,
-                                action=event.action
-                            )
-                            ctx.progress_callback(adjusted_event)
-                    
-                    # Report frame start
-                    self._report_progress(
-                        ctx.progress_callback,
-                        "processing_frame",
-                        base_progress + (per_frame_progress * completed_count),
-                        frame_current=i+1,
-                        frame_total=len(storyboard.frames)
-                    )
-                    
-                    processed_frame = await self.core.frame_processor(
-                        frame=frame,
-                        storyboard=storyboard,
-                        config=config,
-                        total_frames=len(storyboard.frames),
-                        progress_callback=frame_progress_callback
-                    )
-                    
-                    completed_count += 1
-                    logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s) [{completed_count}/{len(storyboard.frames)}]")
-                    return i, processed_frame
-            
-            # Create all tasks and execute in parallel
-            tasks = [process_frame_with_semaphore(i, frame) for i, frame in enumerate(storyboard.frames)]
-            results = await asyncio.gather(*tasks)
-            
-            # Update frames in order and calculate total duration
-            for idx, processed_frame in sorted(results, key=lambda x: x[0]):
-                storyboard.frames[idx] = processed_frame
-                storyboard.total_duration += processed_frame.duration
-            
-            logger.info(f"✅ All frames processed in parallel (total duration: {storyboard.total_duration:.2f}s)")
-        else:
-            # Serial processing for non-RunningHub workflows
-            logger.info("⚙️ Using serial processing (non-RunningHub workflow)")
-            
-            for i, frame in enumerate(storyboard.frames):
-                base_progress = 0.2
-                frame_range = 0.6
-                per_frame_progress = frame_range / len(storyboard.frames)
-                
-                # Create frame-specific progress callback
-                def frame_progress_callback(event: ProgressEvent):
-                    overall_progress = base_progress + (per_frame_progress * i) + (per_frame_progress * event.progress)
-                    if ctx.progress_callback:
-                        adjusted_event = ProgressEvent(
-                            event_type=event.event_type,
-                            progress=overall_progress,
-                            frame_current=event.frame_current,
-                            frame_total=event.frame_total,
-                            step=event.step,
-                            action=event.action
-                        )
-                        ctx.progress_callback(adjusted_event)
-                
-                # Report frame start
-                self._report_progress(
-                    ctx.progress_callback,
-                    "processing_frame",
-                    base_progress + (per_frame_progress * i),
-                    frame_current=i+1,
-                    frame_total=len(storyboard.frames)
-                )
-                
-                processed_frame = await self.core.frame_processor(
-                    frame=frame,
-                    storyboard=storyboard,
-                    config=config,
-                    total_frames=len(storyboard.frames),
-                    progress_callback=frame_progress_callback
-                )
-                storyboard.total_duration += processed_frame.duration
-                logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s)")
+        # Checkpoint as frame stages finish, so a resume only redoes unfinished work
+        # (coalesced: at most one checkpoint write every few seconds)
+        checkpoint = CoalescedCheckpoint(lambda: self.save_checkpoint(ctx))
+        try:
+            await scheduler.run(
+                storyboard,
+                config,
+                progress_callback=ctx.progress_callback,
+                base_progress=0.2,
+                progress_range=0.6,
+                on_stage_complete=lambda frame, stage: checkpoint.request(),
+                on_frame_complete=ctx.live_preview.add_frame if ctx.live_preview else None
+            )
+        finally:
+            await checkpoint.flush()
+        
+        storyboard.total_duration = sum(frame.duration for frame in storyboard.frames)
+        logger.info(f"✅ All frames processed (total duration: {storyboard.total_duration:.2f}s)")
 
     async def post_production(self, ctx: PipelineContext):
-        """Step 7: Concatenate videos and add BGM."""
+        """Step 7: Concatenate videos and mix BGM (one ffmpeg pass)."""
         self._report_progress(ctx.progress_callback, "concatenating", 0.85)
         
         storyboard = ctx.storyboard
-        segment_paths = [frame.video_segment_path for frame in storyboard.frames]
-        
+        config = ctx.config
         video_service = VideoService()
         
-        final_video_path = video_service.concat_videos(
-            videos=segment_paths,
-            output=ctx.final_video_path,
-            bgm_path=ctx.params.get("bgm_path"),
-            bgm_volume=ctx.params.get("bgm_volume", 0.2),
-            bgm_mode=ctx.params.get("bgm_mode", "loop")
-        )
+        # Frames deferred by the video stage (render_mode="timeline")
+        pending_frames = [frame for frame in storyboard.frames if not frame.video_segment_path]
+        
+        if pending_frames and len(pending_frames) == len(storyboard.frames):
+            # All frames are images: render the whole video (and BGM) in one ffmpeg pass
+            final_video_path = await video_service.render_timeline(
+                images=[frame.composed_image_path for frame in storyboard.frames],
+                audios=[frame.audio_path for frame in storyboard.frames],
+                output=ctx.final_video_path,
+                durations=[frame.duration for frame in storyboard.frames],
+                fps=config.video_fps,
+                encode_mode=config.segment_encode_mode,
+                bgm_path=ctx.params.get("bgm_path"),
+                bgm_volume=ctx.params.get("bgm_volume", 0.2),
+                bgm_mode=ctx.params.get("bgm_mode", "loop"),
+                bgm_fade_in=ctx.params.get("bgm_fade_in", 0.0),
+                bgm_fade_out=ctx.params.get("bgm_fade_out", 0.0),
+                bgm_ducking=ctx.params.get("bgm_ducking", False),
+                progress_callback=lambda fraction: self._report_progress(
+                    ctx.progress_callback, "concatenating", 0.85 + 0.1 * fraction
+                )
+            )
+        else:
+            # Mixed image/video frames: encode deferred frames as segments, then concat
+            for frame in pending_frames:
+                frame.video_segment_path = await video_service.create_video_from_image(
+                    image=frame.composed_image_path,
+                    audio=frame.audio_path,
+                    output=get_task_frame_path(config.task_id, frame.index, "segment"),
+                    fps=config.video_fps,
+                    encode_mode=config.segment_encode_mode
+                )
+                if ctx.live_preview:
+                    await ctx.live_preview.add_frame(frame)
+            
+            segment_paths = [frame.video_segment_path for frame in storyboard.frames]
+            
+            final_video_path = await video_service.concat_videos(
+                videos=segment_paths,
+                output=ctx.final_video_path,
+                bgm_path=ctx.params.get("bgm_path"),
+                bgm_volume=ctx.params.get("bgm_volume", 0.2),
+                bgm_mode=ctx.params.get("bgm_mode", "loop"),
+                bgm_fade_in=ctx.params.get("bgm_fade_in", 0.0),
+                bgm_fade_out=ctx.params.get("bgm_fade_out", 0.0),
+                bgm_ducking=ctx.params.get("bgm_ducking", False)
+            )
         
         storyboard.final_video_path = final_video_path
         storyboard.completed_at = datetime.now()
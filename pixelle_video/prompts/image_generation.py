@@ -97,8 +97,8 @@ Strictly output in the following JSON format, **image prompts must be in English
 ```json
 {{
   "image_prompts": [
-    "[detailed English image prompt following the style requirements]",
-    "[detailed English image prompt following the style requirements]"
+    {{"index": 0, "prompt": "[detailed English image prompt following the style requirements]"}},
+    {{"index": 1, "prompt": "[detailed English image prompt following the style requirements]"}}
   ]
 }}
 ```
@@ -106,8 +106,8 @@ Strictly output in the following JSON format, **image prompts must be in English
 # Important Reminders
 1. Only output JSON format content, do not add any explanations
 2. Ensure JSON format is strictly correct and can be directly parsed by the program
-3. Input is {{"narrations": [narration array]}} format, output is {{"image_prompts": [image prompt array]}} format
-4. **The output image_prompts array must contain exactly {narrations_count} elements, corresponding one-to-one with the input narrations array**
+3. Input is {{"narrations": [{{"index": ..., "narration": ...}}]}} format, output is {{"image_prompts": [{{"index": ..., "prompt": ...}}]}} format
+4. **The output image_prompts array must contain exactly {narrations_count} elements, one per input narration, each with the "index" of the narration it belongs to**
 5. **Image prompts must use English** (for AI image generation models)
 6. Image prompts must accurately reflect the specific content and emotion of the corresponding narration
 7. Each image must be creative and visually impactful, avoid being monotonous
@@ -120,7 +120,8 @@ Now, please create {narrations_count} corresponding **English** image prompts fo
 def build_image_prompt_prompt(
     narrations: List[str],
     min_words: int,
-    max_words: int
+    max_words: int,
+    indices: Optional[List[int]] = None
 ) -> str:
     """
     Build image prompt generation prompt
@@ -131,6 +132,8 @@ def build_image_prompt_prompt(
         narrations: List of narrations
         min_words: Minimum word count
         max_words: Maximum word count
+        indices: Index of each narration, echoed back with its prompt
+                 (default: 0..len(narrations)-1)
     
     Returns:
         Formatted prompt for LLM
@@ -138,8 +141,14 @@ def build_image_prompt_prompt(
     Example:
         >>> build_image_prompt_prompt(narrations, 50, 100)
     """
+    if indices is None:
+        indices = list(range(len(narrations)))
+    
     narrations_json = json.dumps(
-        {"narrations": narrations},
+        {"narrations": [
+            {"index": index, "narration": narration}
+            for index, narration in zip(indices, narrations)
+        ]},
         ensure_ascii=False,
         indent=2
     )
@@ -17,7 +17,7 @@ For generating video prompts from narrations.
 """
 
 import json
-from typing import List
+from typing import List, Optional
 
 
 VIDEO_PROMPT_GENERATION_PROMPT = """# Role Definition
@@ -78,8 +78,8 @@ Strictly output in the following JSON format, **video prompts must be in English
 ```json
 {{
   "video_prompts": [
-    "[detailed English video prompt with dynamic elements and camera movements]",
-    "[detailed English video prompt with dynamic elements and camera movements]"
+    {{"index": 0, "prompt": "[detailed English video prompt with dynamic elements and camera movements]"}},
+    {{"index": 1, "prompt": "[detailed English video prompt with dynamic elements and camera movements]"}}
   ]
 }}
 ```
@@ -87,8 +87,8 @@ Strictly output in the following JSON format, **video prompts must be in English
 # Important Reminders
 1. Only output JSON format content, do not add any explanations
 2. Ensure JSON format is strictly correct and can be directly parsed by the program
-3. Input is {{"narrations": [narration array]}} format, output is {{"video_prompts": [video prompt array]}} format
-4. **The output video_prompts array must contain exactly {narrations_count} elements, corresponding one-to-one with the input narrations array**
+3. Input is {{"narrations": [{{"index": ..., "narration": ...}}]}} format, output is {{"video_prompts": [{{"index": ..., "prompt": ...}}]}} format
+4. **The output video_prompts array must contain exactly {narrations_count} elements, one per input narration, each with the "index" of the narration it belongs to**
 5. **Video prompts must use English** (for AI video generation models)
 6. Video prompts must accurately reflect the specific content and emotion of the corresponding narration
 7. Each video must emphasize dynamics and sense of movement, avoid static descriptions
@@ -102,7 +102,8 @@ Now, please create {narrations_count} corresponding **English** video prompts fo
 def build_video_prompt_prompt(
     narrations: List[str],
     min_words: int,
-    max_words: int
+    max_words: int,
+    indices: Optional[List[int]] = None
 ) -> str:
     """
     Build video prompt generation prompt
@@ -111,6 +112,8 @@ def build_video_prompt_prompt(
         narrations: List of narrations
         min_words: Minimum word count
         max_words: Maximum word count
+        indices: Index of each narration, echoed back with its prompt
+                 (default: 0..len(narrations)-1)
     
     Returns:
         Formatted prompt for LLM
@@ -118,8 +121,14 @@ def build_video_prompt_prompt(
     Example:
         >>> build_video_prompt_prompt(narrations, 50, 100)
     """
+    if indices is None:
+        indices = list(range(len(narrations)))
+    
     narrations_json = json.dumps(
-        {"narrations": narrations},
+        {"narrations": [
+            {"index": index, "narration": narration}
+            for index, narration in zip(indices, narrations)
+        ]},
         ensure_ascii=False,
         indent=2
     )
@@ -18,21 +18,26 @@ Provides unified access to all capabilities (LLM, TTS, Image, etc.)
 
 import hashlib
 import json
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from loguru import logger
 from comfykit import ComfyKit
 
 from pixelle_video.config import config_manager
+from pixelle_video.models.progress import ProgressEvent
+from pixelle_video.models.storyboard import VideoGenerationResult
 from pixelle_video.services.llm_service import LLMService
 from pixelle_video.services.tts_service import TTSService
 from pixelle_video.services.media import MediaService
 from pixelle_video.services.image_analysis import ImageAnalysisService
 from pixelle_video.services.video_analysis import VideoAnalysisService
 from pixelle_video.services.video import VideoService
+from pixelle_video.services.browser_pool import release_render_pool
+from pixelle_video.services.downloader import close_downloader
 from pixelle_video.services.frame_processor import FrameProcessor
 from pixelle_video.services.persistence import PersistenceService
 from pixelle_video.services.history_manager import HistoryManager
+from pixelle_video.pipelines.linear import LinearVideoPipeline
 from pixelle_video.pipelines.standard import StandardPipeline
 from pixelle_video.pipelines.custom import CustomPipeline
 from pixelle_video.pipelines.asset_based import AssetBasedPipeline
@@ -203,7 +208,7 @@ class PixelleVideoCore:
         self.video = VideoService()
         self.frame_processor = FrameProcessor(self)
         self.persistence = PersistenceService(output_dir="output")
-        self.history = HistoryManager(self.persistence)
+        self.history = HistoryManager(self.persistence, core=self)
         
         # 2. Register video generation pipelines
         self.pipelines = {
@@ -221,7 +226,7 @@ class PixelleVideoCore:
     
     async def cleanup(self):
         """
-        Cleanup resources (close ComfyKit session)
+        Cleanup resources (close ComfyKit session, browser render pool, LLM and download clients)
         
         Example:
             await pixelle_video.cleanup()
@@ -236,6 +241,26 @@ class PixelleVideoCore:
             finally:
                 self._comfykit = None
                 self._comfykit_config_hash = None
+        
+        # Release this loop's warm browser pages (the browser is shared by the
+        # whole process and shut down at exit, other sessions may be rendering)
+        try:
+            await release_render_pool()
+        except Exception as e:
+            logger.error(f"Failed to close render pool: {e}")
+        
+        # Close pooled LLM connections
+        if self.llm is not None:
+            try:
+                await self.llm.close()
+            except Exception as e:
+                logger.error(f"Failed to close LLM clients: {e}")
+        
+        # Close pooled download connections
+        try:
+            await close_downloader()
+        except Exception as e:
+            logger.error(f"Failed to close downloader: {e}")
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -294,6 +319,92 @@ class PixelleVideoCore:
         
         return generate_video_wrapper
     
+    async def resume(
+        self,
+        task_id: str,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None
+    ) -> VideoGenerationResult:
+        """
+        Continue an interrupted or failed video generation from its last checkpoint
+        
+        Completed lifecycle steps (narrations, title, image prompts, ...) and
+        finished frame stages are reused; only the remaining work runs.
+        
+        Args:
+            task_id: Task ID of the original run (output/{task_id})
+            progress_callback: Optional callback for progress updates
+        
+        Returns:
+            VideoGenerationResult
+        
+        Raises:
+            ValueError: No checkpoint for this task, or its pipeline is not available
+        
+        Example:
+            result = await pixelle_video.resume("20251028_143052_ab3d")
+        """
+        checkpoint = await self._load_checkpoint(task_id)
+        pipeline_instance = self._get_checkpoint_pipeline(task_id, checkpoint)
+        return await pipeline_instance.resume(checkpoint, progress_callback=progress_callback)
+    
+    async def rerender(
+        self,
+        task_id: str,
+        frame_updates: Optional[Dict[int, Dict[str, Any]]] = None,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        **overrides
+    ) -> VideoGenerationResult:
+        """
+        Re-render a video after editing frames or settings
+        
+        Only frame artifacts whose inputs changed (audio, media, composed
+        image, segment) are rebuilt; the final concat and BGM mix run again.
+        
+        Args:
+            task_id: Task ID of the original run
+            frame_updates: Per-frame edits, {frame_index: {"narration": ..., "image_prompt": ...}}
+            progress_callback: Optional callback for progress updates
+            **overrides: "title", storyboard settings (voice_id, tts_speed, frame_template,
+                template_params, ...) or BGM params (bgm_path, bgm_volume, bgm_mode,
+                bgm_fade_in, bgm_fade_out, bgm_ducking)
+        
+        Returns:
+            VideoGenerationResult
+        
+        Raises:
+            ValueError: No checkpoint/storyboard for this task, or invalid edits
+        
+        Example:
+            # Fix one line: one TTS call, one compose, one segment encode
+            result = await pixelle_video.rerender(
+                "20251028_143052_ab3d",
+                frame_updates={3: {"narration": "Corrected line"}}
+            )
+        """
+        checkpoint = await self._load_checkpoint(task_id)
+        pipeline_instance = self._get_checkpoint_pipeline(task_id, checkpoint)
+        return await pipeline_instance.rerender(
+            checkpoint,
+            frame_updates=frame_updates,
+            progress_callback=progress_callback,
+            **overrides
+        )
+    
+    async def _load_checkpoint(self, task_id: str) -> Dict[str, Any]:
+        checkpoint = await self.persistence.load_checkpoint(task_id)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint found for task: {task_id}")
+        return checkpoint
+    
+    def _get_checkpoint_pipeline(self, task_id: str, checkpoint: Dict[str, Any]) -> LinearVideoPipeline:
+        """Find the registered pipeline that wrote a checkpoint"""
+        pipeline_name = checkpoint.get("pipeline")
+        for pipeline_instance in self.pipelines.values():
+            if type(pipeline_instance).__name__ == pipeline_name and isinstance(pipeline_instance, LinearVideoPipeline):
+                return pipeline_instance
+        
+        raise ValueError(f"Task {task_id} was created by pipeline '{pipeline_name}', which can't be resumed")
+    
     @property
     def project_name(self) -> str:
         """Get project name from config"""
@@ -20,18 +20,28 @@ Services:
 - TTSService: Text-to-speech
 - MediaService: Media generation (image & video)
 - VideoService: Video processing
+- SegmentSpec: Canonical codec profile of frame segments (stream-copy concat)
+- MediaInfo / probe_media: Cached media probing (duration, streams, size, fps)
 - FrameProcessor: Frame processing orchestrator
+- FrameScheduler: Pipelined multi-frame production with per-stage limits
+- LivePreview: Progressive HLS preview of frame segments
 - PersistenceService: Task metadata and storyboard persistence
 - HistoryManager: History management business logic
 - ComfyBaseService: Base class for ComfyUI-based services
+- WorkflowRegistry / get_workflow_registry: Shared, cached index of workflow files
 """
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.services.workflow_registry import WorkflowRegistry, get_workflow_registry
 from pixelle_video.services.llm_service import LLMService
 from pixelle_video.services.tts_service import TTSService
 from pixelle_video.services.media import MediaService
+from pixelle_video.services.media_info import MediaInfo, probe_media
 from pixelle_video.services.video import VideoService
+from pixelle_video.services.segment_spec import SegmentSpec
 from pixelle_video.services.frame_processor import FrameProcessor
+from pixelle_video.services.frame_scheduler import FrameScheduler
+from pixelle_video.services.live_preview import LivePreview, get_preview_playlist_path
 from pixelle_video.services.persistence import PersistenceService
 from pixelle_video.services.history_manager import HistoryManager
 
@@ -40,12 +50,20 @@ ImageService = MediaService
 
 __all__ = [
     "ComfyBaseService",
+    "WorkflowRegistry",
+    "get_workflow_registry",
     "LLMService",
     "TTSService",
     "MediaService",
     "ImageService",  # Backward compatibility
     "VideoService",
+    "SegmentSpec",
+    "MediaInfo",
+    "probe_media",
     "FrameProcessor",
+    "FrameScheduler",
+    "LivePreview",
+    "get_preview_playlist_path",
     "PersistenceService",
     "HistoryManager",
 ]
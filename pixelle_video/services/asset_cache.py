@@ -0,0 +1,538 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Asset cache - Content-addressed on-disk cache for generated files
+
+Generated assets (TTS audio, ComfyUI images/videos) are stored under
+data/cache/<name>/ by a hash of everything that determines their content,
+together with their ffprobe result, so identical requests skip generation
+and probing entirely.
+
+- Size-based LRU eviction (a hit refreshes the entry's mtime)
+- Concurrent identical requests share a single generation
+- Cached files are copied or hardlinked to the caller's output path, so
+  tasks never lose files when entries are evicted
+
+Asset analysis results (text) are cached separately by AnalysisCache,
+with the same LRU eviction.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.services.media_info import probe_media, remember_media_info
+
+
+def make_cache_key(**fields: Any) -> str:
+    """Stable sha256 key for a set of JSON-serializable fields"""
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    Place src at dst as a hardlink, falling back to a copy
+
+    Hardlinks fail across filesystems (and on some Windows/network drives),
+    in which case the file is copied.
+    """
+    Path(dst).parent.mkdir(parents=True, exist_ok=True)
+    tmp = f"{dst}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+    return dst
+
+
+def file_digest(path: Optional[str]) -> Optional[str]:
+    """
+    Content digest for a file reference used as generation input
+
+    Local files are hashed by content (so renamed copies hit the cache),
+    anything else (URLs, missing files) is used as-is.
+    """
+    if not path or not os.path.isfile(path):
+        return path
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def evict_lru(files: List[Tuple[float, int, Path]], max_bytes: int, victims: Callable[[Path], Iterable[Path]]) -> int:
+    """
+    Delete least recently used files until their total size fits max_bytes
+
+    Args:
+        files: (mtime, size, path) of every cached file
+        max_bytes: Max total size
+        victims: Files to delete with an entry (e.g. the file and its metadata)
+
+    Returns:
+        Total size after eviction
+    """
+    total = sum(size for _, size, _ in files)
+    if total <= max_bytes:
+        return total
+
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        for victim in victims(path):
+            try:
+                victim.unlink()
+            except OSError:
+                pass
+        total -= size
+    return total
+
+
+class AssetCache:
+    """
+    Content-addressed file cache with size-based LRU eviction
+
+    Usage:
+        >>> cache = get_tts_cache()
+        >>> key = make_cache_key(text="Hello", voice="zh-CN-YunjianNeural")
+        >>> audio_path = await cache.get_or_create(key, output_path, generate)
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, name: str = "asset"):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding cached files and their metadata
+            max_bytes: Max total size of cached files (oldest entries are evicted)
+            name: Cache name for logs
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.name = name
+        self._evict_lock = threading.Lock()
+        # In-flight generations per event loop: key -> future of the cache entry
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def temp_path(self, suffix: str = "") -> str:
+        """Scratch path inside the cache directory (same filesystem, so storing is a rename)"""
+        tmp_dir = self.cache_dir / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        return str(tmp_dir / f"{uuid.uuid4().hex}{suffix}")
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get cache entry metadata (None if missing or incomplete)"""
+        meta_path = self._meta_path(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        file_path = meta_path.parent / entry.get("file", "")
+        if not file_path.is_file():
+            return None
+
+        entry["path"] = str(file_path)
+        return entry
+
+    def _restore(self, entry: Dict[str, Any], output_path: Optional[str]) -> str:
+        """Copy a cached file to output_path and register its probe result"""
+        cached_path = entry["path"]
+        if not output_path:
+            output_path = str(Path("output") / f"{uuid.uuid4().hex}{Path(cached_path).suffix}")
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached_path, output_path)
+        os.utime(cached_path)  # Refresh LRU position
+
+        if entry.get("probe"):
+            remember_media_info(output_path, entry["probe"])
+        return output_path
+
+    def _touch(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Refresh an entry's LRU position"""
+        os.utime(entry["path"])
+        return entry
+
+    def _store(
+        self,
+        key: str,
+        file_path: str,
+        extra: Optional[Dict[str, Any]] = None,
+        move: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Copy (or move) a generated file into the cache (None if it is not a local file)"""
+        if not file_path or not os.path.isfile(file_path):
+            return None
+
+        meta_path = self._meta_path(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        cached_name = f"{key}{Path(file_path).suffix}"
+        cached_path = meta_path.parent / cached_name
+
+        try:
+            info = probe_media(file_path)
+            probe = {"streams": list(info.streams), "format": info.format}
+        except Exception as e:
+            logger.warning(f"Failed to probe {file_path} for {self.name} cache: {e}")
+            probe = None
+
+        # Write to temp names first so readers never see partial entries
+        tmp_suffix = f".{uuid.uuid4().hex[:8]}.tmp"
+        if move:
+            os.replace(file_path, cached_path)
+        else:
+            shutil.copyfile(file_path, str(cached_path) + tmp_suffix)
+            os.replace(str(cached_path) + tmp_suffix, cached_path)
+
+        entry = {
+            "file": cached_name,
+            "probe": probe,
+            "created_at": datetime.now().isoformat(),
+            **(extra or {}),
+        }
+        with open(str(meta_path) + tmp_suffix, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(str(meta_path) + tmp_suffix, meta_path)
+
+        self._evict()
+
+        entry["path"] = str(cached_path)
+        return entry
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        with self._evict_lock:
+            files = []
+            for path in self.cache_dir.glob("*/*"):
+                if path.suffix in (".json", ".tmp") or path.parent.name == "tmp":
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            if sum(size for _, size, _ in files) <= self.max_bytes:
+                return
+            total = evict_lru(files, self.max_bytes, lambda path: (path, path.with_suffix(".json")))
+            logger.debug(f"{self.name} cache evicted to {total / (1024 * 1024):.1f} MB")
+
+    def _get_inflight(self) -> Dict[str, asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(loop)
+        if inflight is None:
+            inflight = {}
+            self._inflight[loop] = inflight
+        return inflight
+
+    async def get_or_create_entry(
+        self,
+        key: str,
+        create: Callable[[], Awaitable[str]],
+        extra: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cache entry, generating it if needed
+
+        Unlike get_or_create, the cached file itself is returned: callers
+        place it with link_or_copy. create() must return a file the cache
+        may take ownership of (see temp_path), it is moved into the cache.
+
+        Args:
+            key: Cache key (see make_cache_key)
+            create: Coroutine factory generating the file, returns its path
+            extra: Additional metadata stored with the entry
+
+        Returns:
+            Entry dict ("path" = cached file, "probe", extra fields),
+            or None if create() did not produce a local file
+        """
+        entry = await asyncio.to_thread(self._lookup, key)
+        if entry is not None:
+            try:
+                await asyncio.to_thread(self._touch, entry)
+                logger.info(f"♻️  {self.name} cache hit: {key[:12]}")
+                return entry
+            except OSError:
+                pass
+
+        inflight = self._get_inflight()
+        pending = inflight.get(key)
+        if pending is not None:
+            logger.debug(f"Waiting for in-flight {self.name} generation: {key[:12]}")
+            try:
+                entry = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                entry = None
+            if entry is not None:
+                return entry
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            file_path = await create()
+            entry = await asyncio.to_thread(self._store, key, file_path, extra, True)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved (there may be no waiters)
+            raise
+        finally:
+            if inflight.get(key) is future:
+                inflight.pop(key)
+
+    async def get_or_create(
+        self,
+        key: str,
+        output_path: Optional[str],
+        create: Callable[[], Awaitable[str]],
+        extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Get a cached file or generate it
+
+        Args:
+            key: Cache key (see make_cache_key)
+            output_path: Where the caller wants the file (auto-generated if None)
+            create: Coroutine factory generating the file, returns its path
+            extra: Additional metadata stored with the entry
+
+        Returns:
+            Path to the file (output_path on cache hit, create()'s result otherwise)
+        """
+        entry = await asyncio.to_thread(self._lookup, key)
+        if entry is not None:
+            try:
+                restored = await asyncio.to_thread(self._restore, entry, output_path)
+                logger.info(f"♻️  {self.name} cache hit: {restored}")
+                return restored
+            except OSError as e:
+                # Entry evicted between lookup and copy
+                logger.debug(f"{self.name} cache entry vanished: {e}")
+
+        inflight = self._get_inflight()
+        pending = inflight.get(key)
+        if pending is not None:
+            # Identical request in progress: wait for it and copy its result
+            logger.debug(f"Waiting for in-flight {self.name} generation: {key[:12]}")
+            try:
+                entry = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                entry = None  # Leader was cancelled, generate ourselves
+            if entry is not None:
+                try:
+                    return await asyncio.to_thread(self._restore, entry, output_path)
+                except OSError:
+                    pass
+            return await create()
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            file_path = await create()
+            entry = await asyncio.to_thread(self._store, key, file_path, extra)
+            future.set_result(entry)
+            return file_path
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved (there may be no waiters)
+            raise
+        finally:
+            if inflight.get(key) is future:
+                inflight.pop(key)
+
+
+class AnalysisCache:
+    """
+    Cache for asset analysis results (image/video descriptions)
+
+    Entries are small JSON files keyed by the analyzed file's content, so the
+    same photo uploaded again (under any name) is not sent to ComfyUI twice.
+    Least recently used entries are evicted above max_bytes.
+
+    Usage:
+        >>> cache = get_analysis_cache()
+        >>> key = make_cache_key(kind="image", content=file_digest(path), source="runninghub")
+        >>> description = await cache.get(key)
+        >>> await cache.put(key, description)
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Max total size of entries (oldest entries are evicted)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._evict_lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[str]:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                result = json.load(f)["result"]
+            os.utime(entry_path)  # Refresh LRU position
+            return result
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, key: str, result: str, extra: Optional[Dict[str, Any]]):
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{entry_path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"result": result, "created_at": datetime.now().isoformat(), **(extra or {})}, f, ensure_ascii=False)
+        os.replace(tmp_path, entry_path)
+        self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        with self._evict_lock:
+            files = []
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            if sum(size for _, size, _ in files) <= self.max_bytes:
+                return
+            total = evict_lru(files, self.max_bytes, lambda path: (path,))
+            logger.debug(f"Analysis cache evicted to {total / (1024 * 1024):.1f} MB")
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached result (None on miss)"""
+        return await asyncio.to_thread(self._read, key)
+
+    async def put(self, key: str, result: str, extra: Optional[Dict[str, Any]] = None):
+        """Store a result"""
+        await asyncio.to_thread(self._write, key, result, extra)
+
+
+# Global caches (created on first use)
+_tts_cache: Optional[AssetCache] = None
+_media_cache: Optional[AssetCache] = None
+_analysis_cache: Optional[AnalysisCache] = None
+
+
+def get_tts_cache() -> Optional[AssetCache]:
+    """
+    Get the process-wide TTS audio cache
+
+    Returns:
+        AssetCache, or None if disabled via cache.tts_enabled
+    """
+    global _tts_cache
+
+    from pixelle_video.config import config_manager
+    cache_config = config_manager.config.cache
+    if not cache_config.tts_enabled:
+        return None
+
+    if _tts_cache is None:
+        from pixelle_video.utils.os_util import get_data_path
+        _tts_cache = AssetCache(
+            cache_dir=get_data_path("cache", "tts"),
+            max_bytes=cache_config.tts_max_size_mb * 1024 * 1024,
+            name="TTS"
+        )
+
+    return _tts_cache
+
+
+def get_media_cache() -> Optional[AssetCache]:
+    """
+    Get the process-wide generated media cache (images/videos from workflows)
+
+    Returns:
+        AssetCache, or None unless enabled via cache.media_enabled
+    """
+    global _media_cache
+
+    from pixelle_video.config import config_manager
+    cache_config = config_manager.config.cache
+    if not cache_config.media_enabled:
+        return None
+
+    if _media_cache is None:
+        from pixelle_video.utils.os_util import get_data_path
+        _media_cache = AssetCache(
+            cache_dir=get_data_path("cache", "media"),
+            max_bytes=cache_config.media_max_size_mb * 1024 * 1024,
+            name="Media"
+        )
+
+    return _media_cache
+
+
+def get_analysis_cache() -> Optional[AnalysisCache]:
+    """
+    Get the process-wide asset analysis cache
+
+    Returns:
+        AnalysisCache, or None if disabled via cache.analysis_enabled
+    """
+    global _analysis_cache
+
+    from pixelle_video.config import config_manager
+    cache_config = config_manager.config.cache
+    if not cache_config.analysis_enabled:
+        return None
+
+    if _analysis_cache is None:
+        from pixelle_video.utils.os_util import get_data_path
+        _analysis_cache = AnalysisCache(
+            cache_dir=get_data_path("cache", "analysis"),
+            max_bytes=cache_config.analysis_max_size_mb * 1024 * 1024
+        )
+
+    return _analysis_cache
@@ -0,0 +1,683 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Headless Browser Render Pool
+
+Keeps one headless Chrome/Chromium process warm and renders HTML to PNG through
+the Chrome DevTools Protocol (CDP), instead of launching a new browser per frame.
+
+Features:
+- Browser process is started lazily and reused for the whole Python process;
+  it is shut down once at process exit (close_render_pool / atexit), while a
+  core's cleanup only releases its own loop's pages (release_render_pool)
+- A failed browser launch is retried after a backoff
+- One CDP connection and set of page pools per event loop (Streamlit sessions
+  run concurrently in their own loops); pages of discarded loops are closed
+- N warm pages per viewport size, leased through an async API
+- Screenshots are captured at the exact viewport size straight into memory
+  (no write/move/crop round-trip through the current working directory)
+
+Usage:
+    >>> pool = get_render_pool()
+    >>> png_bytes = await pool.render("<html>...</html>", 1080, 1920)
+"""
+
+import asyncio
+import atexit
+import base64
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+from loguru import logger
+
+
+# Chrome flags for headless rendering in server/container environments
+CHROME_FLAGS = [
+    '--default-background-color=00000000',
+    '--no-sandbox',  # Bypass AppArmor/sandbox restrictions
+    '--disable-dev-shm-usage',  # Avoid shared memory issues
+    '--disable-gpu',  # Disable GPU acceleration
+    '--disable-software-rasterizer',  # Disable software rasterizer
+    '--disable-extensions',  # Disable extensions
+    '--disable-setuid-sandbox',  # Additional sandbox bypass
+    '--disable-dbus',  # Disable DBus to avoid permission errors
+    '--hide-scrollbars',  # Hide scrollbars for cleaner output
+    '--mute-audio',  # Mute audio
+    '--disable-background-networking',  # Disable background networking
+    '--disable-features=TranslateUI',  # Disable translate UI
+    '--disable-ipc-flooding-protection',  # Improve performance
+    '--no-first-run',  # Skip first run dialogs
+    '--no-default-browser-check',  # Skip default browser check
+    '--disable-backgrounding-occluded-windows',  # Improve performance
+    '--disable-renderer-backgrounding',  # Improve performance
+]
+
+# Seconds to wait for the browser to publish its DevTools endpoint
+_LAUNCH_TIMEOUT = 20.0
+
+# Seconds allowed for a single page load + screenshot
+_RENDER_TIMEOUT = 30.0
+
+# Seconds to wait for a free page before giving up
+_ACQUIRE_TIMEOUT = 120.0
+
+# Seconds before retrying a failed browser launch (callers fall back meanwhile)
+_LAUNCH_RETRY_AFTER = 60.0
+
+
+def find_chrome_executable() -> Optional[str]:
+    """
+    Find suitable Chrome/Chromium executable, preferring non-snap versions
+
+    Returns:
+        Path to Chrome executable or None to let the caller use its default
+    """
+    if os.name != 'posix':
+        return None
+
+    # Preferred browsers (non-snap versions)
+    candidates = [
+        '/usr/bin/google-chrome',
+        '/usr/bin/google-chrome-stable',
+        '/usr/bin/chromium',
+        '/usr/bin/chromium-browser',
+        '/usr/local/bin/chrome',
+        '/usr/local/bin/chromium',
+    ]
+
+    # Check each candidate
+    for path in candidates:
+        if os.path.exists(path) and os.access(path, os.X_OK):
+            try:
+                # Verify it's not a snap by checking the path
+                result = subprocess.run(
+                    ['readlink', '-f', path],
+                    capture_output=True,
+                    text=True,
+                    timeout=1
+                )
+                real_path = result.stdout.strip()
+
+                if '/snap/' not in real_path:
+                    logger.info(f"✓ Found non-snap browser: {path} -> {real_path}")
+                    return path
+                else:
+                    logger.debug(f"✗ Skipping snap browser: {path}")
+            except Exception as e:
+                logger.debug(f"Error checking {path}: {e}")
+
+    # Warn if no suitable browser found
+    logger.warning(
+        "⚠️  No non-snap Chrome/Chromium found. Snap browsers have AppArmor restrictions.\n"
+        "   Install system Chrome with:\n"
+        "   wget https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb\n"
+        "   sudo dpkg -i google-chrome-stable_current_amd64.deb\n"
+        "   Or install Chromium: sudo apt-get install -y chromium-browser"
+    )
+    return None
+
+
+def _find_any_chrome_executable() -> Optional[str]:
+    """Find a browser executable, falling back to html2image's own lookup"""
+    browser_path = find_chrome_executable()
+    if browser_path:
+        return browser_path
+
+    try:
+        from html2image.browsers.chrome import find_chrome
+        return find_chrome()
+    except Exception as e:
+        logger.debug(f"html2image could not locate Chrome: {e}")
+        return None
+
+
+class _CDPConnection:
+    """Minimal CDP client over a single browser-level websocket (flattened sessions)"""
+
+    def __init__(self, session: aiohttp.ClientSession, ws: aiohttp.ClientWebSocketResponse):
+        self._session = session
+        self._ws = ws
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._event_waiters: List[Tuple[str, Optional[str], asyncio.Future]] = []
+        self._reader = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, ws_url: str) -> "_CDPConnection":
+        session = aiohttp.ClientSession()
+        try:
+            # Screenshots of large viewports easily exceed the default 4 MB message limit
+            ws = await session.ws_connect(ws_url, max_msg_size=0)
+        except Exception:
+            await session.close()
+            raise
+        return cls(session, ws)
+
+    @property
+    def closed(self) -> bool:
+        return self._ws.closed or self._reader.done()
+
+    async def send(
+        self,
+        method: str,
+        params: Optional[dict] = None,
+        session_id: Optional[str] = None,
+        timeout: float = _RENDER_TIMEOUT
+    ) -> dict:
+        """Send a CDP command and wait for its result"""
+        self._next_id += 1
+        message_id = self._next_id
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._ws.send_str(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message_id, None)
+
+    def wait_for_event(self, method: str, session_id: Optional[str] = None) -> asyncio.Future:
+        """Register interest in the next event with this method (and session)"""
+        future = asyncio.get_running_loop().create_future()
+        self._event_waiters.append((method, session_id, future))
+        return future
+
+    async def _read_loop(self):
+        try:
+            async for msg in self._ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                        break
+                    continue
+
+                data = json.loads(msg.data)
+
+                if "id" in data:
+                    future = self._pending.get(data["id"])
+                    if future is None or future.done():
+                        continue
+                    if "error" in data:
+                        future.set_exception(RuntimeError(f"CDP error: {data['error'].get('message')}"))
+                    else:
+                        future.set_result(data.get("result", {}))
+                    continue
+
+                method = data.get("method")
+                session_id = data.get("sessionId")
+                for waiter in list(self._event_waiters):
+                    waiter_method, waiter_session, future = waiter
+                    if waiter_method == method and (waiter_session is None or waiter_session == session_id):
+                        self._event_waiters.remove(waiter)
+                        if not future.done():
+                            future.set_result(data.get("params", {}))
+        except Exception as e:
+            logger.debug(f"CDP reader stopped: {e}")
+        finally:
+            error = ConnectionError("CDP connection closed")
+            for future in list(self._pending.values()) + [w[2] for w in self._event_waiters]:
+                if not future.done():
+                    future.set_exception(error)
+            self._event_waiters.clear()
+
+    async def close(self):
+        self._reader.cancel()
+        try:
+            await self._ws.close()
+        except Exception:
+            pass
+        await self._session.close()
+
+
+class RenderPage:
+    """A warm browser page (CDP target) with a fixed viewport size"""
+
+    def __init__(
+        self,
+        conn: _CDPConnection,
+        target_id: str,
+        session_id: str,
+        width: int,
+        height: int,
+        work_dir: str
+    ):
+        self.conn = conn
+        self.target_id = target_id
+        self.session_id = session_id
+        self.width = width
+        self.height = height
+        self.work_dir = work_dir
+        self.broken = False
+
+    @classmethod
+    async def create(cls, conn: _CDPConnection, width: int, height: int, work_dir: str) -> "RenderPage":
+        """Open a new page and configure its viewport"""
+        result = await conn.send("Target.createTarget", {"url": "about:blank"})
+        target_id = result["targetId"]
+        result = await conn.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        session_id = result["sessionId"]
+
+        await conn.send("Page.enable", session_id=session_id)
+        await conn.send("Emulation.setDeviceMetricsOverride", {
+            "width": width,
+            "height": height,
+            "deviceScaleFactor": 1,
+            "mobile": False,
+        }, session_id=session_id)
+        # Transparent background, so video templates can be overlaid on the base video
+        await conn.send("Emulation.setDefaultBackgroundColorOverride", {
+            "color": {"r": 0, "g": 0, "b": 0, "a": 0}
+        }, session_id=session_id)
+
+        logger.debug(f"Opened render page {target_id[:8]} ({width}x{height})")
+        return cls(conn, target_id, session_id, width, height, work_dir)
+
+    async def render(self, html: str, timeout: float = _RENDER_TIMEOUT) -> bytes:
+        """
+        Render HTML and capture a PNG of the exact viewport
+
+        HTML is loaded from a file:// URL (same as Html2Image) so templates can
+        reference local images through file:// URLs.
+        """
+        html_file = os.path.join(self.work_dir, f"render_{uuid.uuid4().hex[:16]}.html")
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+        try:
+            loaded = self.conn.wait_for_event("Page.loadEventFired", self.session_id)
+            await self.conn.send("Page.navigate", {"url": Path(html_file).as_uri()}, session_id=self.session_id)
+            await asyncio.wait_for(loaded, timeout)
+
+            # Make sure web fonts are ready before capturing
+            await self.conn.send("Runtime.evaluate", {
+                "expression": "document.fonts ? document.fonts.ready.then(() => true) : true",
+                "awaitPromise": True,
+            }, session_id=self.session_id, timeout=timeout)
+
+            result = await self.conn.send("Page.captureScreenshot", {
+                "format": "png",
+                "clip": {"x": 0, "y": 0, "width": self.width, "height": self.height, "scale": 1},
+                "captureBeyondViewport": False,
+            }, session_id=self.session_id, timeout=timeout)
+            return base64.b64decode(result["data"])
+        finally:
+            try:
+                os.unlink(html_file)
+            except OSError:
+                pass
+
+    async def close(self):
+        try:
+            await self.conn.send("Target.closeTarget", {"targetId": self.target_id}, timeout=5)
+        except Exception as e:
+            logger.debug(f"Failed to close render page {self.target_id[:8]}: {e}")
+
+
+class _PagePool:
+    """Bounded set of warm pages for one viewport size"""
+
+    def __init__(self, conn: _CDPConnection, width: int, height: int, max_pages: int, work_dir: str):
+        self.conn = conn
+        self.width = width
+        self.height = height
+        self.max_pages = max_pages
+        self.work_dir = work_dir
+        self.pages: List[RenderPage] = []
+        # Idle pages; None means "a page was dropped, its slot is free"
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, timeout: float = _ACQUIRE_TIMEOUT) -> RenderPage:
+        """
+        Get an idle page, opening a new one while below max_pages
+
+        Raises:
+            TimeoutError: If no page becomes available within timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if self._idle.empty():
+                async with self._lock:
+                    if len(self.pages) < self.max_pages:
+                        page = await RenderPage.create(self.conn, self.width, self.height, self.work_dir)
+                        self.pages.append(page)
+                        return page
+
+            try:
+                page = await asyncio.wait_for(self._idle.get(), max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"No render page ({self.width}x{self.height}) available within {timeout:g}s"
+                ) from None
+            if page is not None:
+                return page
+            # A broken page was dropped: loop around and open a replacement
+
+    async def release(self, page: RenderPage):
+        if page.broken:
+            self.pages.remove(page)
+            # Wake a waiter (if any), it will open a replacement page
+            self._idle.put_nowait(None)
+            await page.close()
+            return
+        self._idle.put_nowait(page)
+
+    @property
+    def target_ids(self) -> List[str]:
+        return [page.target_id for page in self.pages]
+
+    async def close(self):
+        for page in self.pages:
+            await page.close()
+        self.pages.clear()
+
+
+@dataclass
+class _LoopState:
+    """CDP connection and page pools owned by one event loop"""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    conn: Optional[_CDPConnection] = None
+    pools: Dict[Tuple[int, int], _PagePool] = field(default_factory=dict)
+
+    @property
+    def target_ids(self) -> List[str]:
+        return [target_id for pool in self.pools.values() for target_id in pool.target_ids]
+
+
+class BrowserRenderPool:
+    """
+    Pool of warm headless browser pages, keyed by viewport size
+
+    The browser process is shared across event loops, while each loop gets
+    its own CDP connection and page pools (Streamlit sessions run actions in
+    their own loops, concurrently). When a loop is closed or garbage
+    collected, its pages are closed through another loop's connection.
+    """
+
+    def __init__(self, pages_per_size: int = 2, browser_executable: Optional[str] = None):
+        """
+        Initialize render pool
+
+        Args:
+            pages_per_size: Maximum warm pages kept per viewport size
+            browser_executable: Browser binary (auto-detected if None)
+        """
+        self.pages_per_size = max(1, pages_per_size)
+        self.browser_executable = browser_executable
+
+        self._process: Optional[subprocess.Popen] = None
+        self._work_dir: Optional[str] = None
+        self._ws_url: Optional[str] = None
+        self._launch_failed_at: Optional[float] = None
+        self._launch_lock = threading.Lock()
+
+        # Loop-bound state
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Pages left behind by discarded loops, closed from the next live connection
+        self._orphan_targets: List[str] = []
+        self._orphan_lock = threading.RLock()  # Also taken from GC finalizers
+
+    @property
+    def available(self) -> bool:
+        """False for a while after a failed browser launch (callers should fall back)"""
+        return self._launch_retry_in() <= 0
+
+    def _launch_retry_in(self) -> float:
+        """Seconds until a failed launch may be retried (0 if not backing off)"""
+        if self._launch_failed_at is None:
+            return 0.0
+        return max(0.0, self._launch_failed_at + _LAUNCH_RETRY_AFTER - time.monotonic())
+
+    def _launch_browser(self):
+        """Start the headless browser process and read its DevTools endpoint"""
+        if self.browser_executable is None:
+            self.browser_executable = _find_any_chrome_executable()
+        if not self.browser_executable:
+            raise RuntimeError("No Chrome/Chromium executable found for render pool")
+
+        self._work_dir = tempfile.mkdtemp(prefix="pixelle_render_")
+        profile_dir = os.path.join(self._work_dir, "profile")
+
+        cmd = [
+            self.browser_executable,
+            '--headless=new',
+            '--remote-debugging-port=0',
+            f'--user-data-dir={profile_dir}',
+            *CHROME_FLAGS,
+            'about:blank',
+        ]
+        self._process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        # Chrome writes "<port>\n<browser ws path>" once DevTools is listening
+        port_file = os.path.join(profile_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + _LAUNCH_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Browser exited during startup (code {self._process.returncode})")
+            if os.path.exists(port_file):
+                with open(port_file, 'r', encoding='utf-8') as f:
+                    lines = f.read().split()
+                if len(lines) >= 2:
+                    self._ws_url = f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+                    logger.info(f"🌐 Render pool browser started (pid={self._process.pid})")
+                    return
+            time.sleep(0.05)
+
+        raise RuntimeError(f"Browser did not expose DevTools within {_LAUNCH_TIMEOUT}s")
+
+    def _ensure_browser(self):
+        """Start the browser if it isn't running (shared by all loops, runs in a thread)"""
+        with self._launch_lock:
+            if self._process is not None and self._process.poll() is None:
+                return
+            retry_in = self._launch_retry_in()
+            if retry_in > 0:
+                raise RuntimeError(f"Render pool browser failed to launch, retrying in {retry_in:.0f}s")
+            self._terminate_process()
+            # Pages of the previous browser process are gone with it
+            with self._orphan_lock:
+                self._orphan_targets.clear()
+            try:
+                self._launch_browser()
+            except Exception:
+                self._launch_failed_at = time.monotonic()
+                self._terminate_process()
+                raise
+            self._launch_failed_at = None
+
+    def _get_state(self) -> _LoopState:
+        """Get the current loop's state, discarding states of closed loops"""
+        loop = asyncio.get_running_loop()
+        for other_loop in list(self._states.keys()):
+            if other_loop.is_closed():
+                self._discard_state(self._states.pop(other_loop, None))
+
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopState()
+            self._states[loop] = state
+            # Loop garbage collected without being closed: orphan its pages too
+            weakref.finalize(loop, self._discard_state, state)
+        return state
+
+    def _discard_state(self, state: Optional[_LoopState]):
+        """Queue a dead loop's pages for closing (its connection can't be used anymore)"""
+        if state is None or state.conn is None:
+            return
+        target_ids = state.target_ids
+        state.conn = None
+        state.pools = {}
+        if target_ids:
+            with self._orphan_lock:
+                self._orphan_targets.extend(target_ids)
+            logger.debug(f"Render pool: {len(target_ids)} pages of a discarded event loop queued for closing")
+
+    async def _close_orphans(self, conn: _CDPConnection):
+        with self._orphan_lock:
+            target_ids, self._orphan_targets = self._orphan_targets, []
+        for target_id in target_ids:
+            try:
+                await conn.send("Target.closeTarget", {"targetId": target_id}, timeout=5)
+            except Exception as e:
+                logger.debug(f"Failed to close orphan render page {target_id[:8]}: {e}")
+
+    async def _ensure_connection(self) -> _LoopState:
+        """Ensure browser is running and connected from the current event loop"""
+        state = self._get_state()
+
+        async with state.lock:
+            await asyncio.to_thread(self._ensure_browser)
+
+            if state.conn is None or state.conn.closed:
+                # Pages of a dropped connection may still be open in the browser
+                self._discard_state(state)
+                state.conn = await _CDPConnection.connect(self._ws_url)
+
+            if self._orphan_targets:
+                await self._close_orphans(state.conn)
+
+            return state
+
+    @asynccontextmanager
+    async def lease(self, width: int, height: int) -> AsyncIterator[RenderPage]:
+        """
+        Lease a warm page with the given viewport size
+
+        Example:
+            >>> async with pool.lease(1080, 1920) as page:
+            ...     png_bytes = await page.render(html)
+        """
+        state = await self._ensure_connection()
+        key = (width, height)
+        pool = state.pools.get(key)
+        if pool is None or pool.conn is not state.conn:
+            pool = _PagePool(state.conn, width, height, self.pages_per_size, self._work_dir)
+            state.pools[key] = pool
+
+        page = await pool.acquire()
+        try:
+            yield page
+        except BaseException:
+            page.broken = True
+            raise
+        finally:
+            await pool.release(page)
+
+    async def render(self, html: str, width: int, height: int) -> bytes:
+        """Render HTML to PNG bytes at exactly width x height"""
+        async with self.lease(width, height) as page:
+            return await page.render(html)
+
+    def _terminate_process(self):
+        """Stop the browser process (not thread-safe, see _ensure_browser)"""
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+        if self._work_dir:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+
+    async def release(self):
+        """
+        Close the current loop's pages and connection
+
+        The browser keeps running for other loops (sessions, the API).
+        """
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        try:
+            if state is not None and state.conn is not None:
+                for pool in state.pools.values():
+                    await pool.close()
+                await state.conn.close()
+        except Exception as e:
+            logger.debug(f"Error while closing render pool connection: {e}")
+
+    async def close(self):
+        """
+        Close the current loop's pages and connection, then the browser process
+
+        Connections of other loops die with the browser process. Only call this
+        when the process is done rendering (API shutdown, script exit).
+        """
+        try:
+            await self.release()
+        finally:
+            self._states = weakref.WeakKeyDictionary()
+            with self._orphan_lock:
+                self._orphan_targets.clear()
+            with self._launch_lock:
+                self._terminate_process()
+
+
+# Global render pool (created on first use)
+_render_pool: Optional[BrowserRenderPool] = None
+
+
+def get_render_pool() -> Optional[BrowserRenderPool]:
+    """
+    Get the process-wide render pool
+
+    Returns:
+        BrowserRenderPool, or None if disabled via template.render_pool_size = 0
+    """
+    global _render_pool
+
+    if _render_pool is None:
+        from pixelle_video.config import config_manager
+        pool_size = config_manager.config.template.render_pool_size
+        if pool_size <= 0:
+            return None
+        _render_pool = BrowserRenderPool(pages_per_size=pool_size)
+        atexit.register(_render_pool._terminate_process)
+
+    return _render_pool
+
+
+async def release_render_pool():
+    """Release the current event loop's pages, leaving the browser running for others"""
+    if _render_pool is not None:
+        await _render_pool.release()
+
+
+async def close_render_pool():
+    """Shut down the process-wide render pool (if started), at process exit only"""
+    global _render_pool
+    if _render_pool is not None:
+        await _render_pool.close()
+        _render_pool = None
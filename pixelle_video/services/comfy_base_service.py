@@ -14,19 +14,14 @@
 ComfyUI Base Service - Common logic for ComfyUI-based services
 """
 
-import json
 import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from comfykit import ComfyKit
 from loguru import logger
 
-from pixelle_video.utils.os_util import (
-    get_resource_path,
-    list_resource_files,
-    list_resource_dirs
-)
+from pixelle_video.services.workflow_registry import get_workflow_registry, parse_workflow_file
 
 
 class ComfyBaseService:
@@ -62,14 +57,20 @@ class ComfyBaseService:
         self.global_config = comfyui_config
         
         self.service_name = service_name
-        self._workflows_cache: Optional[List[str]] = None
         
         # Reference to core (for accessing shared ComfyKit)
         self.core = core
     
+    def _workflow_prefixes(self) -> Tuple[str, ...]:
+        """Filename prefixes of the workflows this service can run"""
+        return (self.WORKFLOW_PREFIX,)
+    
     def _scan_workflows(self) -> List[Dict[str, Any]]:
         """
-        Scan workflows/source/*.json files from all source directories (merged from workflows/ and data/workflows/)
+        List this service's workflows from the shared workflow registry
+        
+        The registry indexes workflows/source/*.json from all source directories
+        (merged from workflows/ and data/workflows/) and only rescans when they change.
         
         Returns:
             List of workflow info dicts
@@ -91,77 +92,13 @@ class ComfyBaseService:
                 }
             ]
         """
-        workflows = []
-        
-        # Get all workflow source directories (merged from workflows/ and data/workflows/)
-        source_dirs = list_resource_dirs("workflows")
-        
-        if not source_dirs:
-            logger.warning("No workflow source directories found")
-            return workflows
-        
-        # Scan each source directory for workflow files
-        for source_name in source_dirs:
-            # Get all JSON files for this source (merged from both locations)
-            workflow_files = list_resource_files("workflows", source_name)
-            
-            # Filter to only files matching the prefix
-            matching_files = [
-                f for f in workflow_files 
-                if f.startswith(self.WORKFLOW_PREFIX) and f.endswith('.json')
-            ]
-            
-            for filename in matching_files:
-                try:
-                    # Get actual file path (custom > default)
-                    file_path = Path(get_resource_path("workflows", source_name, filename))
-                    workflow_info = self._parse_workflow_file(file_path, source_name)
-                    workflows.append(workflow_info)
-                    logger.debug(f"Found workflow: {workflow_info['key']}")
-                except Exception as e:
-                    logger.error(f"Failed to parse workflow {source_name}/{filename}: {e}")
-        
-        # Sort by key (source/name)
-        return sorted(workflows, key=lambda w: w["key"])
+        return get_workflow_registry().list(self._workflow_prefixes())
     
     def _parse_workflow_file(self, file_path: Path, source: str) -> Dict[str, Any]:
         """
-        Parse workflow file and extract metadata
-        
-        Args:
-            file_path: Path to workflow JSON file
-            source: Source directory name (e.g., "selfhost", "runninghub")
-        
-        Returns:
-            Workflow info dict with structure:
-            {
-                "name": "image_flux.json",
-                "display_name": "image_flux.json - Runninghub",
-                "source": "runninghub",
-                "path": "workflows/runninghub/image_flux.json",
-                "key": "runninghub/image_flux.json",
-                "workflow_id": "123456"  # Only for RunningHub
-            }
+        Parse workflow file and extract metadata (see workflow_registry.parse_workflow_file)
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = json.load(f)
-        
-        # Build base info
-        workflow_info = {
-            "name": file_path.name,
-            "display_name": f"{file_path.name} - {source.title()}",
-            "source": source,
-            "path": str(file_path),
-            "key": f"{source}/{file_path.name}"
-        }
-        
-        # Check if it's a wrapper format (RunningHub, etc.)
-        if "source" in content:
-            # Wrapper format: {"source": "runninghub", "workflow_id": "xxx", ...}
-            if "workflow_id" in content:
-                workflow_info["workflow_id"] = content["workflow_id"]
-        
-        return workflow_info
+        return parse_workflow_file(file_path, source)
     
     def _get_default_workflow(self) -> str:
         """
@@ -210,17 +147,14 @@ class ComfyBaseService:
         if workflow is None:
             workflow = self._get_default_workflow()
         
-        # 2. Scan available workflows
-        available_workflows = self._scan_workflows()
-        
-        # 3. Find matching workflow by key
-        for wf_info in available_workflows:
-            if wf_info["key"] == workflow:
-                logger.info(f"🎬 Using {self.service_name} workflow: {workflow}")
-                return wf_info
+        # 2. Look up the workflow in the shared registry
+        wf_info = get_workflow_registry().get(workflow)
+        if wf_info is not None and wf_info["name"].startswith(self._workflow_prefixes()):
+            logger.info(f"🎬 Using {self.service_name} workflow: {workflow}")
+            return wf_info
         
-        # 4. Not found - generate error message
-        available_keys = [wf["key"] for wf in available_workflows]
+        # 3. Not found - generate error message
+        available_keys = [wf["key"] for wf in self._scan_workflows()]
         available_str = ", ".join(available_keys) if available_keys else "none"
         raise ValueError(
             f"Workflow '{workflow}' not found. "
@@ -0,0 +1,237 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Downloader - Pooled, streaming downloads of generated media
+
+A keep-alive httpx client (HTTP/2 when the optional h2 package is
+installed) serves all downloads of an event loop, and a process-wide slot
+pool caps concurrent transfers across all loops. Responses are streamed in chunks to a
+.part file and renamed into place when complete, so a 80 MB video never
+sits in memory and readers never see partial files. Interrupted transfers
+resume with a Range request.
+"""
+
+import asyncio
+import importlib.util
+import os
+import weakref
+from typing import Dict, Optional
+
+import httpx
+from loguru import logger
+
+from pixelle_video.utils.async_util import SlotPool
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class IncompleteDownloadError(Exception):
+    """Connection closed before the full body was received"""
+
+
+class Downloader:
+    """
+    Streaming downloader with a shared client and a concurrency cap
+
+    The concurrency cap is process-wide. Clients are kept per event loop
+    (httpx connections can't move between loops), so connections are reused
+    for the lifetime of a loop: the whole process in the API server and
+    worker, one action in Streamlit, where run_async closes the loop's client
+    before the loop ends.
+
+    Usage:
+        >>> downloader = get_downloader()
+        >>> await downloader.download(url, "output/task/frames/01_video.mp4")
+        >>> text = await downloader.fetch_text(url)
+    """
+
+    def __init__(self, max_concurrent: int = 4, retries: int = 3):
+        """
+        Initialize downloader
+
+        Args:
+            max_concurrent: Max simultaneous downloads (across all event loops)
+            retries: Retries for network errors, 5xx responses and truncated bodies
+        """
+        self.max_concurrent = max_concurrent
+        self.retries = retries
+        self.http2 = importlib.util.find_spec("h2") is not None
+        self._slots = SlotPool(max_concurrent)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        self._drop_stale_clients()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                follow_redirects=True,
+                timeout=httpx.Timeout(connect=10.0, read=60, write=60, pool=60),
+                limits=httpx.Limits(max_connections=self.max_concurrent * 2, max_keepalive_connections=self.max_concurrent),
+            )
+            self._clients[loop] = client
+        return client
+
+    def _drop_stale_clients(self):
+        """Forget clients whose loop ended without close() (they can't be closed from another loop)"""
+        for loop in [loop for loop in list(self._clients.keys()) if loop.is_closed()]:
+            client = self._clients.pop(loop, None)
+            if client is not None and not client.is_closed:
+                logger.warning("Downloader client of a finished event loop was not closed, dropping it")
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        if attempt >= self.retries:
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        return isinstance(error, (httpx.TransportError, IncompleteDownloadError))
+
+    async def download(self, url: str, output_path: str) -> str:
+        """
+        Download url to output_path
+
+        Args:
+            url: HTTP(S) URL
+            output_path: Destination file (parent directories are created)
+
+        Returns:
+            output_path
+
+        Raises:
+            httpx.HTTPError: If the download keeps failing after retries
+        """
+        client = self._get_client()
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        part_path = f"{output_path}.part"
+
+        async with self._slots:
+            attempt = 0
+            while True:
+                try:
+                    await self._download_once(client, url, part_path)
+                    os.replace(part_path, output_path)
+                    return output_path
+                except Exception as e:
+                    if not self._should_retry(e, attempt):
+                        if os.path.exists(part_path):
+                            os.unlink(part_path)
+                        raise
+                    attempt += 1
+                    delay = 0.5 * 2 ** (attempt - 1)
+                    logger.warning(f"Download interrupted ({e}), retry {attempt}/{self.retries} in {delay:.1f}s: {url}")
+                    await asyncio.sleep(delay)
+
+    async def _download_once(self, client: httpx.AsyncClient, url: str, part_path: str):
+        """Stream one attempt into part_path, resuming from its current size"""
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers: Dict[str, str] = {"Range": f"bytes={offset}-"} if offset else {}
+
+        async with client.stream("GET", url, headers=headers) as response:
+            if offset and response.status_code == 416:
+                # Nothing left to fetch (or the file changed): start over
+                os.unlink(part_path)
+                raise IncompleteDownloadError("Range not satisfiable, restarting")
+            response.raise_for_status()
+
+            if offset and response.status_code == 206:
+                mode = "ab"
+                logger.debug(f"Resuming download at {offset} bytes: {url}")
+            else:
+                # Server ignored the Range header: full body follows
+                mode, offset = "wb", 0
+
+            content_length = response.headers.get("Content-Length")
+            expected = offset + int(content_length) if content_length else None
+
+            written = offset
+            with open(part_path, mode) as f:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+
+        if expected is not None and written < expected:
+            raise IncompleteDownloadError(f"Received {written} of {expected} bytes")
+
+    async def fetch_text(self, url: str) -> str:
+        """
+        Fetch a small text resource (e.g. RunningHub txt outputs)
+
+        Raises:
+            httpx.HTTPError: If the request keeps failing after retries
+        """
+        client = self._get_client()
+
+        async with self._slots:
+            attempt = 0
+            while True:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    return response.text
+                except Exception as e:
+                    if not self._should_retry(e, attempt):
+                        raise
+                    attempt += 1
+                    await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+
+    async def close(self):
+        """
+        Close the client of the current event loop
+
+        Clients are bound to their loop, so each loop closes its own before it
+        ends (API lifespan / worker shutdown, run_async in the web UI).
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+        self._drop_stale_clients()
+
+
+# Global downloader (created on first use)
+_downloader: Optional[Downloader] = None
+
+
+def get_downloader() -> Downloader:
+    """
+    Get the process-wide downloader
+
+    Concurrency and retries come from pipeline.download_concurrency and
+    pipeline.download_retries in config.yaml.
+    """
+    global _downloader
+
+    if _downloader is None:
+        from pixelle_video.config import config_manager
+        pipeline_config = config_manager.config.pipeline
+        _downloader = Downloader(
+            max_concurrent=pipeline_config.download_concurrency,
+            retries=pipeline_config.download_retries
+        )
+        logger.debug(f"Downloader initialized (http2={_downloader.http2})")
+
+    return _downloader
+
+
+async def close_downloader():
+    """
+    Close the process-wide downloader's client for the current event loop
+
+    Call it from every loop that downloaded before the loop ends: clients of
+    other loops can't be closed from here.
+    """
+    if _downloader is not None:
+        await _downloader.close()
@@ -0,0 +1,144 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+FFmpeg runner - Non-blocking ffmpeg execution
+
+ffmpeg is spawned with asyncio subprocesses, so encoding never blocks the
+event loop that also serves the API and TaskManager. Concurrent processes
+are limited by a process-wide slot pool (CPU cores by default) shared by all
+event loops, a cancelled run kills its child process, and progress is read
+from ffmpeg's -progress output.
+"""
+
+import asyncio
+import os
+from typing import Callable, List, Optional, Union
+
+import ffmpeg
+from loguru import logger
+
+from pixelle_video.utils.async_util import SlotPool
+
+
+class FFmpegRunner:
+    """
+    Run ffmpeg commands asynchronously with a bounded number of slots
+
+    The slot limit is process-wide: runs from every event loop (API server,
+    Streamlit actions, worker threads) share the same pool.
+
+    Usage:
+        >>> runner = get_ffmpeg_runner()
+        >>> stream = ffmpeg.input("in.mp4").output("out.mp4").overwrite_output()
+        >>> await runner.run(stream, duration=12.5, progress_callback=print)
+    """
+
+    def __init__(self, max_slots: Optional[int] = None):
+        """
+        Initialize runner
+
+        Args:
+            max_slots: Max concurrent ffmpeg processes (None = number of CPU cores)
+        """
+        self.max_slots = max_slots or max(1, os.cpu_count() or 1)
+        self._slots = SlotPool(self.max_slots)
+
+    async def run(
+        self,
+        cmd: Union[List[str], "ffmpeg.nodes.OutputStream"],
+        duration: Optional[float] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> None:
+        """
+        Run an ffmpeg command
+
+        Args:
+            cmd: ffmpeg-python output stream, or full argument list starting with "ffmpeg"
+            duration: Expected output duration in seconds (enables fractional progress)
+            progress_callback: Optional callback receiving progress in [0, 1]
+
+        Raises:
+            ffmpeg.Error: If ffmpeg exits with a non-zero code (stderr attached)
+            asyncio.CancelledError: If cancelled (the ffmpeg process is killed)
+        """
+        args = list(cmd) if isinstance(cmd, list) else cmd.compile()
+        # Global options go right after the executable
+        args = [args[0], '-nostdin', '-nostats', '-progress', 'pipe:1', *args[1:]]
+
+        async with self._slots:
+            logger.debug(f"Running: {' '.join(args)}")
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            try:
+                _, stderr = await asyncio.gather(
+                    self._read_progress(process.stdout, duration, progress_callback),
+                    process.stderr.read()
+                )
+                await process.wait()
+            except asyncio.CancelledError:
+                if process.returncode is None:
+                    logger.warning(f"Cancelling ffmpeg (pid={process.pid})")
+                    process.kill()
+                    await process.wait()
+                raise
+
+        if process.returncode != 0:
+            raise ffmpeg.Error(args[0], b'', stderr)
+
+    async def _read_progress(
+        self,
+        stream: asyncio.StreamReader,
+        duration: Optional[float],
+        progress_callback: Optional[Callable[[float], None]]
+    ):
+        """Parse key=value lines from -progress and report output position"""
+        async for raw_line in stream:
+            if not progress_callback:
+                continue
+
+            key, _, value = raw_line.decode(errors='ignore').strip().partition('=')
+            if key == 'progress' and value == 'end':
+                progress_callback(1.0)
+            elif key in ('out_time_us', 'out_time_ms') and duration:
+                # Both keys are in microseconds (out_time_ms is a historical misnomer)
+                try:
+                    seconds = int(value) / 1_000_000
+                except ValueError:
+                    continue
+                progress_callback(min(1.0, max(0.0, seconds / duration)))
+
+
+# Global runner (created on first use)
+_ffmpeg_runner: Optional[FFmpegRunner] = None
+
+
+def get_ffmpeg_runner() -> FFmpegRunner:
+    """
+    Get the process-wide ffmpeg runner
+
+    Slot count comes from pipeline.ffmpeg_slots in config.yaml (0 = CPU cores).
+    """
+    global _ffmpeg_runner
+
+    if _ffmpeg_runner is None:
+        from pixelle_video.config import config_manager
+        slots = config_manager.config.pipeline.ffmpeg_slots
+        _ffmpeg_runner = FFmpegRunner(max_slots=slots or None)
+        logger.debug(f"FFmpeg runner initialized with {_ffmpeg_runner.max_slots} slots")
+
+    return _ffmpeg_runner
@@ -23,19 +23,303 @@ Linux Environment Requirements:
     CentOS/RHEL: sudo yum install -y fontconfig liberation-fonts google-noto-cjk-fonts
 """
 
-from math import log
 import os
 import re
+import threading
 import uuid
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from html2image import Html2Image
 from loguru import logger
 from PIL import Image
 
+from pixelle_video.services.browser_pool import CHROME_FLAGS, find_chrome_executable, get_render_pool
 from pixelle_video.utils.template_util import parse_template_size
 
 
+# Pattern: {{param_name:type=default}} or {{param_name=default}} or {{param_name:type}} or {{param_name}}
+# Param name: must start with letter or underscore, can contain letters, digits, underscores
+PARAM_PATTERN = re.compile(r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}')
+
+# Preset parameters that should be ignored (auto-injected by system)
+PRESET_PARAMS = {'title', 'text', 'image', 'index'}
+
+SUPPORTED_PARAM_TYPES = {'text', 'number', 'color', 'bool'}
+
+
+def parse_default_value(param_type: str, value_str: Optional[str]) -> Any:
+    """
+    Parse default value based on parameter type
+    
+    Args:
+        param_type: Type of parameter (text, number, color, bool)
+        value_str: String value to parse (can be None)
+    
+    Returns:
+        Parsed value with appropriate type
+    """
+    if value_str is None:
+        # No default value specified, return type-specific defaults
+        return {
+            'text': '',
+            'number': 0,
+            'color': '#000000',
+            'bool': False,
+        }.get(param_type, '')
+    
+    if param_type == 'number':
+        try:
+            # Try int first, then float
+            if '.' in value_str:
+                return float(value_str)
+            else:
+                return int(value_str)
+        except ValueError:
+            logger.warning(f"Invalid number value '{value_str}', using 0")
+            return 0
+    
+    elif param_type == 'bool':
+        # Accept: true/false, 1/0, yes/no, on/off (case-insensitive)
+        return value_str.lower() in {'true', '1', 'yes', 'on'}
+    
+    elif param_type == 'color':
+        # Auto-add # if missing
+        if value_str.startswith('#'):
+            return value_str
+        else:
+            return f'#{value_str}'
+    
+    else:  # text
+        return value_str
+
+
+def parse_media_size_from_meta(html: str) -> tuple[Optional[int], Optional[int]]:
+    """
+    Parse media size from meta tags in template
+    
+    Looks for meta tags:
+    - <meta name="template:media-width" content="1024">
+    - <meta name="template:media-height" content="1024">
+    
+    Args:
+        html: Template HTML content
+    
+    Returns:
+        Tuple of (width, height) or (None, None) if not found
+    """
+    from bs4 import BeautifulSoup
+    
+    try:
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Find width and height meta tags
+        width_meta = soup.find('meta', attrs={'name': 'template:media-width'})
+        height_meta = soup.find('meta', attrs={'name': 'template:media-height'})
+        
+        if width_meta and height_meta:
+            width = int(width_meta.get('content', 0))
+            height = int(height_meta.get('content', 0))
+            
+            if width > 0 and height > 0:
+                logger.debug(f"Found media size in meta tags: {width}x{height}")
+                return width, height
+        
+        return None, None
+        
+    except Exception as e:
+        logger.warning(f"Failed to parse media size from meta tags: {e}")
+        return None, None
+
+
+def render_value(value: Any) -> str:
+    """Convert a parameter value to its HTML string form"""
+    # Convert bool to string for HTML
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value) if value is not None else ''
+
+
+@dataclass
+class TemplateSlot:
+    """Placeholder slot in a compiled template"""
+    name: str                                  # Parameter name
+    type: str                                  # Parameter type (text, number, color, bool)
+    default_str: Optional[str]                 # Raw default from placeholder (inserted as-is)
+
+
+@dataclass
+class CompiledTemplate:
+    """
+    Template parsed once into literal chunks and placeholder slots
+    
+    chunks[i] is the literal HTML before slots[i]; chunks[-1] is the trailing
+    literal, so len(chunks) == len(slots) + 1.
+    """
+    path: str
+    mtime_ns: int
+    content: str
+    width: int
+    height: int
+    chunks: List[str] = field(default_factory=list)
+    slots: List[TemplateSlot] = field(default_factory=list)
+    params: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    media_size: Tuple[Optional[int], Optional[int]] = (None, None)
+    
+    @classmethod
+    def compile(cls, path: str, mtime_ns: int, content: str) -> "CompiledTemplate":
+        """Split template content into chunks/slots and collect custom parameters"""
+        width, height = parse_template_size(path)
+        compiled = cls(path=path, mtime_ns=mtime_ns, content=content, width=width, height=height)
+        
+        position = 0
+        for match in PARAM_PATTERN.finditer(content):
+            param_name = match.group(1)
+            param_type = match.group(2) or 'text'  # Default to text
+            default_value = match.group(3)
+            
+            compiled.chunks.append(content[position:match.start()])
+            compiled.slots.append(TemplateSlot(param_name, param_type, default_value))
+            position = match.end()
+            
+            # Skip preset parameters and repeated occurrences (use first occurrence)
+            if param_name in PRESET_PARAMS or param_name in compiled.params:
+                continue
+            
+            # Validate type
+            if param_type not in SUPPORTED_PARAM_TYPES:
+                logger.warning(f"Unknown parameter type '{param_type}' for '{param_name}', defaulting to 'text'")
+                param_type = 'text'
+            
+            compiled.params[param_name] = {
+                'type': param_type,
+                'default': parse_default_value(param_type, default_value),
+                'label': param_name,  # Use param name as label
+            }
+        compiled.chunks.append(content[position:])
+        
+        compiled.media_size = parse_media_size_from_meta(content)
+        
+        if compiled.params:
+            logger.debug(f"Parsed {len(compiled.params)} custom parameter(s) from template: {list(compiled.params.keys())}")
+        
+        return compiled
+    
+    def render(self, values: Dict[str, Any]) -> str:
+        """
+        Render template by joining precomputed chunks with slot values
+        
+        - If value provided in values dict, use it
+        - Otherwise, use default value from placeholder
+        - If no default, use empty string
+        """
+        parts = []
+        for chunk, slot in zip(self.chunks, self.slots):
+            parts.append(chunk)
+            if slot.name in values:
+                parts.append(render_value(values[slot.name]))
+            elif slot.default_str:
+                parts.append(slot.default_str)
+        parts.append(self.chunks[-1])
+        return ''.join(parts)
+
+
+# Process-wide compiled template registry (keyed by absolute path, invalidated by mtime)
+_template_cache: Dict[str, CompiledTemplate] = {}
+_template_cache_lock = threading.Lock()
+
+
+def get_compiled_template(template_path: str) -> CompiledTemplate:
+    """
+    Get compiled template from the process-wide cache
+    
+    Only a single stat() is needed on cache hits; the template is re-read
+    and re-compiled when its mtime changes.
+    
+    Args:
+        template_path: Path to HTML template file
+    
+    Returns:
+        CompiledTemplate instance (shared, treat as read-only)
+    
+    Raises:
+        FileNotFoundError: If template file doesn't exist
+    """
+    path = Path(template_path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_path}")
+    
+    key = str(path.resolve())
+    cached = _template_cache.get(key)
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+    
+    with _template_cache_lock:
+        cached = _template_cache.get(key)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        compiled = CompiledTemplate.compile(template_path, mtime_ns, content)
+        _template_cache[key] = compiled
+        logger.debug(f"Template compiled: {template_path} ({len(content)} chars, {len(compiled.slots)} slots)")
+        return compiled
+
+
+def clear_template_cache():
+    """Drop all compiled templates (e.g., after bulk template changes)"""
+    with _template_cache_lock:
+        _template_cache.clear()
+
+
+# Linux font dependency check runs once per process
+_linux_dependencies_checked = False
+
+
+def check_linux_dependencies():
+    """Check Linux system dependencies and warn if missing (once per process)"""
+    global _linux_dependencies_checked
+    
+    if _linux_dependencies_checked or os.name != 'posix':
+        return
+    _linux_dependencies_checked = True
+    
+    try:
+        import subprocess
+        
+        # Check fontconfig
+        result = subprocess.run(
+            ['fc-list'], 
+            capture_output=True, 
+            timeout=2
+        )
+        
+        if result.returncode != 0:
+            logger.warning(
+                "⚠️  fontconfig not found or not working properly. "
+                "Install with: sudo apt-get install -y fontconfig fonts-liberation fonts-noto-cjk"
+            )
+        elif not result.stdout:
+            logger.warning(
+                "⚠️  No fonts detected by fontconfig. "
+                "Install fonts with: sudo apt-get install -y fonts-liberation fonts-noto-cjk"
+            )
+        else:
+            logger.debug(f"✓ Fontconfig detected {len(result.stdout.splitlines())} fonts")
+            
+    except FileNotFoundError:
+        logger.warning(
+            "⚠️  fontconfig (fc-list) not found on system. "
+            "Install with: sudo apt-get install -y fontconfig"
+        )
+    except Exception as e:
+        logger.debug(f"Could not check fontconfig status: {e}")
+
+
 class HTMLFrameGenerator:
     """
     HTML-based frame generator
@@ -43,6 +327,9 @@ class HTMLFrameGenerator:
     Renders HTML templates to frame images with variable substitution.
     Users can create custom templates using any HTML/CSS.
     
+    Templates are compiled once per process (see get_compiled_template), so
+    creating a generator per frame or per request is cheap.
+    
     Usage:
         >>> generator = HTMLFrameGenerator("templates/modern.html")
         >>> frame_path = await generator.generate_frame(
@@ -68,10 +355,11 @@ class HTMLFrameGenerator:
             template_path: Path to HTML template file (e.g., "templates/1080x1920/default.html")
         """
         self.template_path = template_path
-        self.template = self._load_template(template_path)
+        self.compiled = get_compiled_template(template_path)
+        self.template = self.compiled.content
         
-        # Parse video size from template path
-        self.width, self.height = parse_template_size(template_path)
+        # Video size is parsed from template path at compile time
+        self.width, self.height = self.compiled.width, self.compiled.height
         
         self.hti = None  # Lazy init to avoid overhead
         self._check_linux_dependencies()
@@ -80,85 +368,20 @@ class HTMLFrameGenerator:
     
     def _check_linux_dependencies(self):
         """Check Linux system dependencies and warn if missing"""
-        if os.name != 'posix':
-            return
-        
-        try:
-            import subprocess
-            
-            # Check fontconfig
-            result = subprocess.run(
-                ['fc-list'], 
-                capture_output=True, 
-                timeout=2
-            )
-            
-            if result.returncode != 0:
-                logger.warning(
-                    "⚠️  fontconfig not found or not working properly. "
-                    "Install with: sudo apt-get install -y fontconfig fonts-liberation fonts-noto-cjk"
-                )
-            elif not result.stdout:
-                logger.warning(
-                    "⚠️  No fonts detected by fontconfig. "
-                    "Install fonts with: sudo apt-get install -y fonts-liberation fonts-noto-cjk"
-                )
-            else:
-                logger.debug(f"✓ Fontconfig detected {len(result.stdout.splitlines())} fonts")
-                
-        except FileNotFoundError:
-            logger.warning(
-                "⚠️  fontconfig (fc-list) not found on system. "
-                "Install with: sudo apt-get install -y fontconfig"
-            )
-        except Exception as e:
-            logger.debug(f"Could not check fontconfig status: {e}")
+        check_linux_dependencies()
     
     def _load_template(self, template_path: str) -> str:
         """Load HTML template from file"""
-        path = Path(template_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        logger.debug(f"Template loaded: {len(content)} chars")
-        return content
+        return get_compiled_template(template_path).content
     
     def _parse_media_size_from_meta(self) -> tuple[Optional[int], Optional[int]]:
         """
         Parse media size from meta tags in template
         
-        Looks for meta tags:
-        - <meta name="template:media-width" content="1024">
-        - <meta name="template:media-height" content="1024">
-        
         Returns:
             Tuple of (width, height) or (None, None) if not found
         """
-        from bs4 import BeautifulSoup
-        
-        try:
-            soup = BeautifulSoup(self.template, 'html.parser')
-            
-            # Find width and height meta tags
-            width_meta = soup.find('meta', attrs={'name': 'template:media-width'})
-            height_meta = soup.find('meta', attrs={'name': 'template:media-height'})
-            
-            if width_meta and height_meta:
-                width = int(width_meta.get('content', 0))
-                height = int(height_meta.get('content', 0))
-                
-                if width > 0 and height > 0:
-                    logger.debug(f"Found media size in meta tags: {width}x{height}")
-                    return width, height
-            
-            return None, None
-            
-        except Exception as e:
-            logger.warning(f"Failed to parse media size from meta tags: {e}")
-            return None, None
+        return self.compiled.media_size
     
     def get_media_size(self) -> tuple[int, int]:
         """
@@ -200,91 +423,12 @@ class HTMLFrameGenerator:
                 }
             }
         """
-        # Preset parameters that should be ignored (auto-injected by system)
-        PRESET_PARAMS = {'title', 'text', 'image', 'index'}
-        
-        # Pattern: {{param_name:type=default}} or {{param_name=default}} or {{param_name:type}} or {{param_name}}
-        # Param name: must start with letter or underscore, can contain letters, digits, underscores
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
-        
-        params = {}
-        
-        for match in re.finditer(PARAM_PATTERN, self.template):
-            param_name = match.group(1)
-            param_type = match.group(2) or 'text'  # Default to text
-            default_value = match.group(3)
-            
-            # Skip preset parameters
-            if param_name in PRESET_PARAMS:
-                continue
-            
-            # Skip if already parsed (use first occurrence)
-            if param_name in params:
-                continue
-            
-            # Validate type
-            if param_type not in {'text', 'number', 'color', 'bool'}:
-                logger.warning(f"Unknown parameter type '{param_type}' for '{param_name}', defaulting to 'text'")
-                param_type = 'text'
-            
-            # Parse default value based on type
-            parsed_default = self._parse_default_value(param_type, default_value)
-            
-            params[param_name] = {
-                'type': param_type,
-                'default': parsed_default,
-                'label': param_name,  # Use param name as label
-            }
-        
-        if params:
-            logger.debug(f"Parsed {len(params)} custom parameter(s) from template: {list(params.keys())}")
-        
-        return params
+        # Copy so callers can't mutate the shared compiled template
+        return {name: dict(config) for name, config in self.compiled.params.items()}
     
     def _parse_default_value(self, param_type: str, value_str: Optional[str]) -> Any:
-        """
-        Parse default value based on parameter type
-        
-        Args:
-            param_type: Type of parameter (text, number, color, bool)
-            value_str: String value to parse (can be None)
-        
-        Returns:
-            Parsed value with appropriate type
-        """
-        if value_str is None:
-            # No default value specified, return type-specific defaults
-            return {
-                'text': '',
-                'number': 0,
-                'color': '#000000',
-                'bool': False,
-            }.get(param_type, '')
-        
-        if param_type == 'number':
-            try:
-                # Try int first, then float
-                if '.' in value_str:
-                    return float(value_str)
-                else:
-                    return int(value_str)
-            except ValueError:
-                logger.warning(f"Invalid number value '{value_str}', using 0")
-                return 0
-        
-        elif param_type == 'bool':
-            # Accept: true/false, 1/0, yes/no, on/off (case-insensitive)
-            return value_str.lower() in {'true', '1', 'yes', 'on'}
-        
-        elif param_type == 'color':
-            # Auto-add # if missing
-            if value_str.startswith('#'):
-                return value_str
-            else:
-                return f'#{value_str}'
-        
-        else:  # text
-            return value_str
+        """Parse default value based on parameter type"""
+        return parse_default_value(param_type, value_str)
     
     def _replace_parameters(self, html: str, values: Dict[str, Any]) -> str:
         """
@@ -302,20 +446,17 @@ class HTMLFrameGenerator:
         Returns:
             HTML with placeholders replaced
         """
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
+        # Fast path: the loaded template is already compiled into chunks
+        if html is self.template:
+            return self.compiled.render(values)
         
         def replacer(match):
             param_name = match.group(1)
-            param_type = match.group(2) or 'text'
             default_value_str = match.group(3)
             
             # Check if value is provided
             if param_name in values:
-                value = values[param_name]
-                # Convert bool to string for HTML
-                if isinstance(value, bool):
-                    return 'true' if value else 'false'
-                return str(value) if value is not None else ''
+                return render_value(values[param_name])
             
             # Use default value from placeholder if available
             elif default_value_str:
@@ -325,7 +466,7 @@ class HTMLFrameGenerator:
             else:
                 return ''
         
-        return re.sub(PARAM_PATTERN, replacer, html)
+        return PARAM_PATTERN.sub(replacer, html)
     
     def _find_chrome_executable(self) -> Optional[str]:
         """
@@ -334,75 +475,13 @@ class HTMLFrameGenerator:
         Returns:
             Path to Chrome executable or None to use default
         """
-        if os.name != 'posix':
-            return None
-        
-        import subprocess
-        
-        # Preferred browsers (non-snap versions)
-        candidates = [
-            '/usr/bin/google-chrome',
-            '/usr/bin/google-chrome-stable',
-            '/usr/bin/chromium',
-            '/usr/bin/chromium-browser',
-            '/usr/local/bin/chrome',
-            '/usr/local/bin/chromium',
-        ]
-        
-        # Check each candidate
-        for path in candidates:
-            if os.path.exists(path) and os.access(path, os.X_OK):
-                try:
-                    # Verify it's not a snap by checking the path
-                    result = subprocess.run(
-                        ['readlink', '-f', path],
-                        capture_output=True,
-                        text=True,
-                        timeout=1
-                    )
-                    real_path = result.stdout.strip()
-                    
-                    if '/snap/' not in real_path:
-                        logger.info(f"✓ Found non-snap browser: {path} -> {real_path}")
-                        return path
-                    else:
-                        logger.debug(f"✗ Skipping snap browser: {path}")
-                except Exception as e:
-                    logger.debug(f"Error checking {path}: {e}")
-        
-        # Warn if no suitable browser found
-        logger.warning(
-            "⚠️  No non-snap Chrome/Chromium found. Snap browsers have AppArmor restrictions.\n"
-            "   Install system Chrome with:\n"
-            "   wget https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb\n"
-            "   sudo dpkg -i google-chrome-stable_current_amd64.deb\n"
-            "   Or install Chromium: sudo apt-get install -y chromium-browser"
-        )
-        return None
+        return find_chrome_executable()
     
     def _ensure_hti(self, width: int, height: int):
         """Lazily initialize Html2Image instance"""
         if self.hti is None:
             # Configure Chrome flags for Linux headless environment
-            custom_flags = [
-                '--default-background-color=00000000',
-                '--no-sandbox',  # Bypass AppArmor/sandbox restrictions
-                '--disable-dev-shm-usage',  # Avoid shared memory issues
-                '--disable-gpu',  # Disable GPU acceleration
-                '--disable-software-rasterizer',  # Disable software rasterizer
-                '--disable-extensions',  # Disable extensions
-                '--disable-setuid-sandbox',  # Additional sandbox bypass
-                '--disable-dbus',  # Disable DBus to avoid permission errors
-                '--hide-scrollbars',  # Hide scrollbars for cleaner output
-                '--mute-audio',  # Mute audio
-                '--disable-background-networking',  # Disable background networking
-                '--disable-features=TranslateUI',  # Disable translate UI
-                '--disable-ipc-flooding-protection',  # Improve performance
-                '--no-first-run',  # Skip first run dialogs
-                '--no-default-browser-check',  # Skip default browser check
-                '--disable-backgrounding-occluded-windows',  # Improve performance
-                '--disable-renderer-backgrounding',  # Improve performance
-            ]
+            custom_flags = list(CHROME_FLAGS)
             
             # Try to find non-snap browser
             browser_path = self._find_chrome_executable()
@@ -425,6 +504,32 @@ class HTMLFrameGenerator:
             else:
                 logger.debug(f"Initialized Html2Image with size ({width}, {height}) and {len(custom_flags)} custom flags")
     
+    async def _render_with_pool(self, html: str, output_path: str) -> bool:
+        """
+        Render HTML through the process-wide browser render pool
+        
+        Args:
+            html: HTML content with parameters already replaced
+            output_path: Target PNG path
+        
+        Returns:
+            True if the frame was written to output_path, False if the caller
+            should fall back to Html2Image
+        """
+        pool = get_render_pool()
+        if pool is None or not pool.available:
+            return False
+        
+        try:
+            png_bytes = await pool.render(html, self.width, self.height)
+        except Exception as e:
+            logger.warning(f"Render pool failed, falling back to Html2Image: {e}")
+            return False
+        
+        with open(output_path, 'wb') as f:
+            f.write(png_bytes)
+        return True
+    
     async def generate_frame(
         self,
         title: str,
@@ -494,11 +599,17 @@ class HTMLFrameGenerator:
         output_filename = os.path.basename(output_path)
         output_dir = os.path.dirname(output_path)
         
+        # Render HTML to image
+        logger.debug(f"Rendering HTML template to {output_path} (size: {self.width}x{self.height})")
+        
+        # Fast path: warm browser page from the render pool (no Chrome cold start, no crop)
+        if await self._render_with_pool(html, output_path):
+            logger.info(f"✅ Frame generated: {output_path}")
+            return output_path
+        
         # Ensure Html2Image is initialized with template's size
         self._ensure_hti(self.width, self.height)
         
-        # Render HTML to image
-        logger.debug(f"Rendering HTML template to {output_path} (size: {self.width}x{self.height})")
         try:
             self.hti.screenshot(
                 html_str=html,
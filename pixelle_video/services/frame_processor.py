@@ -20,13 +20,21 @@ Key Feature:
   to ensure perfect sync between audio and video (no padding, no trimming needed)
 """
 
+import asyncio
+import os
 from typing import Callable, Optional
 
-import httpx
 from loguru import logger
 
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig
+from pixelle_video.services.asset_cache import link_or_copy, make_cache_key
+from pixelle_video.services.downloader import get_downloader
+from pixelle_video.services.media_info import probe_media
+
+
+# Frame processing stages in execution order (names match ProgressEvent.action)
+FRAME_STAGES = ("audio", "media", "compose", "video")
 
 
 class FrameProcessor:
@@ -79,42 +87,28 @@ class FrameProcessor:
         
         try:
             # Step 1: Generate audio (TTS)
-            if not frame.audio_path:
-                if progress_callback:
-                    progress_callback(ProgressEvent(
-                        event_type="frame_step",
-                        progress=0.0,
-                        frame_current=frame_num,
-                        frame_total=total_frames,
-                        step=1,
-                        action="audio"
-                    ))
-                await self._step_generate_audio(frame, config)
-            else:
-                logger.debug(f"  1/4: Using existing audio: {frame.audio_path}")
+            if not frame.audio_path and progress_callback:
+                progress_callback(ProgressEvent(
+                    event_type="frame_step",
+                    progress=0.0,
+                    frame_current=frame_num,
+                    frame_total=total_frames,
+                    step=1,
+                    action="audio"
+                ))
+            await self.run_stage("audio", frame, storyboard, config)
             
             # Step 2: Generate media (image or video, conditional)
-            if needs_generation:
-                if progress_callback:
-                    progress_callback(ProgressEvent(
-                        event_type="frame_step",
-                        progress=0.25,
-                        frame_current=frame_num,
-                        frame_total=total_frames,
-                        step=2,
-                        action="media"
-                    ))
-                await self._step_generate_media(frame, config)
-            elif has_existing_media:
-                # Log appropriate message based on media type
-                if frame.video_path:
-                    logger.debug(f"  2/4: Using existing video: {frame.video_path}")
-                else:
-                    logger.debug(f"  2/4: Using existing image: {frame.image_path}")
-            else:
-                frame.image_path = None
-                frame.media_type = None
-                logger.debug(f"  2/4: Skipped media generation (not required by template)")
+            if needs_generation and progress_callback:
+                progress_callback(ProgressEvent(
+                    event_type="frame_step",
+                    progress=0.25,
+                    frame_current=frame_num,
+                    frame_total=total_frames,
+                    step=2,
+                    action="media"
+                ))
+            await self.run_stage("media", frame, storyboard, config)
         
             # Step 3: Compose frame (add subtitle)
             if progress_callback:
@@ -126,7 +120,7 @@ class FrameProcessor:
                     step=3,
                     action="compose"
                 ))
-            await self._step_compose_frame(frame, storyboard, config)
+            await self.run_stage("compose", frame, storyboard, config)
             
             # Step 4: Create video segment
             if progress_callback:
@@ -138,8 +132,7 @@ class FrameProcessor:
                     step=4,
                     action="video"
                 ))
-            
-            await self._step_create_video_segment(frame, config)
+            await self.run_stage("video", frame, storyboard, config)
             
             logger.info(f"✅ Frame {frame.index} completed")
             return frame
@@ -148,6 +141,170 @@ class FrameProcessor:
             logger.error(f"❌ Failed to process frame {frame.index}: {e}")
             raise
     
+    async def run_stage(
+        self,
+        stage: str,
+        frame: StoryboardFrame,
+        storyboard: 'Storyboard',
+        config: StoryboardConfig
+    ):
+        """
+        Run a single processing stage for a frame
+        
+        Stages must run in FRAME_STAGES order for a given frame, but different
+        frames may be in different stages at the same time (see FrameScheduler).
+        
+        Args:
+            stage: One of "audio", "media", "compose", "video"
+            frame: Storyboard frame to process
+            storyboard: Storyboard instance
+            config: Storyboard configuration
+        """
+        if stage == "audio":
+            if not frame.audio_path:
+                await self._step_generate_audio(frame, config)
+            else:
+                logger.debug(f"  1/4: Using existing audio: {frame.audio_path}")
+        
+        elif stage == "media":
+            # If image_path or video_path is already set (e.g. asset-based pipeline), skip generation
+            has_existing_media = frame.image_path is not None or frame.video_path is not None
+            if frame.image_prompt is not None:
+                await self._step_generate_media(frame, config)
+            elif has_existing_media:
+                # Log appropriate message based on media type
+                if frame.video_path:
+                    logger.debug(f"  2/4: Using existing video: {frame.video_path}")
+                else:
+                    logger.debug(f"  2/4: Using existing image: {frame.image_path}")
+            else:
+                frame.image_path = None
+                frame.media_type = None
+                logger.debug(f"  2/4: Skipped media generation (not required by template)")
+        
+        elif stage == "compose":
+            await self._step_compose_frame(frame, storyboard, config)
+        
+        elif stage == "video":
+            await self._step_create_video_segment(frame, config)
+        
+        else:
+            raise ValueError(f"Unknown frame stage: {stage}")
+    
+    def stage_fingerprint(
+        self,
+        stage: str,
+        frame: StoryboardFrame,
+        storyboard: 'Storyboard',
+        config: StoryboardConfig
+    ) -> str:
+        """
+        Fingerprint of everything a stage's output depends on
+        
+        Upstream fingerprints are included, so a change propagates to the
+        stages built on top of it (new audio → new segment), but not sideways:
+        editing a narration re-runs TTS, compose and encode, not media.
+        
+        Args:
+            stage: One of "audio", "media", "compose", "video"
+            frame: Storyboard frame (upstream stages already fingerprinted)
+            storyboard: Storyboard instance
+            config: Storyboard configuration
+        
+        Returns:
+            Hex digest
+        """
+        upstream = frame.fingerprints
+        
+        if stage == "audio":
+            fields = {
+                "narration": frame.narration,
+                "tts_inference_mode": config.tts_inference_mode,
+                "voice_id": config.voice_id,
+                "tts_workflow": config.tts_workflow,
+                "tts_speed": config.tts_speed,
+                "ref_audio": config.ref_audio,
+            }
+        elif stage == "media":
+            fields = {
+                "image_prompt": frame.image_prompt,
+                "media_workflow": config.media_workflow,
+                "media_width": config.media_width,
+                "media_height": config.media_height,
+            }
+            # Video workflows take their target duration from the narration audio
+            if "video_" in (config.media_workflow or "").lower():
+                fields["audio"] = upstream.get("audio")
+        elif stage == "compose":
+            fields = {
+                "index": frame.index,
+                "title": storyboard.title,
+                "narration": frame.narration,
+                "frame_template": config.frame_template,
+                "template_params": config.template_params,
+                "content_metadata": storyboard.content_metadata,
+                "media": upstream.get("media"),
+            }
+        elif stage == "video":
+            fields = {
+                "audio": upstream.get("audio"),
+                "media": upstream.get("media"),
+                "compose": upstream.get("compose"),
+                "video_fps": config.video_fps,
+                "segment_encode_mode": config.segment_encode_mode,
+                "render_mode": config.render_mode,
+            }
+        else:
+            raise ValueError(f"Unknown frame stage: {stage}")
+        
+        return make_cache_key(stage=stage, **fields)
+    
+    def has_stage_output(self, stage: str, frame: StoryboardFrame) -> bool:
+        """
+        Check that the files produced by a stage still exist (used on resume)
+        
+        Args:
+            stage: One of "audio", "media", "compose", "video"
+            frame: Storyboard frame
+        
+        Returns:
+            True if the stage doesn't need to run again
+        """
+        def exists(path: Optional[str]) -> bool:
+            return bool(path) and os.path.exists(path)
+        
+        if stage == "audio":
+            return exists(frame.audio_path)
+        if stage == "media":
+            if frame.image_path is None and frame.video_path is None:
+                return frame.image_prompt is None  # Static template: nothing to generate
+            return exists(frame.image_path or frame.video_path)
+        if stage == "compose":
+            return exists(frame.composed_image_path)
+        if stage == "video":
+            # No segment: deferred to the timeline render in post-production
+            return frame.video_segment_path is None or exists(frame.video_segment_path)
+        raise ValueError(f"Unknown frame stage: {stage}")
+    
+    def clear_stage_output(self, stage: str, frame: StoryboardFrame):
+        """
+        Forget a stale stage output, so the stage produces it again
+        
+        Only called for outputs the stage generated itself (see FrameScheduler),
+        never for user-provided assets.
+        """
+        if stage == "audio":
+            frame.audio_path = None
+        elif stage == "media":
+            if frame.image_prompt is not None:
+                frame.image_path = None
+                frame.video_path = None
+        elif stage == "compose":
+            frame.composed_image_path = None
+        elif stage == "video":
+            frame.video_segment_path = None
+        frame.fingerprints.pop(stage, None)
+    
     async def _step_generate_audio(
         self,
         frame: StoryboardFrame,
@@ -354,21 +511,23 @@ class FrameProcessor:
             # The composed_image_path contains the rendered HTML with transparent background
             temp_video_with_overlay = get_task_frame_path(config.task_id, frame.index, "video") + "_overlay.mp4"
             
-            video_service.overlay_image_on_video(
+            await video_service.overlay_image_on_video(
                 video=frame.video_path,
                 overlay_image=frame.composed_image_path,
                 output=temp_video_with_overlay,
-                scale_mode="contain"  # Scale video to fit template size (contain mode)
+                scale_mode="contain",  # Scale video to fit template size (contain mode)
+                fps=config.video_fps  # Same frame rate as image segments (concat without re-encoding)
             )
             
             # Step 2: Add narration audio to the overlaid video
             # Note: The video might have audio (replaced) or be silent (audio added)
-            segment_path = video_service.merge_audio_video(
+            segment_path = await video_service.merge_audio_video(
                 video=temp_video_with_overlay,
                 audio=frame.audio_path,
                 output=output_path,
                 replace_audio=True,  # Replace video audio with narration
-                audio_volume=1.0
+                audio_volume=1.0,
+                fps=config.video_fps
             )
             
             # Clean up temp file
@@ -379,13 +538,19 @@ class FrameProcessor:
         elif frame.media_type == "image" or frame.media_type is None:
             # Image workflow: Use composed image directly
             # The asset_default.html template includes the image in the composition
+            if config.render_mode == "timeline":
+                # Encoded together with all other frames in post-production (VideoService.render_timeline)
+                logger.debug(f"  → Deferred to timeline render")
+                return
+            
             logger.debug(f"  → Using image-based composition")
             
-            segment_path = video_service.create_video_from_image(
+            segment_path = await video_service.create_video_from_image(
                 image=frame.composed_image_path,
                 audio=frame.audio_path,
                 output=output_path,
-                fps=config.video_fps
+                fps=config.video_fps,
+                encode_mode=config.segment_encode_mode
             )
         
         else:
@@ -398,11 +563,9 @@ class FrameProcessor:
     async def _get_audio_duration(self, audio_path: str) -> float:
         """Get audio duration in seconds"""
         try:
-            # Try using ffmpeg-python
-            import ffmpeg
-            probe = ffmpeg.probe(audio_path)
-            duration = float(probe['format']['duration'])
-            return duration
+            # Cached probe (the same file is probed again by VideoService)
+            info = await asyncio.to_thread(probe_media, audio_path)
+            return info.duration
         except Exception as e:
             logger.warning(f"Failed to get audio duration: {e}, using estimate")
             # Fallback: estimate based on file size (very rough)
@@ -423,23 +586,18 @@ class FrameProcessor:
         from pixelle_video.utils.os_util import get_task_frame_path
         output_path = get_task_frame_path(task_id, frame_index, media_type)
         
-        timeout = httpx.Timeout(connect=10.0, read=60, write=60, pool=60)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+        if os.path.isfile(url):
+            # Local file (e.g. from the media cache): hardlink into the task folder when possible
+            return await asyncio.to_thread(link_or_copy, url, output_path)
         
-        return output_path
+        # Streamed to disk through the shared client (no full copy in memory)
+        return await get_downloader().download(url, output_path)
     
     async def _get_video_duration(self, video_path: str) -> float:
         """Get video duration in seconds"""
         try:
-            import ffmpeg
-            probe = ffmpeg.probe(video_path)
-            duration = float(probe['format']['duration'])
-            return duration
+            info = await asyncio.to_thread(probe_media, video_path)
+            return info.duration
         except Exception as e:
             logger.warning(f"Failed to get video duration: {e}, using audio duration")
             # Fallback: use audio duration if available
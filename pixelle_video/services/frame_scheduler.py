@@ -0,0 +1,251 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Frame scheduler - Pipelined frame production with per-stage concurrency limits
+
+Stages: TTS (audio) → media → compose → encode (video)
+
+Each stage has its own bounded queue and worker count, so frame N can be
+encoding while frame N+1 is being composed and frame N+2 waits on ComfyUI.
+A single frame still passes through the stages in order.
+
+Finished stages are recorded in StoryboardFrame.completed_stages together with a
+fingerprint of their inputs, so a resumed or re-rendered run only redoes stages
+whose inputs changed or whose output is missing.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from pixelle_video.models.progress import ProgressEvent
+from pixelle_video.models.storyboard import Storyboard, StoryboardConfig, StoryboardFrame
+from pixelle_video.services.frame_processor import FRAME_STAGES
+
+
+def is_runninghub_workflow(workflow: Optional[str]) -> bool:
+    """Check if a workflow key points to RunningHub"""
+    return bool(workflow and workflow.startswith("runninghub/"))
+
+
+@dataclass
+class StageSpec:
+    """Stage definition for FrameScheduler"""
+    name: str                                  # Stage name (one of FRAME_STAGES)
+    workers: int                               # Number of concurrent workers
+    limiter: Optional[asyncio.Semaphore] = None  # Optional limiter shared with other stages
+
+
+class FrameScheduler:
+    """
+    Staged producer/consumer scheduler for frame production
+
+    Usage:
+        >>> scheduler = FrameScheduler.from_config(core.frame_processor, config)
+        >>> await scheduler.run(storyboard, config, progress_callback=callback)
+    """
+
+    def __init__(self, frame_processor, stages: List[StageSpec], queue_size: int = 4):
+        """
+        Initialize scheduler
+
+        Args:
+            frame_processor: FrameProcessor instance (provides run_stage)
+            stages: Stage specs in FRAME_STAGES order
+            queue_size: Max frames waiting in front of each stage
+        """
+        self.frame_processor = frame_processor
+        self.stages = stages
+        self.queue_size = queue_size
+
+    @classmethod
+    def from_config(cls, frame_processor, config: StoryboardConfig) -> "FrameScheduler":
+        """
+        Build scheduler from pipeline.concurrency settings in config.yaml
+
+        RunningHub stages use runninghub_concurrent_limit and share one limiter,
+        since the limit applies to the whole account.
+        """
+        from pixelle_video.config import config_manager
+        app_config = config_manager.config
+        concurrency = app_config.pipeline.concurrency
+
+        runninghub_limit = app_config.comfyui.runninghub_concurrent_limit or 1
+        runninghub_limiter = asyncio.Semaphore(runninghub_limit)
+
+        if is_runninghub_workflow(config.tts_workflow):
+            tts_stage = StageSpec("audio", runninghub_limit, runninghub_limiter)
+        elif config.tts_inference_mode == "local":
+            tts_stage = StageSpec("audio", concurrency.tts_local)
+        else:
+            tts_stage = StageSpec("audio", concurrency.tts_selfhost)
+
+        if is_runninghub_workflow(config.media_workflow):
+            media_stage = StageSpec("media", runninghub_limit, runninghub_limiter)
+        else:
+            media_stage = StageSpec("media", concurrency.media_selfhost)
+
+        stages = [
+            tts_stage,
+            media_stage,
+            StageSpec("compose", concurrency.compose),
+            StageSpec("video", concurrency.encode),
+        ]
+        return cls(frame_processor, stages, queue_size=app_config.pipeline.queue_size)
+
+    def describe(self) -> str:
+        """Human-readable stage layout for logs"""
+        return " → ".join(f"{stage.name}×{stage.workers}" for stage in self.stages)
+
+    async def run(
+        self,
+        storyboard: Storyboard,
+        config: StoryboardConfig,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        base_progress: float = 0.2,
+        progress_range: float = 0.6,
+        on_stage_complete: Optional[Callable[[StoryboardFrame, str], Awaitable[None]]] = None,
+        on_frame_complete: Optional[Callable[[StoryboardFrame], Awaitable[None]]] = None
+    ) -> List[StoryboardFrame]:
+        """
+        Process all storyboard frames through the stages
+
+        Frames are updated in place. Progress is derived from the set of
+        completed (frame, stage) pairs and reported when a stage starts.
+
+        Args:
+            storyboard: Storyboard whose frames are processed
+            config: Storyboard configuration
+            progress_callback: Optional callback receiving ProgressEvent
+            base_progress: Overall progress at start of frame production
+            progress_range: Share of overall progress for frame production
+            on_stage_complete: Optional async callback (frame, stage) after a stage
+                finishes, e.g. to checkpoint the storyboard
+            on_frame_complete: Optional async callback (frame) once a frame is through
+                all stages (built or already up to date), e.g. to publish a preview
+
+        Returns:
+            Processed frames (same objects, in storyboard order)
+
+        Raises:
+            Exception: First error raised by any stage (remaining work is cancelled)
+        """
+        frames = storyboard.frames
+        total_frames = len(frames)
+        if not frames:
+            return frames
+
+        stage_names = [stage.name for stage in self.stages]
+        if tuple(stage_names) != FRAME_STAGES:
+            raise ValueError(f"Stages must be {FRAME_STAGES}, got {tuple(stage_names)}")
+
+        completed: Set[Tuple[int, str]] = set()
+        total_units = total_frames * len(self.stages)
+        queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+
+        def report(frame: StoryboardFrame, stage_index: int):
+            if not progress_callback:
+                return
+            progress_callback(ProgressEvent(
+                event_type="frame_step",
+                progress=base_progress + progress_range * (len(completed) / total_units),
+                frame_current=frame.index + 1,
+                frame_total=total_frames,
+                step=stage_index + 1,
+                action=self.stages[stage_index].name
+            ))
+
+        async def worker(stage_index: int):
+            stage = self.stages[stage_index]
+            queue = queues[stage_index]
+            next_queue = queues[stage_index + 1] if stage_index + 1 < len(queues) else None
+
+            while True:
+                frame = await queue.get()
+                if frame is None:
+                    return
+
+                fingerprint = self.frame_processor.stage_fingerprint(stage.name, frame, storyboard, config)
+                if (
+                    stage.name in frame.completed_stages
+                    and frame.fingerprints.get(stage.name) == fingerprint
+                    and self.frame_processor.has_stage_output(stage.name, frame)
+                ):
+                    logger.debug(f"  Frame {frame.index + 1}: {stage.name} is up to date, skipping")
+                    completed.add((frame.index, stage.name))
+                    if next_queue is not None:
+                        await next_queue.put(frame)
+                    elif on_frame_complete is not None:
+                        await on_frame_complete(frame)
+                    continue
+
+                if stage.name in frame.completed_stages:
+                    # Stale output from an earlier run: build it again (stages that
+                    # depend on it see a new upstream fingerprint and follow)
+                    self.frame_processor.clear_stage_output(stage.name, frame)
+                    frame.completed_stages.remove(stage.name)
+
+                report(frame, stage_index)
+                try:
+                    if stage.limiter is not None:
+                        async with stage.limiter:
+                            await self.frame_processor.run_stage(stage.name, frame, storyboard, config)
+                    else:
+                        await self.frame_processor.run_stage(stage.name, frame, storyboard, config)
+                except Exception as e:
+                    logger.error(f"❌ Failed to process frame {frame.index} ({stage.name}): {e}")
+                    raise
+
+                completed.add((frame.index, stage.name))
+                frame.fingerprints[stage.name] = fingerprint
+                frame.completed_stages.append(stage.name)
+                if on_stage_complete is not None:
+                    await on_stage_complete(frame, stage.name)
+
+                if next_queue is not None:
+                    await next_queue.put(frame)
+                else:
+                    logger.info(f"✅ Frame {frame.index + 1} completed ({frame.duration:.2f}s)")
+                    if on_frame_complete is not None:
+                        await on_frame_complete(frame)
+
+        async def run_stage(stage_index: int):
+            await asyncio.gather(*(worker(stage_index) for _ in range(self.stages[stage_index].workers)))
+            # Stage drained: stop the next stage's workers once they catch up
+            if stage_index + 1 < len(self.stages):
+                for _ in range(self.stages[stage_index + 1].workers):
+                    await queues[stage_index + 1].put(None)
+
+        async def feed():
+            for frame in frames:
+                await queues[0].put(frame)
+            for _ in range(self.stages[0].workers):
+                await queues[0].put(None)
+
+        tasks = [asyncio.create_task(feed())]
+        tasks += [asyncio.create_task(run_stage(i)) for i in range(len(self.stages))]
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return frames
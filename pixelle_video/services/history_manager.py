@@ -33,17 +33,20 @@ class HistoryManager:
     - Task detail retrieval
     - Task duplication (for re-generation)
     - Task deletion
-    - Future: Frame regeneration, export, etc.
+    - Frame regeneration (incremental re-render)
+    - Future: Export, etc.
     """
     
-    def __init__(self, persistence: PersistenceService):
+    def __init__(self, persistence: PersistenceService, core=None):
         """
         Initialize history manager
         
         Args:
             persistence: PersistenceService instance
+            core: PixelleVideoCore instance (required for frame regeneration)
         """
         self.persistence = persistence
+        self.core = core
     
     async def get_task_list(
         self,
@@ -171,10 +174,6 @@ class HistoryManager:
         """Rebuild task index (useful for maintenance or after manual changes)"""
         await self.persistence.rebuild_index()
     
-    # ========================================================================
-    # Future Extensions (Phase 3)
-    # ========================================================================
-    
     async def regenerate_frame(
         self,
         task_id: str,
@@ -182,26 +181,34 @@ class HistoryManager:
         **override_params
     ) -> Optional[str]:
         """
-        Regenerate a specific frame (FUTURE FEATURE)
+        Regenerate a specific frame and re-render the video
+        
+        Only the frame artifacts affected by the overrides are rebuilt (a new
+        narration re-runs TTS, compose and encode; a new image prompt re-runs
+        media, compose and encode), then the video is concatenated again.
         
         Args:
             task_id: Original task ID
             frame_index: Frame index to regenerate (0-based)
-            **override_params: Parameters to override (image_prompt, style, etc.)
+            **override_params: Frame fields to override (narration, image_prompt)
         
         Returns:
-            New frame image path or None if failed
+            New final video path or None if failed
+        """
+        if self.core is None:
+            logger.error("regenerate_frame requires HistoryManager to be created with core")
+            return None
         
-        TODO: Implement in Phase 3
-        - Load original storyboard
-        - Get frame parameters
-        - Override with new parameters
-        - Call image generation service
-        - Update storyboard
-        - Re-composite video
-        """
-        logger.warning("regenerate_frame is not implemented yet (Phase 3 feature)")
-        return None
+        try:
+            result = await self.core.rerender(task_id, frame_updates={frame_index: override_params})
+            return result.video_path
+        except Exception as e:
+            logger.error(f"Failed to regenerate frame {frame_index} of task {task_id}: {e}")
+            return None
+    
+    # ========================================================================
+    # Future Extensions (Phase 3)
+    # ========================================================================
     
     async def export_task(self, task_id: str, export_path: str) -> Optional[str]:
         """
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Live Preview - HLS playlist that grows while frames are produced
+
+Each finished frame segment is remuxed (stream copy, no re-encode) into an
+MPEG-TS chunk under output/{task_id}/preview/, and index.m3u8 lists the
+chunks that are ready, in storyboard order. HLS players (Safari, hls.js,
+ExoPlayer, ...) can start playing after the first frame while the rest is
+still rendering. The final video (concat + BGM) is still produced at the end.
+
+Frame durations are not known when the playlist is first written (TTS runs
+alongside), so the target duration is a fixed cap and frames longer than it
+are split at keyframes into several chunks.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.models.storyboard import StoryboardFrame
+from pixelle_video.services.video import VideoService
+from pixelle_video.utils.os_util import get_task_path
+
+PREVIEW_DIR = "preview"
+PLAYLIST_NAME = "index.m3u8"
+DEFAULT_TARGET_DURATION = 10  # seconds (EXT-X-TARGETDURATION)
+
+
+def get_preview_playlist_path(task_id: str) -> str:
+    """
+    Get the live preview playlist path of a task
+
+    Example:
+        >>> get_preview_playlist_path("20251028_143052_ab3d")
+        >>> # Returns: ".../output/20251028_143052_ab3d/preview/index.m3u8"
+    """
+    return get_task_path(task_id, PREVIEW_DIR, PLAYLIST_NAME)
+
+
+class LivePreview:
+    """
+    Progressive HLS preview of a task's frame segments
+
+    The playlist (type EVENT) only lists the leading frames that are all
+    ready, so frames finishing out of order never leave gaps. It ends with
+    EXT-X-ENDLIST once every frame is in. Each frame starts its own
+    timeline, hence EXT-X-DISCONTINUITY between frames. EXT-X-TARGETDURATION
+    is set once and never changes, as HLS requires.
+
+    Usage:
+        >>> preview = LivePreview(task_id, [frame.index for frame in storyboard.frames])
+        >>> await preview.add_frame(frame)  # After the frame's segment is encoded
+        >>> preview.playlist_path
+    """
+
+    def __init__(self, task_id: str, frame_indices: List[int], target_duration: int = DEFAULT_TARGET_DURATION):
+        """
+        Initialize live preview (any preview from an earlier run is removed)
+
+        Args:
+            task_id: Task ID (preview is written to output/{task_id}/preview/)
+            frame_indices: Frame indices in playback order
+            target_duration: Max chunk duration in seconds (EXT-X-TARGETDURATION)
+        """
+        self.preview_dir = Path(get_task_path(task_id, PREVIEW_DIR))
+        self.playlist_path = str(self.preview_dir / PLAYLIST_NAME)
+        self.target_duration = target_duration
+        self._order = list(frame_indices)
+        self._chunks: Dict[int, List[Tuple[str, float]]] = {}  # frame index -> [(chunk filename, duration)]
+        self._video_service = VideoService()
+
+        shutil.rmtree(self.preview_dir, ignore_errors=True)
+        self.preview_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def ready_frames(self) -> int:
+        """Number of leading frames listed in the playlist"""
+        return len(self._ready_chunks())
+
+    async def add_frame(self, frame: StoryboardFrame) -> Optional[str]:
+        """
+        Publish a frame's video segment
+
+        Frames without a segment (e.g. deferred to the timeline render) are
+        ignored. Failures are logged, never raised: the preview must not fail
+        the video generation.
+
+        Returns:
+            Playlist path if the frame was added, None otherwise
+        """
+        if not frame.video_segment_path or frame.index in self._chunks:
+            return None
+
+        chunk_path = str(self.preview_dir / f"{frame.index + 1:02d}.ts")
+        try:
+            chunks = [
+                (os.path.basename(path), duration)
+                for path, duration in await self._video_service.remux_to_ts(
+                    frame.video_segment_path, chunk_path, max_duration=self.target_duration
+                )
+            ]
+        except Exception as e:
+            logger.warning(f"Live preview: failed to add frame {frame.index + 1}: {e}")
+            return None
+
+        # Only possible if the segment has no keyframe within target_duration
+        longest = max(duration for _, duration in chunks)
+        if round(longest) > self.target_duration:
+            logger.warning(
+                f"Live preview: frame {frame.index + 1} has a {longest:.1f}s chunk "
+                f"(target duration {self.target_duration}s), players may stall"
+            )
+
+        self._chunks[frame.index] = chunks
+        self._write_playlist()
+        return self.playlist_path
+
+    def _ready_chunks(self) -> List[List[Tuple[str, float]]]:
+        """Chunks of the leading frames that are all ready, grouped by frame"""
+        ready = []
+        for index in self._order:
+            if index not in self._chunks:
+                break
+            ready.append(self._chunks[index])
+        return ready
+
+    def _write_playlist(self):
+        """Rewrite index.m3u8 atomically (players may be polling it)"""
+        chunks = self._ready_chunks()
+        if not chunks:
+            return
+
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{self.target_duration}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+        ]
+        for i, frame_chunks in enumerate(chunks):
+            if i > 0:
+                lines.append("#EXT-X-DISCONTINUITY")
+            for chunk_name, duration in frame_chunks:
+                lines.append(f"#EXTINF:{duration:.3f},")
+                lines.append(chunk_name)
+        if len(chunks) == len(self._order):
+            lines.append("#EXT-X-ENDLIST")
+
+        temp_path = f"{self.playlist_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, self.playlist_path)
+        logger.debug(f"Live preview: {len(chunks)}/{len(self._order)} frames ready")
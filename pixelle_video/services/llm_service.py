@@ -14,19 +14,169 @@
 LLM (Large Language Model) Service - Direct OpenAI SDK implementation
 
 Supports structured output via response_type parameter (Pydantic model).
+
+Clients are pooled per (api_key, base_url) so consecutive calls reuse
+keep-alive connections. Each provider (base_url) has a process-wide
+concurrency limit and token-bucket rate limiter, and every call is recorded
+in LLMMetrics.
 """
 
+import asyncio
 import json
 import re
-from typing import Optional, Type, TypeVar, Union
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional, Tuple, Type, TypeVar, Union
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from pydantic import BaseModel
 from loguru import logger
 
+from pixelle_video.utils.async_util import SlotPool
+
 
 T = TypeVar("T", bound=BaseModel)
 
+# Idle keep-alive connections are dropped after this many seconds
+KEEPALIVE_EXPIRY = 60.0
+
+
+@dataclass
+class LLMCallMetrics:
+    """Latency and token usage of one LLM call"""
+    model: str
+    base_url: str
+    latency: float                     # Seconds spent in the API request
+    wait: float = 0.0                  # Seconds queued behind the provider limits
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    success: bool = True
+
+
+@dataclass
+class _ModelStats:
+    calls: int = 0
+    failures: int = 0
+    latency: float = 0.0
+    wait: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+
+class LLMMetrics:
+    """
+    Aggregated LLM call metrics (per model, thread-safe)
+
+    Usage:
+        >>> pixelle_video.llm.metrics.snapshot()
+        {'calls': 12, 'failures': 0, 'avg_latency': 1.8, ..., 'models': {...}}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[str, _ModelStats] = {}
+
+    def record(self, call: LLMCallMetrics):
+        with self._lock:
+            stats = self._models.setdefault(call.model, _ModelStats())
+            stats.calls += 1
+            stats.failures += 0 if call.success else 1
+            stats.latency += call.latency
+            stats.wait += call.wait
+            stats.prompt_tokens += call.prompt_tokens or 0
+            stats.completion_tokens += call.completion_tokens or 0
+            stats.total_tokens += call.total_tokens or 0
+
+    def snapshot(self) -> dict:
+        """Totals and per-model stats (average latency/wait in seconds)"""
+        with self._lock:
+            models = {model: self._summarize(stats) for model, stats in self._models.items()}
+            total = _ModelStats()
+            for stats in self._models.values():
+                for name, value in asdict(stats).items():
+                    setattr(total, name, getattr(total, name) + value)
+        return {**self._summarize(total), "models": models}
+
+    def reset(self):
+        with self._lock:
+            self._models.clear()
+
+    @staticmethod
+    def _summarize(stats: _ModelStats) -> dict:
+        return {
+            "calls": stats.calls,
+            "failures": stats.failures,
+            "avg_latency": round(stats.latency / stats.calls, 3) if stats.calls else 0.0,
+            "avg_wait": round(stats.wait / stats.calls, 3) if stats.calls else 0.0,
+            "prompt_tokens": stats.prompt_tokens,
+            "completion_tokens": stats.completion_tokens,
+            "total_tokens": stats.total_tokens,
+        }
+
+
+class RateLimiter:
+    """
+    Token bucket: up to `burst` requests at once, refilled at requests_per_minute
+
+    Shared by all event loops of the process: a request reserves its token
+    under a threading lock and sleeps until the token is due.
+
+    Usage:
+        >>> limiter = RateLimiter(requests_per_minute=60, burst=4)
+        >>> await limiter.acquire()
+    """
+
+    def __init__(self, requests_per_minute: int, burst: int = 1):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Tokens go negative while requests are queued: each waits its turn
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if not delay:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Give the reserved token back
+            with self._lock:
+                self._tokens += 1
+            raise
+
+
+@dataclass
+class _ProviderLimits:
+    """Per-provider limits shared by all clients and event loops talking to one base_url"""
+    settings: tuple
+    slots: SlotPool
+    rate_limiter: Optional[RateLimiter] = None
+
+
+@dataclass
+class _LoopPool:
+    """Clients owned by one event loop"""
+    settings: tuple
+    clients: Dict[Tuple[str, str], AsyncOpenAI] = field(default_factory=dict)
+
+
+# Live services, so the web UI can close their clients before a loop ends
+_services: "weakref.WeakSet[LLMService]" = weakref.WeakSet()
+
 
 class LLMService:
     """
@@ -43,6 +193,11 @@ class LLMService:
     - Ollama (llama3.2, qwen2.5, mistral, codellama) - FREE & LOCAL!
     - Any custom provider with OpenAI-compatible API
     
+    Clients are kept per event loop (Streamlit runs each action in a fresh
+    loop and httpx connections can't move between loops) and rebuilt when
+    the llm section of the config changes. Provider limits are process-wide,
+    so the concurrency and rate limits hold across the API and web loops.
+    
     Usage:
         # Direct call
         answer = await pixelle_video.llm("Explain atomic habits")
@@ -53,6 +208,10 @@ class LLMService:
             temperature=0.7,
             max_tokens=2000
         )
+        
+        # Metrics
+        print(pixelle_video.llm.last_call)  # Latest call in this task
+        print(pixelle_video.llm.metrics.snapshot())
     """
     
     def __init__(self, config: dict):
@@ -64,7 +223,14 @@ class LLMService:
         """
         # Note: We no longer cache config here to support hot reload
         # Config is read dynamically from config_manager in _get_config_value()
-        self._client: Optional[AsyncOpenAI] = None
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._limits: Dict[str, _ProviderLimits] = {}
+        self._limits_lock = threading.Lock()
+        self._last_call: ContextVar[Optional[LLMCallMetrics]] = ContextVar("llm_last_call", default=None)
+        self.metrics = LLMMetrics()
+        _services.add(self)
     
     def _get_config_value(self, key: str, default=None):
         """
@@ -80,20 +246,20 @@ class LLMService:
         from pixelle_video.config import config_manager
         return getattr(config_manager.config.llm, key, default)
     
-    def _create_client(
+    def _resolve_client_key(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-    ) -> AsyncOpenAI:
+    ) -> Tuple[str, str]:
         """
-        Create OpenAI client
+        Resolve (api_key, base_url) for a call
         
         Args:
             api_key: API key (optional, uses config if not provided)
             base_url: Base URL (optional, uses config if not provided)
         
         Returns:
-            AsyncOpenAI client instance
+            (api_key, base_url) tuple, base_url is "" for the SDK default
         """
         # Get API key (priority: parameter > config)
         final_api_key = (
@@ -106,15 +272,161 @@ class LLMService:
         final_base_url = (
             base_url
             or self._get_config_value("base_url")
+            or ""
         )
         
-        # Create client
-        client_kwargs = {"api_key": final_api_key}
-        if final_base_url:
-            client_kwargs["base_url"] = final_base_url
+        return final_api_key, final_base_url
+    
+    async def _get_pool(self) -> _LoopPool:
+        """Get the current loop's pool, rebuilding it when the llm config changed"""
+        from pixelle_video.config import config_manager
+        llm_config = config_manager.config.llm
+        settings = (
+            llm_config.api_key,
+            llm_config.base_url,
+            llm_config.max_concurrency,
+        )
+        
+        loop = asyncio.get_running_loop()
+        self._drop_stale_pools()
+        pool = self._pools.get(loop)
+        if pool is not None and pool.settings != settings:
+            logger.info("🔄 LLM configuration changed, recreating clients...")
+            await self._close_pool(pool)
+            pool = None
+        if pool is None:
+            pool = _LoopPool(settings=settings)
+            self._pools[loop] = pool
+        return pool
+    
+    def _drop_stale_pools(self):
+        """Forget pools whose loop ended without close() (they can't be closed from another loop)"""
+        for loop in [loop for loop in list(self._pools.keys()) if loop.is_closed()]:
+            pool = self._pools.pop(loop, None)
+            if pool is not None and pool.clients:
+                logger.warning("LLM clients of a finished event loop were not closed, dropping them")
+    
+    def _get_limits(self, base_url: str) -> _ProviderLimits:
+        """Get the process-wide limits of a provider, rebuilding them when the limit settings changed"""
+        max_concurrency = self._get_config_value("max_concurrency", 4)
+        requests_per_minute = self._get_config_value("requests_per_minute", 0)
+        settings = (max_concurrency, requests_per_minute)
+        
+        with self._limits_lock:
+            limits = self._limits.get(base_url)
+            if limits is None or limits.settings != settings:
+                limits = _ProviderLimits(
+                    settings=settings,
+                    slots=SlotPool(max_concurrency),
+                    rate_limiter=RateLimiter(requests_per_minute, burst=max_concurrency) if requests_per_minute else None,
+                )
+                self._limits[base_url] = limits
+        return limits
+    
+    def _create_client(self, api_key: str, base_url: str) -> AsyncOpenAI:
+        """
+        Create a pooled OpenAI client
+        
+        Args:
+            api_key: API key
+            base_url: Base URL ("" for the SDK default)
+        
+        Returns:
+            AsyncOpenAI client instance with keep-alive connection limits
+        """
+        max_concurrency = self._get_config_value("max_concurrency", 4)
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency * 2,
+                max_keepalive_connections=max_concurrency,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        
+        client_kwargs = {"api_key": api_key, "http_client": http_client}
+        if base_url:
+            client_kwargs["base_url"] = base_url
         
         return AsyncOpenAI(**client_kwargs)
     
+    async def _get_client(self, api_key: str, base_url: str) -> Tuple[AsyncOpenAI, _ProviderLimits]:
+        """Get the pooled client for (api_key, base_url) and its provider limits"""
+        pool = await self._get_pool()
+        
+        client = pool.clients.get((api_key, base_url))
+        if client is None or client.is_closed():
+            client = self._create_client(api_key, base_url)
+            pool.clients[(api_key, base_url)] = client
+        
+        return client, self._get_limits(base_url)
+    
+    async def _close_pool(self, pool: _LoopPool):
+        for client in pool.clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close LLM client: {e}")
+        pool.clients.clear()
+    
+    async def close(self):
+        """
+        Close the pooled clients of the current event loop
+        
+        Clients are bound to their loop, so each loop closes its own before it
+        ends (core cleanup, run_async in the web UI).
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._pools.pop(loop, None)
+        if pool is not None:
+            await self._close_pool(pool)
+        self._drop_stale_pools()
+    
+    @property
+    def last_call(self) -> Optional[LLMCallMetrics]:
+        """Metrics of the latest call made from the current task (None if none yet)"""
+        return self._last_call.get()
+    
+    async def _create_completion(
+        self,
+        client: AsyncOpenAI,
+        limits: _ProviderLimits,
+        model: str,
+        **kwargs
+    ):
+        """Send one chat completion request within the provider limits and record its metrics"""
+        queued_at = time.monotonic()
+        async with limits.slots:
+            if limits.rate_limiter is not None:
+                await limits.rate_limiter.acquire()
+            started_at = time.monotonic()
+            
+            call = LLMCallMetrics(
+                model=model,
+                base_url=str(client.base_url),
+                latency=0.0,
+                wait=started_at - queued_at,
+            )
+            try:
+                response = await client.chat.completions.create(model=model, **kwargs)
+            except BaseException:
+                call.success = False
+                raise
+            else:
+                usage = getattr(response, "usage", None)
+                if usage is not None:
+                    call.prompt_tokens = usage.prompt_tokens
+                    call.completion_tokens = usage.completion_tokens
+                    call.total_tokens = usage.total_tokens
+                return response
+            finally:
+                call.latency = time.monotonic() - started_at
+                self.metrics.record(call)
+                self._last_call.set(call)
+                logger.debug(
+                    f"LLM call metrics: model={model}, latency={call.latency:.2f}s, wait={call.wait:.2f}s, "
+                    f"tokens={call.prompt_tokens}+{call.completion_tokens}"
+                )
+    
     async def __call__(
         self,
         prompt: str,
@@ -159,8 +471,8 @@ class LLMService:
             )
             print(review.title)  # Structured access
         """
-        # Create client (new instance each time to support parameter overrides)
-        client = self._create_client(api_key=api_key, base_url=base_url)
+        # Pooled client (one per api_key/base_url, reused across calls)
+        client, limits = await self._get_client(*self._resolve_client_key(api_key=api_key, base_url=base_url))
         
         # Get model (priority: parameter > config)
         final_model = (
@@ -176,6 +488,7 @@ class LLMService:
                 # Structured output mode - try beta.chat.completions.parse first
                 return await self._call_with_structured_output(
                     client=client,
+                    limits=limits,
                     model=final_model,
                     prompt=prompt,
                     response_type=response_type,
@@ -185,7 +498,9 @@ class LLMService:
                 )
             else:
                 # Standard text output mode
-                response = await client.chat.completions.create(
+                response = await self._create_completion(
+                    client,
+                    limits,
                     model=final_model,
                     messages=[{"role": "user", "content": prompt}],
                     temperature=temperature,
@@ -205,6 +520,7 @@ class LLMService:
     async def _call_with_structured_output(
         self,
         client: AsyncOpenAI,
+        limits: _ProviderLimits,
         model: str,
         prompt: str,
         response_type: Type[T],
@@ -220,6 +536,7 @@ class LLMService:
         
         Args:
             client: OpenAI client
+            limits: Provider limits for the client
             model: Model name
             prompt: The prompt
             response_type: Pydantic model class
@@ -235,7 +552,9 @@ class LLMService:
         enhanced_prompt = f"{prompt}\n\n{json_schema_instruction}"
         
         # Call LLM with enhanced prompt
-        response = await client.chat.completions.create(
+        response = await self._create_completion(
+            client,
+            limits,
             model=model,
             messages=[{"role": "user", "content": enhanced_prompt}],
             temperature=temperature,
@@ -338,3 +657,8 @@ You MUST respond with ONLY a valid JSON object (no markdown, no extra text)."""
         base_url = self._get_config_value("base_url", "default")
         return f"<LLMService model={model!r} base_url={base_url!r}>"
 
+
+async def close_llm_clients():
+    """Close the current event loop's pooled clients of every LLMService"""
+    for service in list(_services):
+        await service.close()
@@ -17,12 +17,18 @@ Supports both image and video generation workflows.
 Automatically detects output type based on ExecuteResult.
 """
 
+import os
+import shutil
+from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 
 from comfykit import ComfyKit
 from loguru import logger
 
+from pixelle_video.services.asset_cache import get_media_cache, make_cache_key
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.services.downloader import get_downloader
 from pixelle_video.models.media import MediaResult
 
 
@@ -33,6 +39,9 @@ class MediaService(ComfyBaseService):
     Uses ComfyKit to execute image/video generation workflows.
     Supports both image_ and video_ workflow prefixes.
     
+    With cache.media_enabled, results are cached on disk by prompt, workflow
+    and sampling parameters, and MediaResult.url is the cached local file.
+    
     Usage:
         # Use default workflow (workflows/image_flux.json)
         media = await pixelle_video.media(prompt="a cat")
@@ -51,7 +60,7 @@ class MediaService(ComfyBaseService):
         workflows = pixelle_video.media.list_workflows()
     """
     
-    WORKFLOW_PREFIX = ""  # Will be overridden by _scan_workflows
+    WORKFLOW_PREFIX = ""  # Will be overridden by _workflow_prefixes
     DEFAULT_WORKFLOW = None  # No hardcoded default, must be configured
     WORKFLOWS_DIR = "workflows"
     
@@ -65,47 +74,13 @@ class MediaService(ComfyBaseService):
         """
         super().__init__(config, service_name="image", core=core)  # Keep "image" for config compatibility
     
-    def _scan_workflows(self):
+    def _workflow_prefixes(self):
         """
-        Scan workflows for both image_ and video_ prefixes
+        Media workflows use both image_ and video_ prefixes
         
         Override parent method to support multiple prefixes
         """
-        from pixelle_video.utils.os_util import list_resource_dirs, list_resource_files, get_resource_path
-        from pathlib import Path
-        
-        workflows = []
-        
-        # Get all workflow source directories
-        source_dirs = list_resource_dirs("workflows")
-        
-        if not source_dirs:
-            logger.warning("No workflow source directories found")
-            return workflows
-        
-        # Scan each source directory for workflow files
-        for source_name in source_dirs:
-            # Get all JSON files for this source
-            workflow_files = list_resource_files("workflows", source_name)
-            
-            # Filter to only files matching image_ or video_ prefix
-            matching_files = [
-                f for f in workflow_files 
-                if (f.startswith("image_") or f.startswith("video_")) and f.endswith('.json')
-            ]
-            
-            for filename in matching_files:
-                try:
-                    # Get actual file path
-                    file_path = Path(get_resource_path("workflows", source_name, filename))
-                    workflow_info = self._parse_workflow_file(file_path, source_name)
-                    workflows.append(workflow_info)
-                    logger.debug(f"Found workflow: {workflow_info['key']}")
-                except Exception as e:
-                    logger.error(f"Failed to parse workflow {source_name}/{filename}: {e}")
-        
-        # Sort by key (source/name)
-        return sorted(workflows, key=lambda w: w["key"])
+        return ("image_", "video_")
     
     async def __call__(
         self,
@@ -225,7 +200,56 @@ class MediaService(ComfyBaseService):
         
         logger.debug(f"Workflow parameters: {workflow_params}")
         
-        # 4. Execute workflow using shared ComfyKit instance from core
+        # 3. Serve from the generated media cache (opt-in)
+        cache = get_media_cache()
+        if cache is None:
+            return await self._execute_workflow(workflow_info, workflow_params, media_type)
+        
+        # "index" only numbers outputs inside the workflow, it doesn't change the result
+        cache_params = {k: v for k, v in workflow_params.items() if k != "index"}
+        key = make_cache_key(workflow=workflow_info["key"], media_type=media_type, **cache_params)
+        
+        uncached: Optional[MediaResult] = None
+        
+        async def generate() -> str:
+            nonlocal uncached
+            result = uncached = await self._execute_workflow(workflow_info, workflow_params, media_type)
+            default_ext = ".mp4" if media_type == "video" else ".png"
+            ext = Path(urlparse(result.url).path).suffix or default_ext
+            return await self._fetch_to(result.url, cache.temp_path(ext))
+        
+        entry = await cache.get_or_create_entry(
+            key,
+            generate,
+            extra={"media_type": media_type, "prompt": prompt[:200]}
+        )
+        if entry is None:
+            # Output could not be stored locally: serve the workflow result as is
+            logger.warning(f"Media cache could not store the {media_type} output, using it uncached")
+            return uncached or await self._execute_workflow(workflow_info, workflow_params, media_type)
+        
+        duration = None
+        if media_type == "video" and entry.get("probe"):
+            duration = float(entry["probe"].get("format", {}).get("duration") or 0) or None
+        
+        return MediaResult(media_type=media_type, url=entry["path"], duration=duration)
+    
+    async def _fetch_to(self, url: str, output_path: str) -> str:
+        """Save a workflow output (URL or local path) to output_path"""
+        if os.path.isfile(url):
+            shutil.copyfile(url, output_path)
+            return output_path
+        
+        return await get_downloader().download(url, output_path)
+    
+    async def _execute_workflow(
+        self,
+        workflow_info: dict,
+        workflow_params: dict,
+        media_type: str
+    ) -> MediaResult:
+        """Execute workflow and extract the generated media from the result"""
+        # Execute workflow using shared ComfyKit instance from core
         try:
             # Get shared ComfyKit instance (lazy initialization + config hot-reload)
             kit = await self.core._get_or_create_comfykit()
@@ -242,7 +266,7 @@ class MediaService(ComfyBaseService):
             
             result = await kit.execute(workflow_input, workflow_params)
             
-            # 5. Handle result based on specified media_type
+            # Handle result based on specified media_type
             if result.status != "completed":
                 error_msg = result.msg or "Unknown error"
                 logger.error(f"Media generation failed: {error_msg}")
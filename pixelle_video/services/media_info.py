@@ -0,0 +1,159 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Media probe service - One ffprobe call per file version
+
+Duration, streams, dimensions and frame rate come from a single probe and
+are cached by (path, size, mtime), so VideoService, FrameProcessor and the
+pipelines can ask for them repeatedly without forking ffprobe each time.
+A file rewritten in place gets a new size/mtime and is probed again.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import ffmpeg
+from loguru import logger
+
+# Max number of probed file versions kept in memory
+MEDIA_INFO_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """Probe result for a media file"""
+    path: str                                  # Absolute file path
+    duration: float                            # Container duration in seconds (0.0 if unknown)
+    streams: Tuple[Dict[str, Any], ...] = field(default=(), repr=False)  # Raw ffprobe streams
+    format: Dict[str, Any] = field(default_factory=dict, repr=False)     # Raw ffprobe format section
+    width: Optional[int] = None                # First video stream width
+    height: Optional[int] = None               # First video stream height
+    fps: Optional[float] = None                # First video stream frame rate
+
+    @property
+    def has_video(self) -> bool:
+        return any(s.get('codec_type') == 'video' for s in self.streams)
+
+    @property
+    def has_audio(self) -> bool:
+        return any(s.get('codec_type') == 'audio' for s in self.streams)
+
+    @property
+    def video_stream(self) -> Optional[Dict[str, Any]]:
+        return next((s for s in self.streams if s.get('codec_type') == 'video'), None)
+
+
+def _parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    """Parse ffprobe rate like '30000/1001'"""
+    if not rate:
+        return None
+    try:
+        num, _, den = rate.partition('/')
+        den_value = float(den) if den else 1.0
+        return float(num) / den_value if den_value else None
+    except ValueError:
+        return None
+
+
+# (path, size, mtime_ns) -> MediaInfo, most recently used last
+_media_info_cache: "OrderedDict[Tuple[str, int, int], MediaInfo]" = OrderedDict()
+_media_info_lock = threading.Lock()
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    return abs_path, stat.st_size, stat.st_mtime_ns
+
+
+def _store(key: Tuple[str, int, int], info: MediaInfo):
+    with _media_info_lock:
+        _media_info_cache[key] = info
+        _media_info_cache.move_to_end(key)
+        while len(_media_info_cache) > MEDIA_INFO_CACHE_SIZE:
+            _media_info_cache.popitem(last=False)
+
+
+def _build_media_info(path: str, probe: Dict[str, Any]) -> MediaInfo:
+    """Build MediaInfo from raw ffprobe output"""
+    streams = tuple(probe.get('streams', []))
+    fmt = probe.get('format', {})
+
+    duration = fmt.get('duration')
+    video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+
+    return MediaInfo(
+        path=path,
+        duration=float(duration) if duration else 0.0,
+        streams=streams,
+        format=fmt,
+        width=int(video['width']) if video and video.get('width') else None,
+        height=int(video['height']) if video and video.get('height') else None,
+        fps=_parse_frame_rate(video.get('r_frame_rate')) if video else None,
+    )
+
+
+def probe_media(path: str) -> MediaInfo:
+    """
+    Get media info for a file, probing it at most once per version
+
+    Args:
+        path: Media file path (audio, video or image)
+
+    Returns:
+        MediaInfo for the current file contents
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ffmpeg.Error: If ffprobe fails (failures are not cached)
+    """
+    key = _file_key(path)
+
+    with _media_info_lock:
+        info = _media_info_cache.get(key)
+        if info is not None:
+            _media_info_cache.move_to_end(key)
+            return info
+
+    logger.debug(f"Probing media: {key[0]}")
+    info = _build_media_info(key[0], ffmpeg.probe(key[0]))
+    _store(key, info)
+    return info
+
+
+def remember_media_info(path: str, probe: Dict[str, Any]) -> MediaInfo:
+    """
+    Register a known ffprobe result for a file without running ffprobe
+
+    Used when a file is restored from a cache that kept its probe result.
+
+    Args:
+        path: Media file path (must exist)
+        probe: Raw ffprobe output ({"streams": [...], "format": {...}})
+
+    Returns:
+        MediaInfo for the file
+    """
+    key = _file_key(path)
+    info = _build_media_info(key[0], probe)
+    _store(key, info)
+    return info
+
+
+def clear_media_info_cache():
+    """Drop all cached probe results"""
+    with _media_info_lock:
+        _media_info_cache.clear()
@@ -14,9 +14,14 @@
 Persistence Service
 
 Handles task metadata and storyboard persistence to filesystem.
+Task summaries for listing and statistics live in an embedded SQLite index.
 """
 
+import asyncio
 import json
+import os
+import sqlite3
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -24,6 +29,47 @@ from loguru import logger
 
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig, ContentMetadata
 
+# Columns of the task index (in insert order)
+INDEX_COLUMNS = (
+    "task_id", "created_at", "completed_at", "status", "title",
+    "duration", "n_frames", "file_size", "video_path",
+)
+
+# Allowed sort fields for list_tasks_paginated (never interpolate user input).
+# Bare columns so the (column, task_id) indexes serve ORDER BY ... LIMIT;
+# SQLite sorts NULL first, so tasks without a timestamp come last in DESC.
+SORT_COLUMNS = {
+    "created_at": "created_at",
+    "completed_at": "completed_at",
+    "title": "title",
+    "duration": "duration",
+    "n_frames": "n_frames",
+}
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id      TEXT PRIMARY KEY,
+    created_at   TEXT,
+    completed_at TEXT,
+    status       TEXT NOT NULL DEFAULT 'unknown',
+    title        TEXT,
+    duration     REAL NOT NULL DEFAULT 0,
+    n_frames     INTEGER NOT NULL DEFAULT 0,
+    file_size    INTEGER NOT NULL DEFAULT 0,
+    video_path   TEXT
+);
+DROP INDEX IF EXISTS idx_tasks_created_at;
+DROP INDEX IF EXISTS idx_tasks_status_created_at;
+DROP INDEX IF EXISTS idx_tasks_completed_at;
+DROP INDEX IF EXISTS idx_tasks_title;
+DROP INDEX IF EXISTS idx_tasks_duration;
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at_task_id ON tasks (created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_created_at_task_id ON tasks (status, created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_at_task_id ON tasks (completed_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_title_task_id ON tasks (title, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_duration_task_id ON tasks (duration, task_id);
+"""
+
 
 class PersistenceService:
     """
@@ -31,9 +77,11 @@ class PersistenceService:
     
     File structure:
         output/
+        ├── .index.db                  # SQLite task index (summaries for listing)
         └── {task_id}/
             ├── metadata.json          # Task metadata (input, result, config)
             ├── storyboard.json        # Storyboard data (frames, prompts)
+            ├── checkpoint.json        # Pipeline progress (for resume)
             ├── final.mp4
             └── frames/
                 ├── 01_audio.mp3
@@ -67,9 +115,14 @@ class PersistenceService:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
-        # Index file for fast listing
+        # SQLite index for fast listing (WAL: readers don't block the writer)
+        self.index_db_path = self.output_dir / ".index.db"
+        self._index_lock = threading.Lock()
+        self._index_conn = self._open_index()
+        
+        # Legacy JSON index (migrated once, then renamed)
         self.index_file = self.output_dir / ".index.json"
-        self._ensure_index()
+        self._migrate_json_index()
     
     def get_task_dir(self, task_id: str) -> Path:
         """Get task directory path"""
@@ -83,6 +136,10 @@ class PersistenceService:
         """Get storyboard.json path"""
         return self.get_task_dir(task_id) / "storyboard.json"
     
+    def get_checkpoint_path(self, task_id: str) -> Path:
+        """Get checkpoint.json path"""
+        return self.get_task_dir(task_id) / "checkpoint.json"
+    
     # ========================================================================
     # Metadata Operations
     # ========================================================================
@@ -218,8 +275,9 @@ class PersistenceService:
             # Convert storyboard to dict
             storyboard_dict = self._storyboard_to_dict(storyboard)
             
-            with open(storyboard_path, "w", encoding="utf-8") as f:
-                json.dump(storyboard_dict, f, indent=2, ensure_ascii=False)
+            # Saved while frames are produced, so never leave a truncated file
+            # behind, and serialize off the event loop
+            await asyncio.to_thread(self._write_json_atomic, storyboard_path, storyboard_dict)
             
             logger.debug(f"Saved storyboard: {task_id}")
             
@@ -255,6 +313,63 @@ class PersistenceService:
             logger.error(f"Failed to load storyboard {task_id}: {e}")
             return None
     
+    # ========================================================================
+    # Checkpoint Operations
+    # ========================================================================
+    
+    async def save_checkpoint(self, task_id: str, checkpoint: Dict[str, Any]):
+        """
+        Save pipeline checkpoint to filesystem
+        
+        The checkpoint holds everything a pipeline produced before the storyboard
+        exists (narrations, title, image prompts) plus the completed lifecycle
+        steps. Frame progress lives in storyboard.json.
+        
+        Args:
+            task_id: Task ID
+            checkpoint: Checkpoint dict (see LinearVideoPipeline.save_checkpoint)
+        """
+        try:
+            task_dir = self.get_task_dir(task_id)
+            task_dir.mkdir(parents=True, exist_ok=True)
+            
+            checkpoint = dict(checkpoint)
+            checkpoint["params"] = self._params_to_dict(checkpoint.get("params") or {})
+            checkpoint["updated_at"] = datetime.now().isoformat()
+            
+            await asyncio.to_thread(self._write_json_atomic, self.get_checkpoint_path(task_id), checkpoint)
+            logger.debug(f"Saved checkpoint: {task_id} (steps: {checkpoint.get('completed_steps')})")
+            
+        except Exception as e:
+            logger.error(f"Failed to save checkpoint {task_id}: {e}")
+            raise
+    
+    async def load_checkpoint(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load pipeline checkpoint from filesystem
+        
+        Args:
+            task_id: Task ID
+            
+        Returns:
+            Checkpoint dict or None if not found
+        """
+        try:
+            checkpoint_path = self.get_checkpoint_path(task_id)
+            
+            if not checkpoint_path.exists():
+                return None
+            
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            
+            checkpoint["params"] = self._dict_to_params(checkpoint.get("params") or {})
+            return checkpoint
+            
+        except Exception as e:
+            logger.error(f"Failed to load checkpoint {task_id}: {e}")
+            return None
+    
     # ========================================================================
     # Task Listing & Querying
     # ========================================================================
@@ -277,36 +392,21 @@ class PersistenceService:
             List of metadata dicts, sorted by created_at descending
         """
         try:
-            tasks = []
+            # Select the page from the index, then load only those metadata files
+            where, params = ("WHERE status = ?", [status]) if status else ("", [])
+            rows = self._query_index(
+                f"SELECT task_id FROM tasks {where} "
+                f"ORDER BY created_at DESC, task_id DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset)
+            )
             
-            # Scan all task directories
-            for task_dir in self.output_dir.iterdir():
-                if not task_dir.is_dir():
-                    continue
-                
-                metadata_path = task_dir / "metadata.json"
-                if not metadata_path.exists():
-                    continue
-                
-                try:
-                    with open(metadata_path, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
-                    
-                    # Filter by status
-                    if status and metadata.get("status") != status:
-                        continue
-                    
+            tasks = []
+            for row in rows:
+                metadata = await self.load_task_metadata(row["task_id"])
+                if metadata:
                     tasks.append(metadata)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to load metadata from {task_dir}: {e}")
-                    continue
             
-            # Sort by created_at descending
-            tasks.sort(key=lambda t: t.get("created_at", ""), reverse=True)
-            
-            # Apply pagination
-            return tasks[offset:offset + limit]
+            return tasks
             
         except Exception as e:
             logger.error(f"Failed to list tasks: {e}")
@@ -375,6 +475,8 @@ class PersistenceService:
             "min_image_prompt_words": config.min_image_prompt_words,
             "max_image_prompt_words": config.max_image_prompt_words,
             "video_fps": config.video_fps,
+            "segment_encode_mode": config.segment_encode_mode,
+            "render_mode": config.render_mode,
             "tts_inference_mode": config.tts_inference_mode,
             "voice_id": config.voice_id,
             "tts_workflow": config.tts_workflow,
@@ -397,6 +499,8 @@ class PersistenceService:
             min_image_prompt_words=data.get("min_image_prompt_words", 30),
             max_image_prompt_words=data.get("max_image_prompt_words", 60),
             video_fps=data.get("video_fps", 30),
+            segment_encode_mode=data.get("segment_encode_mode", "standard"),
+            render_mode=data.get("render_mode", "segments"),
             tts_inference_mode=data.get("tts_inference_mode", "local"),
             voice_id=data.get("voice_id"),
             tts_workflow=data.get("tts_workflow"),
@@ -421,6 +525,8 @@ class PersistenceService:
             "video_path": frame.video_path,
             "composed_image_path": frame.composed_image_path,
             "video_segment_path": frame.video_segment_path,
+            "completed_stages": list(frame.completed_stages),
+            "fingerprints": dict(frame.fingerprints),
             "duration": frame.duration,
             "created_at": frame.created_at.isoformat() if frame.created_at else None,
         }
@@ -437,10 +543,41 @@ class PersistenceService:
             video_path=data.get("video_path"),
             composed_image_path=data.get("composed_image_path"),
             video_segment_path=data.get("video_segment_path"),
+            completed_stages=data.get("completed_stages", []),
+            fingerprints=data.get("fingerprints", {}),
             duration=data.get("duration", 0.0),
             created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
         )
     
+    def _params_to_dict(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert pipeline params to JSON-safe dict (non-serializable values are dropped)"""
+        result = {}
+        for key, value in params.items():
+            if isinstance(value, ContentMetadata):
+                result[key] = self._content_metadata_to_dict(value)
+                continue
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                logger.warning(f"Checkpoint: dropping non-serializable param '{key}' ({type(value).__name__})")
+                continue
+            result[key] = value
+        return result
+    
+    def _dict_to_params(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert checkpoint params back to pipeline params"""
+        params = dict(data)
+        if isinstance(params.get("content_metadata"), dict):
+            params["content_metadata"] = self._dict_to_content_metadata(params["content_metadata"])
+        return params
+    
+    def _write_json_atomic(self, path: Path, data: Dict[str, Any]):
+        """Write JSON via temp file + rename (readers never see a partial file)"""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
     def _content_metadata_to_dict(self, metadata: ContentMetadata) -> Dict[str, Any]:
         """Convert ContentMetadata to dict"""
         return {
@@ -469,33 +606,65 @@ class PersistenceService:
     # Index Management (for fast listing)
     # ========================================================================
     
-    def _ensure_index(self):
-        """Ensure index file exists, create if not"""
-        if not self.index_file.exists():
-            self._save_index({"version": "1.0", "tasks": []})
+    def _open_index(self) -> sqlite3.Connection:
+        """Open the SQLite index and create the schema if needed"""
+        conn = sqlite3.connect(str(self.index_db_path), timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(INDEX_SCHEMA)
+        conn.commit()
+        return conn
+    
+    def _query_index(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a read query against the index"""
+        with self._index_lock:
+            return self._index_conn.execute(sql, params).fetchall()
+    
+    def _write_index(self, sql: str, rows: List[tuple]):
+        """Run a write statement for each row in a single transaction"""
+        with self._index_lock, self._index_conn:
+            self._index_conn.executemany(sql, rows)
+    
+    def _insert_sql(self, on_conflict: str = "REPLACE") -> str:
+        """INSERT statement for a full index row (on_conflict: REPLACE or IGNORE)"""
+        placeholders = ", ".join("?" for _ in INDEX_COLUMNS)
+        return f"INSERT OR {on_conflict} INTO tasks ({', '.join(INDEX_COLUMNS)}) VALUES ({placeholders})"
+    
+    def _entry_to_row(self, entry: Dict[str, Any]) -> tuple:
+        """Convert an index entry dict to a row tuple (missing numbers become 0)"""
+        return (
+            entry["task_id"],
+            entry.get("created_at"),
+            entry.get("completed_at"),
+            entry.get("status") or "unknown",
+            entry.get("title"),
+            entry.get("duration") or 0,
+            entry.get("n_frames") or 0,
+            entry.get("file_size") or 0,
+            entry.get("video_path"),
+        )
     
-    def _load_index(self) -> Dict[str, Any]:
-        """Load index from file"""
+    def _migrate_json_index(self):
+        """One-time import of the legacy .index.json into SQLite"""
+        if not self.index_file.exists():
+            return
+        
         try:
             with open(self.index_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load index: {e}")
-            return {"version": "1.0", "tasks": []}
-    
-    def _save_index(self, index_data: Dict[str, Any]):
-        """Save index to file"""
-        try:
-            index_data["last_updated"] = datetime.now().isoformat()
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, ensure_ascii=False, indent=2)
+                tasks = json.load(f).get("tasks", [])
+            
+            rows = [self._entry_to_row(t) for t in tasks if t.get("task_id")]
+            # Don't overwrite entries already written to SQLite
+            self._write_index(self._insert_sql("IGNORE"), rows)
+            
+            self.index_file.rename(self.index_file.with_name(".index.json.migrated"))
+            logger.info(f"Migrated {len(rows)} tasks from {self.index_file.name} to SQLite index")
         except Exception as e:
-            logger.error(f"Failed to save index: {e}")
+            logger.error(f"Failed to migrate JSON index (run rebuild_index to recover): {e}")
     
-    async def _update_index_for_task(self, task_id: str, metadata: Dict[str, Any]):
-        """Update index entry for a specific task"""
-        index = self._load_index()
-        
+    async def _build_index_entry(self, task_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the index entry for a task from its metadata"""
         # Try to get title from multiple sources
         title = metadata.get("input", {}).get("title")
         if not title or title == "":
@@ -512,35 +681,28 @@ class PersistenceService:
                 else:
                     title = "Untitled"
         
-        # Extract key info for index
-        index_entry = {
+        result = metadata.get("result") or {}
+        return {
             "task_id": task_id,
             "created_at": metadata.get("created_at"),
             "completed_at": metadata.get("completed_at"),
             "status": metadata.get("status", "unknown"),
             "title": title,
-            "duration": metadata.get("result", {}).get("duration", 0),
-            "n_frames": metadata.get("result", {}).get("n_frames", 0),
-            "file_size": metadata.get("result", {}).get("file_size", 0),
-            "video_path": metadata.get("result", {}).get("video_path"),
+            "duration": result.get("duration", 0),
+            "n_frames": result.get("n_frames", 0),
+            "file_size": result.get("file_size", 0),
+            "video_path": result.get("video_path"),
         }
-        
-        # Update or append
-        tasks = index.get("tasks", [])
-        existing_idx = next((i for i, t in enumerate(tasks) if t["task_id"] == task_id), None)
-        
-        if existing_idx is not None:
-            tasks[existing_idx] = index_entry
-        else:
-            tasks.append(index_entry)
-        
-        index["tasks"] = tasks
-        self._save_index(index)
+    
+    async def _update_index_for_task(self, task_id: str, metadata: Dict[str, Any]):
+        """Update index entry for a specific task"""
+        index_entry = await self._build_index_entry(task_id, metadata)
+        self._write_index(self._insert_sql(), [self._entry_to_row(index_entry)])
     
     async def rebuild_index(self):
         """Rebuild index by scanning all task directories"""
         logger.info("Rebuilding task index...")
-        index = {"version": "1.0", "tasks": []}
+        rows = []
         
         # Scan all directories
         for task_dir in self.output_dir.iterdir():
@@ -551,37 +713,14 @@ class PersistenceService:
             metadata = await self.load_task_metadata(task_id)
             
             if metadata:
-                # Try to get title from multiple sources
-                title = metadata.get("input", {}).get("title")
-                if not title or title == "":
-                    # Try to get title from storyboard if input title is empty
-                    storyboard = await self.load_storyboard(task_id)
-                    if storyboard and storyboard.title:
-                        title = storyboard.title
-                    else:
-                        # Fall back to using input text preview
-                        input_text = metadata.get("input", {}).get("text", "")
-                        if input_text:
-                            # Use first 30 characters of input text as title
-                            title = input_text[:30] + ("..." if len(input_text) > 30 else "")
-                        else:
-                            title = "Untitled"
-                
-                # Add to index
-                index["tasks"].append({
-                    "task_id": task_id,
-                    "created_at": metadata.get("created_at"),
-                    "completed_at": metadata.get("completed_at"),
-                    "status": metadata.get("status", "unknown"),
-                    "title": title,
-                    "duration": metadata.get("result", {}).get("duration", 0),
-                    "n_frames": metadata.get("result", {}).get("n_frames", 0),
-                    "file_size": metadata.get("result", {}).get("file_size", 0),
-                    "video_path": metadata.get("result", {}).get("video_path"),
-                })
-        
-        self._save_index(index)
-        logger.info(f"Index rebuilt: {len(index['tasks'])} tasks")
+                rows.append(self._entry_to_row(await self._build_index_entry(task_id, metadata)))
+        
+        # Replace the whole index atomically
+        with self._index_lock, self._index_conn:
+            self._index_conn.execute("DELETE FROM tasks")
+            self._index_conn.executemany(self._insert_sql(), rows)
+        
+        logger.info(f"Index rebuilt: {len(rows)} tasks")
     
     # ========================================================================
     # Paginated Listing
@@ -614,29 +753,21 @@ class PersistenceService:
                 "total_pages": 5         # Total pages
             }
         """
-        index = self._load_index()
-        tasks = index.get("tasks", [])
-        
-        # Filter by status
-        if status:
-            tasks = [t for t in tasks if t.get("status") == status]
-        
-        # Sort
-        reverse = (sort_order == "desc")
-        if sort_by in ["created_at", "completed_at"]:
-            tasks.sort(
-                key=lambda t: datetime.fromisoformat(t.get(sort_by, "1970-01-01T00:00:00")),
-                reverse=reverse
-            )
-        elif sort_by in ["title", "duration", "n_frames"]:
-            tasks.sort(key=lambda t: t.get(sort_by, ""), reverse=reverse)
+        where, params = ("WHERE status = ?", (status,)) if status else ("", ())
+        
+        # Sort (unknown fields fall back to created_at)
+        order_column = SORT_COLUMNS.get(sort_by, SORT_COLUMNS["created_at"])
+        direction = "DESC" if sort_order == "desc" else "ASC"
         
         # Paginate
-        total = len(tasks)
+        total = self._query_index(f"SELECT COUNT(*) FROM tasks {where}", params)[0][0]
         total_pages = (total + page_size - 1) // page_size
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        page_tasks = tasks[start_idx:end_idx]
+        rows = self._query_index(
+            f"SELECT {', '.join(INDEX_COLUMNS)} FROM tasks {where} "
+            f"ORDER BY {order_column} {direction}, task_id {direction} LIMIT ? OFFSET ?",
+            (*params, page_size, max(0, (page - 1) * page_size))
+        )
+        page_tasks = [dict(row) for row in rows]
         
         return {
             "tasks": page_tasks,
@@ -663,15 +794,24 @@ class PersistenceService:
                 "total_size": 1024000000,  # bytes
             }
         """
-        index = self._load_index()
-        tasks = index.get("tasks", [])
+        row = self._query_index(
+            """
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(status = 'completed'), 0),
+                COALESCE(SUM(status = 'failed'), 0),
+                COALESCE(SUM(duration), 0),
+                COALESCE(SUM(file_size), 0)
+            FROM tasks
+            """
+        )[0]
         
         stats = {
-            "total_tasks": len(tasks),
-            "completed": len([t for t in tasks if t.get("status") == "completed"]),
-            "failed": len([t for t in tasks if t.get("status") == "failed"]),
-            "total_duration": sum(t.get("duration", 0) for t in tasks),
-            "total_size": sum(t.get("file_size", 0) for t in tasks),
+            "total_tasks": row[0],
+            "completed": row[1],
+            "failed": row[2],
+            "total_duration": row[3],
+            "total_size": row[4],
         }
         
         return stats
@@ -699,11 +839,7 @@ class PersistenceService:
                 logger.info(f"Deleted task directory: {task_dir}")
             
             # Update index
-            index = self._load_index()
-            tasks = index.get("tasks", [])
-            tasks = [t for t in tasks if t["task_id"] != task_id]
-            index["tasks"] = tasks
-            self._save_index(index)
+            self._write_index("DELETE FROM tasks WHERE task_id = ?", [(task_id,)])
             
             return True
         except Exception as e:
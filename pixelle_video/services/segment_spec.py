@@ -0,0 +1,147 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Segment Spec - Canonical codec profile of frame video segments
+
+Frame segments come from two producers: create_video_from_image (image
+frames) and overlay_image_on_video + merge_audio_video (video frames). Both
+encode with SegmentSpec.encode_options(), so segments share codec, pixel
+format, frame rate, time base and audio layout, and concat_videos can join
+them with the concat demuxer (stream copy). SegmentSpec.mismatches() checks
+probed files against the profile, so only non-conforming segments are
+re-encoded.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from pixelle_video.services.media_info import MediaInfo
+
+SEGMENT_VIDEO_CODEC = "h264"
+SEGMENT_AUDIO_CODEC = "aac"
+SEGMENT_PIX_FMT = "yuv420p"
+SEGMENT_TIMESCALE = 90000       # MP4 video track timescale (time base 1/90000)
+SEGMENT_SAMPLE_RATE = 44100
+SEGMENT_CHANNELS = 2
+SEGMENT_AUDIO_BITRATE = "192k"
+
+# Max frame rate difference still considered equal (probe rounding, e.g. 30000/1001)
+FPS_TOLERANCE = 0.01
+
+
+@dataclass(frozen=True)
+class SegmentSpec:
+    """
+    Codec profile of a frame segment (H.264 + AAC in MP4)
+
+    width/height/fps set to None mean "any" (taken from the source when
+    encoding, not checked when validating).
+
+    Usage:
+        >>> # Producer side
+        >>> ffmpeg.output(video, audio, "segment.mp4", **SegmentSpec(fps=30).encode_options())
+        >>> # Concat side
+        >>> spec = SegmentSpec.for_segments(infos)
+        >>> spec.mismatches(probe_media("segment.mp4"))
+        ['fps 25 (expected 30)']
+    """
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None
+    pix_fmt: str = SEGMENT_PIX_FMT
+    timescale: int = SEGMENT_TIMESCALE
+    sample_rate: int = SEGMENT_SAMPLE_RATE
+    channels: int = SEGMENT_CHANNELS
+
+    def __str__(self) -> str:
+        size = f"{self.width}x{self.height}" if self.width and self.height else "any size"
+        fps = f"{self.fps:g}fps" if self.fps else "any fps"
+        return (
+            f"{SEGMENT_VIDEO_CODEC} {size} {fps} {self.pix_fmt} 1/{self.timescale}, "
+            f"{SEGMENT_AUDIO_CODEC} {self.sample_rate}Hz {self.channels}ch"
+        )
+
+    @property
+    def channel_layout(self) -> str:
+        return "mono" if self.channels == 1 else "stereo"
+
+    @classmethod
+    def for_segments(cls, infos: Sequence[MediaInfo]) -> "SegmentSpec":
+        """
+        Target spec for concatenating segments
+
+        Resolution and frame rate are those of most segments (the first one
+        wins a tie), so the fewest segments need re-encoding.
+        """
+        shapes = Counter(
+            (info.width, info.height, round(info.fps, 3) if info.fps else None)
+            for info in infos
+            if info.has_video
+        )
+        if not shapes:
+            return cls()
+        (width, height, fps), _ = shapes.most_common(1)[0]
+        return cls(width=width, height=height, fps=fps)
+
+    def encode_options(self) -> Dict[str, Any]:
+        """ffmpeg-python output options producing this profile"""
+        options = {
+            'vcodec': 'libx264',
+            'pix_fmt': self.pix_fmt,
+            'video_track_timescale': self.timescale,
+            'acodec': 'aac',
+            'audio_bitrate': SEGMENT_AUDIO_BITRATE,
+            'ar': self.sample_rate,
+            'ac': self.channels,
+        }
+        if self.fps:
+            options['r'] = self.fps
+        return options
+
+    def mismatches(self, info: MediaInfo) -> List[str]:
+        """
+        Compare a probed segment against this spec
+
+        Returns:
+            Human-readable differences (empty if the segment conforms)
+        """
+        video = info.video_stream
+        if video is None:
+            return ["no video stream"]
+
+        problems = []
+        if video.get('codec_name') != SEGMENT_VIDEO_CODEC:
+            problems.append(f"video codec {video.get('codec_name')} (expected {SEGMENT_VIDEO_CODEC})")
+        if video.get('pix_fmt') != self.pix_fmt:
+            problems.append(f"pix_fmt {video.get('pix_fmt')} (expected {self.pix_fmt})")
+        if self.width and self.height and (info.width, info.height) != (self.width, self.height):
+            problems.append(f"resolution {info.width}x{info.height} (expected {self.width}x{self.height})")
+        if video.get('sample_aspect_ratio', '1:1') not in ('1:1', '0:1', 'N/A'):
+            problems.append(f"sample aspect ratio {video.get('sample_aspect_ratio')} (expected 1:1)")
+        if self.fps and (not info.fps or abs(info.fps - self.fps) > FPS_TOLERANCE):
+            problems.append(f"fps {info.fps:g} (expected {self.fps:g})" if info.fps else "unknown fps")
+        if video.get('time_base') != f"1/{self.timescale}":
+            problems.append(f"time base {video.get('time_base')} (expected 1/{self.timescale})")
+
+        audio = next((s for s in info.streams if s.get('codec_type') == 'audio'), None)
+        if audio is None:
+            problems.append("no audio stream")
+            return problems
+        if audio.get('codec_name') != SEGMENT_AUDIO_CODEC:
+            problems.append(f"audio codec {audio.get('codec_name')} (expected {SEGMENT_AUDIO_CODEC})")
+        if str(audio.get('sample_rate')) != str(self.sample_rate):
+            problems.append(f"sample rate {audio.get('sample_rate')} (expected {self.sample_rate})")
+        if audio.get('channels') != self.channels:
+            problems.append(f"{audio.get('channels')} audio channels (expected {self.channels})")
+        return problems
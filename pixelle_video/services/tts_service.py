@@ -14,6 +14,7 @@
 TTS (Text-to-Speech) Service - Supports both local and ComfyUI inference
 """
 
+import asyncio
 import os
 import uuid
 from pathlib import Path
@@ -22,7 +23,9 @@ from typing import Optional
 from comfykit import ComfyKit
 from loguru import logger
 
+from pixelle_video.services.asset_cache import file_digest, get_tts_cache, make_cache_key
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.services.downloader import get_downloader
 from pixelle_video.utils.tts_util import edge_tts
 from pixelle_video.tts_voices import speed_to_rate
 
@@ -33,6 +36,9 @@ class TTSService(ComfyBaseService):
     
     Uses ComfyKit to execute TTS workflows.
     
+    Results are cached on disk by content (see AssetCache), so re-running the
+    same narration with the same voice settings skips synthesis.
+    
     Usage:
         # Use default workflow
         audio_path = await pixelle_video.tts(text="Hello, world!")
@@ -116,27 +122,61 @@ class TTSService(ComfyBaseService):
         
         # Route to appropriate implementation
         if mode == "local":
-            return await self._call_local_tts(
-                text=text,
-                voice=voice,
-                speed=speed,
-                output_path=output_path
-            )
+            voice, speed = self._resolve_local_voice_speed(voice, speed)
+            
+            async def generate() -> str:
+                return await self._call_local_tts(
+                    text=text,
+                    voice=voice,
+                    speed=speed,
+                    output_path=output_path
+                )
+            
+            cache_fields = {"voice": voice, "speed": speed}
         else:  # comfyui
             # 1. Resolve workflow (returns structured info)
             workflow_info = self._resolve_workflow(workflow=workflow)
             
             # 2. Execute ComfyUI workflow
-            return await self._call_comfyui_workflow(
-                workflow_info=workflow_info,
-                text=text,
-                comfyui_url=comfyui_url,
-                runninghub_api_key=runninghub_api_key,
-                voice=voice,
-                speed=speed,
-                output_path=output_path,
-                **params
-            )
+            async def generate() -> str:
+                return await self._call_comfyui_workflow(
+                    workflow_info=workflow_info,
+                    text=text,
+                    comfyui_url=comfyui_url,
+                    runninghub_api_key=runninghub_api_key,
+                    voice=voice,
+                    speed=speed,
+                    output_path=output_path,
+                    **params
+                )
+            
+            # "index" only numbers outputs inside the workflow, it doesn't change the audio
+            workflow_params = {k: v for k, v in params.items() if k not in ("index", "ref_audio")}
+            cache_fields = {
+                "voice": voice,
+                "speed": speed,
+                "workflow": workflow_info["key"],
+                "ref_audio": await asyncio.to_thread(file_digest, params.get("ref_audio")),
+                "params": workflow_params,
+            }
+        
+        cache = get_tts_cache()
+        if cache is None:
+            return await generate()
+        
+        key = make_cache_key(text=text, inference_mode=mode, **cache_fields)
+        return await cache.get_or_create(key, output_path, generate, extra={"text": text[:200]})
+    
+    def _resolve_local_voice_speed(
+        self,
+        voice: Optional[str],
+        speed: Optional[float]
+    ) -> tuple[str, float]:
+        """Resolve Edge TTS voice and speed (param > config)"""
+        local_config = self.config.get("local", {})
+        final_voice = voice or local_config.get("voice", "zh-CN-YunjianNeural")
+        final_speed = speed if speed is not None else local_config.get("speed", 1.2)
+        return final_voice, final_speed
     
     async def _call_local_tts(
         self,
@@ -157,12 +197,8 @@ class TTSService(ComfyBaseService):
         Returns:
             Generated audio file path
         """
-        # Get config defaults
-        local_config = self.config.get("local", {})
-        
         # Determine voice and speed (param > config)
-        final_voice = voice or local_config.get("voice", "zh-CN-YunjianNeural")
-        final_speed = speed if speed is not None else local_config.get("speed", 1.2)
+        final_voice, final_speed = self._resolve_local_voice_speed(voice, speed)
         
         # Convert speed to rate parameter
         rate = speed_to_rate(final_speed)
@@ -293,19 +329,8 @@ class TTSService(ComfyBaseService):
             
             # If output_path provided and audio_path is URL, download to local
             if output_path and audio_path.startswith(('http://', 'https://')):
-                import httpx
-                import os
-                
-                # Ensure parent directory exists
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                
                 logger.info(f"Downloading audio from {audio_path} to {output_path}")
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(audio_path)
-                    response.raise_for_status()
-                    
-                    with open(output_path, 'wb') as f:
-                        f.write(response.content)
+                await get_downloader().download(audio_path, output_path)
                 
                 logger.info(f"✅ Generated audio (ComfyUI): {output_path}")
                 return output_path
@@ -24,16 +24,21 @@ Features:
 Note: Requires FFmpeg to be installed on the system.
 """
 
+import asyncio
 import os
 import shutil
 import tempfile
 import uuid
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Callable, List, Literal, Optional, Tuple
 
 import ffmpeg
 from loguru import logger
 
+from pixelle_video.services.ffmpeg_runner import get_ffmpeg_runner
+from pixelle_video.services.media_info import probe_media
+from pixelle_video.services.segment_spec import SegmentSpec
+from pixelle_video.utils.async_util import gather_limited
 from pixelle_video.utils.os_util import (
     get_resource_path,
     list_resource_files,
@@ -68,24 +73,28 @@ class VideoService:
     Uses ffmpeg-python for high-performance video processing.
     All operations preserve video quality when possible (stream copy).
     
+    ffmpeg runs through the shared FFmpegRunner: operations are coroutines that
+    don't block the event loop, are limited by pipeline.ffmpeg_slots, and kill
+    the ffmpeg process when cancelled.
+    
     Examples:
         >>> compositor = VideoCompositor()
         >>> 
         >>> # Concatenate videos
-        >>> compositor.concat_videos(
+        >>> await compositor.concat_videos(
         ...     ["intro.mp4", "main.mp4", "outro.mp4"],
         ...     "final.mp4"
         ... )
         >>> 
         >>> # Add voiceover
-        >>> compositor.merge_audio_video(
+        >>> await compositor.merge_audio_video(
         ...     "visual.mp4",
         ...     "voiceover.mp3",
         ...     "final.mp4"
         ... )
         >>> 
         >>> # Add background music
-        >>> compositor.add_bgm(
+        >>> await compositor.add_bgm(
         ...     "video.mp4",
         ...     "music.mp3",
         ...     "final.mp4",
@@ -93,31 +102,47 @@ class VideoService:
         ... )
         >>> 
         >>> # Create video from image + audio
-        >>> compositor.create_video_from_image(
+        >>> await compositor.create_video_from_image(
         ...     "frame.png",
         ...     "narration.mp3",
         ...     "segment.mp4"
         ... )
     """
     
-    def concat_videos(
+    async def _run(
+        self,
+        cmd,
+        duration: Optional[float] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ):
+        """Run an ffmpeg stream spec or argument list through the shared runner"""
+        await get_ffmpeg_runner().run(cmd, duration=duration, progress_callback=progress_callback)
+    
+    async def concat_videos(
         self,
         videos: List[str],
         output: str,
         method: Literal["demuxer", "filter"] = "demuxer",
         bgm_path: Optional[str] = None,
         bgm_volume: float = 0.2,
-        bgm_mode: Literal["once", "loop"] = "loop"
+        bgm_mode: Literal["once", "loop"] = "loop",
+        bgm_fade_in: float = 0.0,
+        bgm_fade_out: float = 0.0,
+        bgm_ducking: bool = False
     ) -> str:
         """
         Concatenate multiple videos into one
         
+        BGM is mixed in the same ffmpeg pass: with the demuxer method the video
+        stream is copied once and only the audio is re-encoded.
+        
         Args:
             videos: List of video file paths to concatenate
             output: Output video file path
             method: Concatenation method
-                - "demuxer": Fast, no re-encoding (requires identical formats)
-                - "filter": Slower but handles different formats
+                - "demuxer": Fast, stream copy. Segments are checked against a common
+                  SegmentSpec first, and only non-conforming ones are re-encoded
+                - "filter": Re-encodes everything (handles any formats)
             bgm_path: Background music file path (optional)
                 - None: No BGM
                 - Filename (e.g., "default.mp3", "happy.mp3"): Use built-in BGM from bgm/ folder
@@ -126,63 +151,171 @@ class VideoService:
             bgm_mode: BGM playback mode
                 - "once": Play BGM once
                 - "loop": Loop BGM to match video duration
+            bgm_fade_in: BGM fade-in duration in seconds (0 = none)
+            bgm_fade_out: BGM fade-out duration in seconds, ending with the video (0 = none)
+            bgm_ducking: Lower the BGM while narration is playing (sidechain compression)
         
         Returns:
             Path to the output video file
         
         Raises:
             ValueError: If videos list is empty
+            FileNotFoundError: If BGM file not found
             RuntimeError: If FFmpeg execution fails
         
         Note:
-            - demuxer method requires all videos to have identical:
-              resolution, codec, fps, etc.
+            - demuxer method needs identical codec parameters (resolution, pix_fmt,
+              fps, time base, audio sample rate/channels); segments from
+              create_video_from_image and merge_audio_video already match
             - filter method re-encodes videos, slower but more compatible
         """
         if not videos:
             raise ValueError("Videos list cannot be empty")
         
-        if len(videos) == 1:
+        if len(videos) == 1 and not bgm_path:
             logger.info(f"Only one video provided, copying to {output}")
             shutil.copy(videos[0], output)
             return output
         
         logger.info(f"Concatenating {len(videos)} videos using {method} method")
         
-        # Step 1: Concatenate videos
-        if bgm_path:
-            # If BGM needed, concatenate to temp file first
-            temp_output = output.replace('.mp4', '_no_bgm.mp4')
-            concat_result = self._concat_demuxer(videos, temp_output) if method == "demuxer" else self._concat_filter(videos, temp_output)
-            
-            # Step 2: Add BGM
-            logger.info(f"Adding BGM: {bgm_path} (volume={bgm_volume}, mode={bgm_mode})")
-            final_result = self._add_bgm_to_video(
-                video=concat_result,
-                bgm_path=bgm_path,
-                output=output,
-                volume=bgm_volume,
-                mode=bgm_mode
-            )
-            
-            # Clean up temp file
-            if os.path.exists(temp_output):
-                os.unlink(temp_output)
+        temp_segments = []
+        if method == "demuxer":
+            videos, temp_segments = await self._conform_segments(videos)
+        
+        try:
+            mix_audio = None
+            if bgm_path:
+                infos = await asyncio.gather(*(asyncio.to_thread(probe_media, video) for video in videos))
+                duration = sum(info.duration for info in infos)
+                mix_audio = lambda audio: self._mix_bgm(
+                    audio,
+                    bgm_path=bgm_path,
+                    volume=bgm_volume,
+                    mode=bgm_mode,
+                    duration=duration,
+                    fade_in=bgm_fade_in,
+                    fade_out=bgm_fade_out,
+                    ducking=bgm_ducking
+                )
             
-            return final_result
-        else:
-            # No BGM, direct concatenation
             if method == "demuxer":
-                return self._concat_demuxer(videos, output)
+                return await self._concat_demuxer(videos, output, mix_audio)
             else:
-                return self._concat_filter(videos, output)
+                return await self._concat_filter(videos, output, mix_audio)
+        finally:
+            for temp_segment in temp_segments:
+                if os.path.exists(temp_segment):
+                    os.unlink(temp_segment)
     
-    def _concat_demuxer(self, videos: List[str], output: str) -> str:
+    async def _conform_segments(self, videos: List[str]) -> tuple[List[str], List[str]]:
+        """
+        Make segments stream-copy compatible for the concat demuxer
+        
+        Segments are probed and checked against the spec shared by most of
+        them; only those that differ are re-encoded (to temp files).
+        
+        Returns:
+            (videos, temp_files) tuple: videos to concatenate (conforming
+            originals and normalized copies, in order), and the temp files to
+            remove afterwards
+        """
+        infos = await asyncio.gather(*(asyncio.to_thread(probe_media, video) for video in videos))
+        spec = SegmentSpec.for_segments(infos)
+        
+        normalize = {}
+        for i, (video, info) in enumerate(zip(videos, infos)):
+            problems = spec.mismatches(info)
+            if problems:
+                logger.warning(f"Segment {os.path.basename(video)} doesn't match {spec}: {', '.join(problems)}, re-encoding it")
+                normalize[i] = self._get_unique_temp_path("normalized", os.path.basename(video))
+        
+        if not normalize:
+            logger.debug(f"All {len(videos)} segments match {spec}, concatenating without re-encoding")
+            return videos, []
+        
+        try:
+            await gather_limited(normalize.items(), lambda item: self.normalize_segment(videos[item[0]], item[1], spec))
+        except BaseException:
+            for output in normalize.values():
+                if os.path.exists(output):
+                    os.unlink(output)
+            raise
+        
+        logger.info(f"Re-encoded {len(normalize)}/{len(videos)} segments to match {spec}")
+        return [normalize.get(i, video) for i, video in enumerate(videos)], list(normalize.values())
+    
+    async def normalize_segment(self, video: str, output: str, spec: SegmentSpec) -> str:
+        """
+        Re-encode a video to a segment spec
+        
+        The picture is scaled to fit the spec resolution (black bars if the
+        aspect ratio differs), and a silent track is added to videos without audio.
+        
+        Args:
+            video: Input video file path
+            output: Output video file path
+            spec: Target spec
+        
+        Returns:
+            Path to the output video
+        
+        Raises:
+            RuntimeError: If FFmpeg execution fails
+        """
+        info = await asyncio.to_thread(probe_media, video)
+        input_video = ffmpeg.input(video)
+        
+        video_stream = input_video.video
+        if spec.width and spec.height:
+            video_stream = (
+                video_stream
+                .filter('scale', spec.width, spec.height, force_original_aspect_ratio='decrease')
+                .filter('pad', spec.width, spec.height, '(ow-iw)/2', '(oh-ih)/2', color='black')
+            )
+        video_stream = video_stream.filter('setsar', '1')
+        
+        if info.has_audio:
+            audio_stream = input_video.audio
+        else:
+            audio_stream = ffmpeg.input(
+                f'anullsrc=r={spec.sample_rate}:cl={spec.channel_layout}',
+                f='lavfi',
+                t=info.duration
+            ).audio
+        
+        try:
+            await self._run(
+                ffmpeg
+                .output(video_stream, audio_stream, output, preset='fast', crf=23, **spec.encode_options())
+                .overwrite_output(),
+                duration=info.duration
+            )
+            return output
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg segment normalize error: {error_msg}")
+            raise RuntimeError(f"Failed to normalize segment: {error_msg}")
+    
+    async def _concat_demuxer(
+        self,
+        videos: List[str],
+        output: str,
+        mix_audio: Optional[Callable] = None
+    ) -> str:
         """
         Concatenate using concat demuxer (fast, no re-encoding)
         
         FFmpeg equivalent:
             ffmpeg -f concat -safe 0 -i filelist.txt -c copy output.mp4
+        
+        With mix_audio (BGM), the video is still copied and only the audio is encoded:
+            ffmpeg -f concat -safe 0 -i filelist.txt -stream_loop -1 -i bgm.mp3
+                   -filter_complex "[1:a]volume[b];[0:a][b]amix=inputs=2:duration=first[a]"
+                   -map 0:v -map "[a]" -c:v copy -c:a aac output.mp4
+        
+        Args:
+            mix_audio: Optional function building the output audio from the concatenated audio
         """
         # Create temporary file list
         with tempfile.NamedTemporaryFile(
@@ -199,13 +332,19 @@ class VideoService:
         
         try:
             logger.debug(f"Created filelist: {filelist}")
-            (
-                ffmpeg
-                .input(filelist, format='concat', safe=0)
-                .output(output, c='copy')
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
-            )
+            concat_input = ffmpeg.input(filelist, format='concat', safe=0)
+            if mix_audio is None:
+                stream = concat_input.output(output, c='copy')
+            else:
+                stream = ffmpeg.output(
+                    concat_input.video,
+                    mix_audio(concat_input.audio),
+                    output,
+                    vcodec='copy',
+                    acodec='aac',
+                    audio_bitrate='192k'
+                )
+            await self._run(stream.overwrite_output())
             logger.success(f"Videos concatenated successfully: {output}")
             return output
         except ffmpeg.Error as e:
@@ -216,59 +355,170 @@ class VideoService:
             if os.path.exists(filelist):
                 os.unlink(filelist)
     
-    def _concat_filter(self, videos: List[str], output: str) -> str:
+    async def _concat_filter(
+        self,
+        videos: List[str],
+        output: str,
+        mix_audio: Optional[Callable] = None
+    ) -> str:
         """
         Concatenate using concat filter (slower but handles different formats)
         
         FFmpeg equivalent:
             ffmpeg -i v1.mp4 -i v2.mp4 -filter_complex "[0:v][0:a][1:v][1:a]concat=n=2:v=1:a=1[v][a]"
                    -map "[v]" -map "[a]" output.mp4
+        
+        Args:
+            mix_audio: Optional function building the output audio from the concatenated audio
         """
         try:
-            # Build filter_complex string manually
-            n = len(videos)
-            
-            # Build input stream labels: [0:v][0:a][1:v][1:a]...
-            stream_spec = "".join([f"[{i}:v][{i}:a]" for i in range(n)])
-            filter_complex = f"{stream_spec}concat=n={n}:v=1:a=1[v][a]"
-            
-            # Build ffmpeg command
-            cmd = ['ffmpeg']
+            streams = []
             for video in videos:
-                cmd.extend(['-i', video])
-            cmd.extend([
-                '-filter_complex', filter_complex,
-                '-map', '[v]',
-                '-map', '[a]',
-                '-y',  # Overwrite output
-                output
-            ])
+                input_video = ffmpeg.input(video)
+                streams.extend([input_video.video, input_video.audio])
+            
+            joined = ffmpeg.concat(*streams, v=1, a=1).node
+            video_stream, audio_stream = joined[0], joined[1]
+            if mix_audio is not None:
+                audio_stream = mix_audio(audio_stream)
             
-            # Run command
-            import subprocess
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
+            await self._run(
+                ffmpeg
+                .output(video_stream, audio_stream, output)
+                .overwrite_output()
             )
             
             logger.success(f"Videos concatenated successfully: {output}")
             return output
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
             logger.error(f"FFmpeg concat filter error: {error_msg}")
             raise RuntimeError(f"Failed to concatenate videos: {error_msg}")
-        except Exception as e:
-            logger.error(f"Concatenation error: {e}")
-            raise RuntimeError(f"Failed to concatenate videos: {e}")
+    
+    async def concat_audios(self, audios: List[str], output: str) -> str:
+        """
+        Concatenate audio files in a single ffmpeg pass (no file list)
+        
+        Inputs may differ in codec or sample rate: the concat filter decodes
+        them and the result is encoded once.
+        
+        FFmpeg equivalent:
+            ffmpeg -i a1.mp3 -i a2.mp3 -filter_complex "[0:a][1:a]concat=n=2:v=0:a=1[a]"
+                   -map "[a]" output.mp3
+        
+        Args:
+            audios: Audio file paths, in order
+            output: Output audio file path
+        
+        Returns:
+            Path to the output audio
+        """
+        if not audios:
+            raise ValueError("No audios to concatenate")
+        
+        try:
+            streams = [ffmpeg.input(audio).audio for audio in audios]
+            await self._run(
+                ffmpeg
+                .concat(*streams, v=0, a=1)
+                .output(output)
+                .overwrite_output()
+            )
+            logger.debug(f"Concatenated {len(audios)} audios: {output}")
+            return output
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg audio concat error: {error_msg}")
+            raise RuntimeError(f"Failed to concatenate audios: {error_msg}")
+    
+    async def remux_to_ts(self, video: str, output: str, max_duration: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Remux an MP4 (H.264/AAC) into MPEG-TS chunks without re-encoding
+        
+        Used for HLS live preview chunks. A video longer than max_duration is
+        split at keyframes into chunks of at most max_duration seconds where
+        the keyframes allow it: "01.ts" becomes "01_00.ts", "01_01.ts", ...
+        
+        FFmpeg equivalent:
+            ffmpeg -i segment.mp4 -c copy -bsf:v h264_mp4toannexb -f mpegts chunk.ts
+            ffmpeg -i segment.mp4 -c copy -bsf:v h264_mp4toannexb -f segment \
+                -segment_format mpegts -segment_times 8.33,16.67 chunk_%02d.ts
+        
+        Args:
+            video: Input MP4 file path
+            output: Output .ts file path
+            max_duration: Max chunk duration in seconds (None = single chunk)
+        
+        Returns:
+            (chunk path, duration) of the output chunks, in playback order
+        """
+        try:
+            duration = (await asyncio.to_thread(probe_media, video)).duration
+            cuts = []
+            if max_duration and duration > max_duration:
+                cuts = await asyncio.to_thread(self._plan_chunk_cuts, video, max_duration)
+            
+            if not cuts:
+                await self._run(
+                    ffmpeg
+                    .input(video)
+                    .output(output, c='copy', f='mpegts', **{'bsf:v': 'h264_mp4toannexb'})
+                    .overwrite_output()
+                )
+                return [(output, duration)]
+            
+            stem = os.path.splitext(output)[0]
+            await self._run(
+                ffmpeg
+                .input(video)
+                .output(
+                    f"{stem}_%02d.ts",
+                    c='copy',
+                    f='segment',
+                    segment_format='mpegts',
+                    # Cut points are keyframe timestamps; the margin absorbs probe rounding
+                    segment_times=",".join(f"{cut - 0.001:.3f}" for cut in cuts),
+                    **{'bsf:v': 'h264_mp4toannexb'}
+                )
+                .overwrite_output()
+            )
+            bounds = [0.0, *cuts, duration]
+            return [
+                (f"{stem}_{i:02d}.ts", end - start)
+                for i, (start, end) in enumerate(zip(bounds, bounds[1:]))
+            ]
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg remux error: {error_msg}")
+            raise RuntimeError(f"Failed to remux video: {error_msg}")
+    
+    def _plan_chunk_cuts(self, video: str, max_duration: float) -> List[float]:
+        """
+        Pick keyframes to split a video at, so chunks stay within max_duration
+        
+        Greedy: each chunk runs to the last keyframe that keeps it within
+        max_duration (or to the next keyframe if there is none in range).
+        """
+        probe = ffmpeg.probe(video, select_streams='v:0', skip_frame='nokey', show_entries='frame=pts_time')
+        keyframes = sorted(
+            float(frame['pts_time']) for frame in probe.get('frames', []) if frame.get('pts_time') not in (None, 'N/A')
+        )
+        duration = float(probe.get('format', {}).get('duration') or 0)
+        
+        cuts = []
+        chunk_start = 0.0
+        candidate = None
+        for keyframe in [k for k in keyframes if k > 0] + [duration]:
+            if keyframe - chunk_start > max_duration and candidate is not None:
+                cuts.append(candidate)
+                chunk_start = candidate
+            candidate = keyframe if keyframe < duration else None
+        return cuts
     
     def _get_video_duration(self, video: str) -> float:
         """Get video duration in seconds"""
         try:
-            probe = ffmpeg.probe(video)
-            duration = float(probe['format']['duration'])
-            return duration
+            return probe_media(video).duration
         except Exception as e:
             logger.warning(f"Failed to get video duration: {e}")
             return 0.0
@@ -276,9 +526,7 @@ class VideoService:
     def _get_audio_duration(self, audio: str) -> float:
         """Get audio duration in seconds"""
         try:
-            probe = ffmpeg.probe(audio)
-            duration = float(probe['format']['duration'])
-            return duration
+            return probe_media(audio).duration
         except Exception as e:
             logger.warning(f"Failed to get audio duration: {e}, using estimate")
             # Fallback: estimate based on file size (very rough)
@@ -299,16 +547,14 @@ class VideoService:
             True if video has audio stream, False otherwise
         """
         try:
-            probe = ffmpeg.probe(video)
-            audio_streams = [s for s in probe.get('streams', []) if s['codec_type'] == 'audio']
-            has_audio = len(audio_streams) > 0
+            has_audio = probe_media(video).has_audio
             logger.debug(f"Video {video} has_audio={has_audio}")
             return has_audio
         except Exception as e:
             logger.warning(f"Failed to probe video audio streams: {e}, assuming no audio")
             return False
     
-    def merge_audio_video(
+    async def merge_audio_video(
         self,
         video: str,
         audio: str,
@@ -319,6 +565,7 @@ class VideoService:
         pad_strategy: str = "freeze",  # "freeze" (freeze last frame) or "black" (black screen)
         auto_adjust_duration: bool = True,  # Automatically adjust video duration to match audio
         duration_tolerance: float = 0.3,  # Tolerance for video being longer than audio (seconds)
+        fps: Optional[float] = None,  # Output frame rate (None = keep source frame rate)
     ) -> str:
         """
         Merge audio with video with intelligent duration adjustment
@@ -347,6 +594,7 @@ class VideoService:
             auto_adjust_duration: Enable intelligent duration adjustment (default: True)
             duration_tolerance: Tolerance for video being longer than audio in seconds (default: 0.3)
                               Videos within this tolerance won't be trimmed
+            fps: Output frame rate (default: keep the source frame rate)
         
         Returns:
             Path to the output video file
@@ -362,10 +610,11 @@ class VideoService:
             - When video is silent, audio is added regardless of replace_audio
             - When replace_audio=True and video has audio, original audio is removed
             - When replace_audio=False and video has audio, original and new audio are mixed
+            - Output is encoded to the segment spec (see SegmentSpec)
         """
         # Get durations of video and audio
-        video_duration = self._get_video_duration(video)
-        audio_duration = self._get_audio_duration(audio)
+        video_duration = await asyncio.to_thread(self._get_video_duration, video)
+        audio_duration = await asyncio.to_thread(self._get_audio_duration, audio)
         
         logger.info(f"Video duration: {video_duration:.2f}s, Audio duration: {audio_duration:.2f}s")
         
@@ -376,14 +625,14 @@ class VideoService:
             if diff < 0:
                 # Video shorter than audio → Must pad to avoid black screen
                 logger.warning(f"⚠️ Video shorter than audio by {abs(diff):.2f}s, padding required")
-                video = self._pad_video_to_duration(video, audio_duration, pad_strategy)
+                video = await self._pad_video_to_duration(video, audio_duration, pad_strategy)
                 video_duration = audio_duration  # Update duration after padding
                 logger.info(f"📌 Padded video to {audio_duration:.2f}s")
             
             elif diff > duration_tolerance:
                 # Video significantly longer than audio → Trim
                 logger.info(f"⚠️ Video longer than audio by {diff:.2f}s (tolerance: {duration_tolerance}s)")
-                video = self._trim_video_to_duration(video, audio_duration)
+                video = await self._trim_video_to_duration(video, audio_duration)
                 video_duration = audio_duration  # Update duration after trimming
                 logger.info(f"✂️ Trimmed video to {audio_duration:.2f}s")
             
@@ -396,7 +645,7 @@ class VideoService:
         logger.info(f"Target output duration: {target_duration:.2f}s")
         
         # Check if video has audio stream
-        video_has_audio = self.has_audio_stream(video)
+        video_has_audio = await asyncio.to_thread(self.has_audio_stream, video)
         
         # Prepare video stream (potentially with padding)
         input_video = ffmpeg.input(video)
@@ -413,18 +662,15 @@ class VideoService:
             else:  # black
                 # Generate black frames for padding duration
                 # Get video properties
-                probe = ffmpeg.probe(video)
-                video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-                width = int(video_info['width'])
-                height = int(video_info['height'])
-                fps_str = video_info['r_frame_rate']
-                fps_num, fps_den = map(int, fps_str.split('/'))
-                fps = fps_num / fps_den if fps_den != 0 else 30
+                video_info = await asyncio.to_thread(probe_media, video)
+                width = video_info.width
+                height = video_info.height
+                source_fps = video_info.fps or 30
                 
                 # Create black video for padding
                 black_video_path = self._get_unique_temp_path("black_pad", os.path.basename(output))
                 black_input = ffmpeg.input(
-                    f'color=c=black:s={width}x{height}:r={fps}',
+                    f'color=c=black:s={width}x{height}:r={source_fps}',
                     f='lavfi',
                     t=pad_duration
                 )
@@ -447,18 +693,15 @@ class VideoService:
             logger.info(f"Video has no audio stream, adding audio track")
             # Video is silent, just add the audio
             try:
-                (
+                await self._run(
                     ffmpeg
                     .output(
                         video_stream,
                         audio_stream,
                         output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
+                        **SegmentSpec(fps=fps).encode_options()
                     )
                     .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
                 )
                 
                 logger.success(f"Audio added to silent video: {output}")
@@ -474,18 +717,15 @@ class VideoService:
         try:
             if replace_audio:
                 # Replace audio: use only new audio, ignore original
-                (
+                await self._run(
                     ffmpeg
                     .output(
                         video_stream,
                         audio_stream,
                         output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
+                        **SegmentSpec(fps=fps).encode_options()
                     )
                     .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
                 )
             else:
                 # Mix audio: combine original and new audio
@@ -499,18 +739,15 @@ class VideoService:
                     duration='longest'  # Use longest audio
                 )
                 
-                (
+                await self._run(
                     ffmpeg
                     .output(
                         video_stream,
                         mixed_audio,
                         output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
+                        **SegmentSpec(fps=fps).encode_options()
                     )
                     .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
                 )
             
             logger.success(f"Audio merged successfully: {output}")
@@ -520,12 +757,13 @@ class VideoService:
             logger.error(f"FFmpeg merge error: {error_msg}")
             raise RuntimeError(f"Failed to merge audio and video: {error_msg}")
     
-    def overlay_image_on_video(
+    async def overlay_image_on_video(
         self,
         video: str,
         overlay_image: str,
         output: str,
-        scale_mode: str = "contain"
+        scale_mode: str = "contain",
+        fps: Optional[float] = None
     ) -> str:
         """
         Overlay a transparent image on top of video
@@ -538,6 +776,7 @@ class VideoService:
                 - "contain": Scale video to fit within overlay dimensions (letterbox/pillarbox)
                 - "cover": Scale video to cover overlay dimensions (may crop)
                 - "stretch": Stretch video to exact overlay dimensions
+            fps: Output frame rate (default: keep the source frame rate)
         
         Returns:
             Path to the output video file
@@ -555,10 +794,9 @@ class VideoService:
         
         try:
             # Get overlay image dimensions
-            overlay_probe = ffmpeg.probe(overlay_image)
-            overlay_stream = next(s for s in overlay_probe['streams'] if s['codec_type'] == 'video')
-            overlay_width = int(overlay_stream['width'])
-            overlay_height = int(overlay_stream['height'])
+            overlay_info = await asyncio.to_thread(probe_media, overlay_image)
+            overlay_width = overlay_info.width
+            overlay_height = overlay_info.height
             
             logger.debug(f"Overlay dimensions: {overlay_width}x{overlay_height}")
             
@@ -585,10 +823,14 @@ class VideoService:
                 # Stretch to exact dimensions
                 scaled_video = input_video.filter('scale', overlay_width, overlay_height)
             
+            scaled_video = scaled_video.filter('setsar', '1')
+            if fps:
+                scaled_video = scaled_video.filter('fps', fps=fps)
+            
             # Overlay the transparent image on top of the scaled video
             output_stream = ffmpeg.overlay(scaled_video, input_overlay)
             
-            (
+            await self._run(
                 ffmpeg
                 .output(output_stream, output, 
                         vcodec='libx264',
@@ -596,7 +838,6 @@ class VideoService:
                         preset='medium',
                         crf=23)
                 .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
             )
             
             logger.success(f"Image overlaid on video: {output}")
@@ -606,12 +847,17 @@ class VideoService:
             logger.error(f"FFmpeg overlay error: {error_msg}")
             raise RuntimeError(f"Failed to overlay image on video: {error_msg}")
     
-    def create_video_from_image(
+    # Input frame rate for "still" segment encoding (the PNG is decoded and converted once per second)
+    STILL_INPUT_FPS = 1
+    
+    async def create_video_from_image(
         self,
         image: str,
         audio: str,
         output: str,
         fps: int = 30,
+        encode_mode: Literal["standard", "still"] = "standard",
+        progress_callback: Optional[Callable[[float], None]] = None,
     ) -> str:
         """
         Create video from static image and audio
@@ -621,6 +867,12 @@ class VideoService:
             audio: Audio file path
             output: Output video path
             fps: Frames per second
+            encode_mode: Segment encoder mode
+                - "standard": Loop the image at full fps (libx264 medium, crf 23, 2M bitrate)
+                - "still": Fast path for static frames: the image is read at 1 fps and
+                  duplicated to the output fps before a still-picture tuned, veryfast
+                  x264 encode (same resolution/fps/codecs, so segments stay concat-compatible)
+            progress_callback: Optional callback receiving encode progress in [0, 1]
         
         Returns:
             Path to the output video
@@ -632,56 +884,210 @@ class VideoService:
             - Image is displayed as static frame for the duration of audio
             - Video duration matches audio duration
             - Useful for creating video segments from storyboard frames
+            - Output is encoded to the segment spec (see SegmentSpec)
         
         Example:
-            >>> compositor.create_video_from_image(
+            >>> await compositor.create_video_from_image(
             ...     "frame.png",
             ...     "narration.mp3",
             ...     "segment.mp4"
             ... )
         """
-        logger.info("Creating video from image and audio")
+        logger.info(f"Creating video from image and audio (mode={encode_mode})")
         
         try:
             # Get audio duration to ensure exact video duration match
-            probe = ffmpeg.probe(audio)
-            audio_duration = float(probe['format']['duration'])
+            audio_duration = (await asyncio.to_thread(probe_media, audio)).duration
             logger.debug(f"Audio duration: {audio_duration:.3f}s")
             
+            input_audio = ffmpeg.input(audio)
+            
+            input_fps, video_options = self._image_encode_options(encode_mode, fps)
+            
             # Input image with loop (loop=1 means loop indefinitely)
             # Use framerate to set input framerate
-            input_image = ffmpeg.input(image, loop=1, framerate=fps)
-            input_audio = ffmpeg.input(audio)
+            input_image = ffmpeg.input(image, loop=1, framerate=input_fps)
             
             # Combine image and audio
             # Use -t to explicitly set video duration = audio duration
-            (
+            await self._run(
                 ffmpeg
                 .output(
                     input_image,
                     input_audio,
                     output,
                     t=audio_duration,  # Force video duration to match audio exactly
+                    **{**SegmentSpec(fps=fps).encode_options(), **video_options}
+                )
+                .overwrite_output(),
+                duration=audio_duration,
+                progress_callback=progress_callback
+            )
+            
+            logger.success(f"Video created from image: {output} (duration: {audio_duration:.3f}s)")
+            return output
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg error creating video from image: {error_msg}")
+            raise RuntimeError(f"Failed to create video from image: {error_msg}")
+    
+    def _image_encode_options(self, encode_mode: str, fps: int) -> tuple[int, dict]:
+        """
+        Get input frame rate and x264 options for encoding a static image
+        
+        Returns:
+            (input_fps, video_options) tuple
+        """
+        if encode_mode == "still":
+            # Decode/convert the PNG only STILL_INPUT_FPS times per second; duplicated
+            # frames are nearly free for x264 with tune=stillimage
+            return self.STILL_INPUT_FPS, {
+                'r': fps,
+                'preset': 'veryfast',
+                'tune': 'stillimage',
+                'crf': 23,
+            }
+        return fps, {
+            'preset': 'medium',
+            'crf': 23,
+            'b:v': '2M',  # Video bitrate
+        }
+    
+    async def render_timeline(
+        self,
+        images: List[str],
+        audios: List[str],
+        output: str,
+        durations: Optional[List[float]] = None,
+        fps: int = 30,
+        encode_mode: Literal["standard", "still"] = "standard",
+        bgm_path: Optional[str] = None,
+        bgm_volume: float = 0.2,
+        bgm_mode: Literal["once", "loop"] = "loop",
+        bgm_fade_in: float = 0.0,
+        bgm_fade_out: float = 0.0,
+        bgm_ducking: bool = False,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """
+        Render the whole video from composed images and narration in one pass
+        
+        Replaces create_video_from_image per frame + concat_videos + add_bgm:
+        all frames are concatenated and BGM is mixed in a single filter graph,
+        so there is one encoder session and no intermediate segment files.
+        
+        FFmpeg equivalent (2 frames + BGM):
+            ffmpeg -loop 1 -t d0 -i f0.png -i a0.mp3 -loop 1 -t d1 -i f1.png -i a1.mp3
+                   -stream_loop -1 -i bgm.mp3
+                   -filter_complex "[0:v]fps,trim,setpts[v0];[1:a]aformat,apad,atrim,asetpts[a0];...
+                                    [v0][a0][v1][a1]concat=n=2:v=1:a=1[v][a];
+                                    [4:a]volume[b];[a][b]amix=inputs=2:duration=first[mix]"
+                   -map "[v]" -map "[mix]" -c:v libx264 -c:a aac output.mp4
+        
+        Args:
+            images: Composed frame images, in order
+            audios: Narration audio per frame (same length as images)
+            output: Output video path
+            durations: Duration per frame in seconds (None = probe audio files)
+            fps: Frames per second
+            encode_mode: "standard" or "still" (see create_video_from_image)
+            bgm_path: Background music (preset filename or custom path, optional)
+            bgm_volume: BGM volume level (0.0-1.0), default 0.2
+            bgm_mode: "once" or "loop"
+            bgm_fade_in: BGM fade-in duration in seconds (0 = none)
+            bgm_fade_out: BGM fade-out duration in seconds (0 = none)
+            bgm_ducking: Lower the BGM while narration is playing
+            progress_callback: Optional callback receiving encode progress in [0, 1]
+        
+        Returns:
+            Path to the output video
+        
+        Raises:
+            ValueError: If inputs are empty or lengths don't match
+            RuntimeError: If FFmpeg execution fails
+        
+        Note:
+            - Only for image frames; video frames still need per-segment overlay
+            - Output matches create_video_from_image + concat_videos + add_bgm
+        """
+        if not images:
+            raise ValueError("Images list cannot be empty")
+        if len(images) != len(audios):
+            raise ValueError(f"Got {len(images)} images but {len(audios)} audio files")
+        if durations is None:
+            durations = list(await asyncio.gather(
+                *(asyncio.to_thread(self._get_audio_duration, audio) for audio in audios)
+            ))
+        elif len(durations) != len(images):
+            raise ValueError(f"Got {len(images)} images but {len(durations)} durations")
+        
+        logger.info(f"Rendering timeline of {len(images)} frames in one pass (mode={encode_mode})")
+        
+        input_fps, video_options = self._image_encode_options(encode_mode, fps)
+        video_options.pop('r', None)  # Output rate is set by the fps filter below
+        
+        streams = []
+        for image, audio, duration in zip(images, audios, durations):
+            video = (
+                ffmpeg.input(image, loop=1, framerate=input_fps, t=duration)
+                .video
+                .filter('fps', fps=fps)
+                .filter('trim', duration=duration)
+                .filter('setpts', 'PTS-STARTPTS')
+                .filter('setsar', '1')
+            )
+            # Pad/trim narration to the frame duration so audio and video stay aligned across cuts
+            narration = (
+                ffmpeg.input(audio)
+                .audio
+                .filter('aformat', sample_rates=44100, channel_layouts='stereo')
+                .filter('apad')
+                .filter('atrim', duration=duration)
+                .filter('asetpts', 'PTS-STARTPTS')
+            )
+            streams.extend([video, narration])
+        
+        joined = ffmpeg.concat(*streams, v=1, a=1).node
+        video_stream, audio_stream = joined[0], joined[1]
+        
+        if bgm_path:
+            audio_stream = self._mix_bgm(
+                audio_stream,
+                bgm_path=bgm_path,
+                volume=bgm_volume,
+                mode=bgm_mode,
+                duration=sum(durations),
+                fade_in=bgm_fade_in,
+                fade_out=bgm_fade_out,
+                ducking=bgm_ducking
+            )
+        
+        try:
+            await self._run(
+                ffmpeg
+                .output(
+                    video_stream,
+                    audio_stream,
+                    output,
                     vcodec='libx264',
                     acodec='aac',
                     pix_fmt='yuv420p',
                     audio_bitrate='192k',
-                    preset='medium',
-                    crf=23,
-                    **{'b:v': '2M'}  # Video bitrate
+                    **video_options
                 )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .overwrite_output(),
+                duration=sum(durations),
+                progress_callback=progress_callback
             )
             
-            logger.success(f"Video created from image: {output} (duration: {audio_duration:.3f}s)")
+            logger.success(f"Timeline rendered: {output} (duration: {sum(durations):.3f}s)")
             return output
         except ffmpeg.Error as e:
             error_msg = e.stderr.decode() if e.stderr else str(e)
-            logger.error(f"FFmpeg error creating video from image: {error_msg}")
-            raise RuntimeError(f"Failed to create video from image: {error_msg}")
+            logger.error(f"FFmpeg timeline render error: {error_msg}")
+            raise RuntimeError(f"Failed to render timeline: {error_msg}")
     
-    def add_bgm(
+    async def add_bgm(
         self,
         video: str,
         bgm: str,
@@ -690,6 +1096,7 @@ class VideoService:
         loop: bool = True,
         fade_in: float = 0.0,
         fade_out: float = 0.0,
+        ducking: bool = False,
     ) -> str:
         """
         Add background music to video
@@ -701,7 +1108,8 @@ class VideoService:
             bgm_volume: BGM volume relative to original (0.0 to 1.0+)
             loop: If True, loop BGM to match video duration
             fade_in: BGM fade-in duration in seconds
-            fade_out: BGM fade-out duration in seconds (not yet implemented)
+            fade_out: BGM fade-out duration in seconds (ends with the video)
+            ducking: Lower the BGM while the original audio is loud
         
         Returns:
             Path to the output video file
@@ -713,40 +1121,26 @@ class VideoService:
             - BGM is mixed with original video audio
             - If loop=True, BGM repeats until video ends
             - Fade effects are applied to BGM only
+            - Video stream is copied; to concatenate and add BGM, use
+              concat_videos(bgm_path=...), which does both in one pass
         """
         logger.info(f"Adding BGM to video (volume={bgm_volume}, loop={loop})")
         
         try:
+            duration = (await asyncio.to_thread(probe_media, video)).duration
             input_video = ffmpeg.input(video)
-            
-            # Configure BGM input with looping if needed
-            bgm_input = ffmpeg.input(
-                bgm,
-                stream_loop=-1 if loop else 0  # -1 = infinite loop
-            )
-            
-            # Apply volume adjustment to BGM
-            bgm_audio = bgm_input.audio.filter('volume', bgm_volume)
-            
-            # Apply fade effects if specified
-            if fade_in > 0:
-                bgm_audio = bgm_audio.filter('afade', type='in', duration=fade_in)
-            # Note: fade_out at the end requires knowing the duration, which is complex
-            # For now, we skip fade_out in this implementation
-            # A more advanced implementation would need to:
-            # 1. Get video duration
-            # 2. Calculate fade_out start time
-            # 3. Apply fade filter with specific start_time
-            
-            # Mix original audio with BGM
-            mixed_audio = ffmpeg.filter(
-                [input_video.audio, bgm_audio],
-                'amix',
-                inputs=2,
-                duration='first'  # Use video's duration
+            mixed_audio = self._mix_bgm(
+                input_video.audio,
+                bgm_path=bgm,
+                volume=bgm_volume,
+                mode="loop" if loop else "once",
+                duration=duration,
+                fade_in=fade_in,
+                fade_out=fade_out,
+                ducking=ducking
             )
             
-            (
+            await self._run(
                 ffmpeg
                 .output(
                     input_video.video,
@@ -757,7 +1151,6 @@ class VideoService:
                     audio_bitrate='192k'
                 )
                 .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
             )
             
             logger.success(f"BGM added successfully: {output}")
@@ -767,42 +1160,79 @@ class VideoService:
             logger.error(f"FFmpeg BGM error: {error_msg}")
             raise RuntimeError(f"Failed to add BGM: {error_msg}")
     
-    def _add_bgm_to_video(
+    # Sidechain compression applied to BGM under narration (bgm_ducking)
+    BGM_DUCKING_OPTIONS = {
+        'threshold': 0.05,  # Narration level that starts ducking
+        'ratio': 8,
+        'attack': 20,       # ms
+        'release': 400,     # ms
+    }
+    
+    def _mix_bgm(
         self,
-        video: str,
+        audio,
         bgm_path: str,
-        output: str,
         volume: float = 0.2,
-        mode: Literal["once", "loop"] = "loop"
-    ) -> str:
+        mode: Literal["once", "loop"] = "loop",
+        duration: float = 0.0,
+        fade_in: float = 0.0,
+        fade_out: float = 0.0,
+        ducking: bool = False
+    ):
         """
-        Internal helper to add BGM to video with path resolution
+        Build the filter graph mixing BGM under an audio stream
+        
+        FFmpeg equivalent (fades + ducking):
+            -stream_loop -1 -i bgm.mp3
+            -filter_complex "[1:a]volume,afade=t=in,afade=t=out[b];[0:a]asplit[n][sc];
+                             [b][sc]sidechaincompress[d];[n][d]amix=inputs=2:duration=first[a]"
         
         Args:
-            video: Video file path
-            bgm_path: BGM path (can be preset name or custom path)
-            output: Output file path
+            audio: Main audio stream (ffmpeg-python), e.g. concatenated narration
+            bgm_path: BGM path (preset name or custom path)
             volume: BGM volume (0.0-1.0)
-            mode: "once" or "loop"
+            mode: "once" or "loop" (-stream_loop -1)
+            duration: Output duration in seconds (needed for fade_out)
+            fade_in: BGM fade-in duration in seconds
+            fade_out: BGM fade-out duration in seconds
+            ducking: Compress the BGM with the main audio as sidechain
         
         Returns:
-            Path to output video
+            Mixed audio stream (same duration as the main audio)
         
         Raises:
             FileNotFoundError: If BGM file not found
         """
         # Resolve BGM path (raises FileNotFoundError if not found)
         resolved_bgm = self._resolve_bgm_path(bgm_path)
+        logger.info(
+            f"Mixing BGM: {resolved_bgm} (volume={volume}, mode={mode}, "
+            f"fade={fade_in}s/{fade_out}s, ducking={ducking})"
+        )
+        
+        bgm_audio = (
+            ffmpeg.input(resolved_bgm, stream_loop=-1 if mode == "loop" else 0)
+            .audio
+            .filter('volume', volume)
+        )
+        if fade_in > 0:
+            bgm_audio = bgm_audio.filter('afade', type='in', start_time=0, duration=fade_in)
+        if fade_out > 0 and duration > 0:
+            bgm_audio = bgm_audio.filter(
+                'afade', type='out', start_time=max(0.0, duration - fade_out), duration=min(fade_out, duration)
+            )
         
-        # Add BGM using existing method
-        loop = (mode == "loop")
-        return self.add_bgm(
-            video=video,
-            bgm=resolved_bgm,
-            output=output,
-            bgm_volume=volume,
-            loop=loop,
-            fade_in=0.0
+        if ducking:
+            split = audio.asplit()
+            audio, sidechain = split[0], split[1]
+            bgm_audio = ffmpeg.filter([bgm_audio, sidechain], 'sidechaincompress', **self.BGM_DUCKING_OPTIONS)
+        
+        # Main audio duration wins
+        return ffmpeg.filter(
+            [audio, bgm_audio],
+            'amix',
+            inputs=2,
+            duration='first'
         )
     
     def _get_unique_temp_path(self, prefix: str, original_filename: str) -> str:
@@ -889,7 +1319,7 @@ class VideoService:
             logger.warning(f"Failed to list BGM files: {e}")
             return []
     
-    def _trim_video_to_duration(self, video: str, target_duration: float) -> str:
+    async def _trim_video_to_duration(self, video: str, target_duration: float) -> str:
         """
         Trim video to specified duration
         
@@ -907,12 +1337,11 @@ class VideoService:
         
         try:
             # Use stream copy when possible for fast trimming
-            (
+            await self._run(
                 ffmpeg
                 .input(video, t=target_duration)
-                .output(output, vcodec='copy', acodec='copy' if self.has_audio_stream(video) else 'copy')
+                .output(output, vcodec='copy', acodec='copy')
                 .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True, quiet=True)
             )
             return output
         except ffmpeg.Error as e:
@@ -920,7 +1349,7 @@ class VideoService:
             logger.error(f"FFmpeg error trimming video: {error_msg}")
             raise RuntimeError(f"Failed to trim video: {error_msg}")
     
-    def _pad_video_to_duration(self, video: str, target_duration: float, pad_strategy: str = "freeze") -> str:
+    async def _pad_video_to_duration(self, video: str, target_duration: float, pad_strategy: str = "freeze") -> str:
         """
         Pad video to specified duration by extending the last frame or adding black frames
         
@@ -937,7 +1366,7 @@ class VideoService:
         """
         output = self._get_unique_temp_path("padded", os.path.basename(video))
         
-        video_duration = self._get_video_duration(video)
+        video_duration = await asyncio.to_thread(self._get_video_duration, video)
         pad_duration = target_duration - video_duration
         
         if pad_duration <= 0:
@@ -953,7 +1382,7 @@ class VideoService:
                 video_stream = video_stream.filter('tpad', stop_mode='clone', stop_duration=pad_duration)
                 
                 # Output with re-encoding (tpad requires it)
-                (
+                await self._run(
                     ffmpeg
                     .output(
                         video_stream,
@@ -963,18 +1392,14 @@ class VideoService:
                         crf=23
                     )
                     .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True, quiet=True)
                 )
             else:  # black
                 # Generate black frames for padding duration
                 # Get video properties
-                probe = ffmpeg.probe(video)
-                video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-                width = int(video_info['width'])
-                height = int(video_info['height'])
-                fps_str = video_info['r_frame_rate']
-                fps_num, fps_den = map(int, fps_str.split('/'))
-                fps = fps_num / fps_den if fps_den != 0 else 30
+                video_info = await asyncio.to_thread(probe_media, video)
+                width = video_info.width
+                height = video_info.height
+                fps = video_info.fps or 30
                 
                 # Create black video for padding
                 black_input = ffmpeg.input(
@@ -986,7 +1411,7 @@ class VideoService:
                 # Concatenate original video with black padding
                 video_stream = ffmpeg.concat(video_stream, black_input.video, v=1, a=0)
                 
-                (
+                await self._run(
                     ffmpeg
                     .output(
                         video_stream,
@@ -996,7 +1421,6 @@ class VideoService:
                         crf=23
                     )
                     .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True, quiet=True)
                 )
             
             return output
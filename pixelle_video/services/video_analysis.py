@@ -19,10 +19,12 @@ Uses ComfyUI workflows to analyze video content and generate descriptions.
 from typing import Optional, Literal
 from pathlib import Path
 
+import httpx
 from comfykit import ComfyKit
 from loguru import logger
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
+from pixelle_video.services.downloader import get_downloader
 
 
 class VideoAnalysisService(ComfyBaseService):
@@ -182,15 +184,13 @@ class VideoAnalysisService(ComfyBaseService):
                     # Find text file entry
                     for item in raw_data:
                         if item.get('fileType') == 'txt' and 'fileUrl' in item:
-                            # Download text content from URL
-                            import aiohttp
-                            async with aiohttp.ClientSession() as session:
-                                async with session.get(item['fileUrl']) as resp:
-                                    if resp.status == 200:
-                                        description = await resp.text()
-                                        description = description.strip()
-                                        logger.debug(f"Downloaded description from URL: {description[:100]}...")
-                                        break
+                            # Download text content from URL (shared pooled client)
+                            try:
+                                description = (await get_downloader().fetch_text(item['fileUrl'])).strip()
+                                logger.debug(f"Downloaded description from URL: {description[:100]}...")
+                                break
+                            except httpx.HTTPError as e:
+                                logger.warning(f"Failed to fetch description from {item['fileUrl']}: {e}")
             
             if not description:
                 logger.error(f"No text found in result. Status: {result.status}, Outputs: {result.outputs}, Texts: {result.texts}")
@@ -0,0 +1,214 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Workflow Registry - Shared index of ComfyUI workflow files
+
+Workflow files from workflows/ and data/workflows/ (custom overrides default)
+are parsed once and indexed by key ("{source}/{filename}"). The index is
+rebuilt when one of the workflow directories changes (directory mtime,
+checked at most once per check_interval), so adding, removing or replacing
+a workflow file is picked up without a restart. Unchanged files are not
+parsed again.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from pixelle_video.utils.os_util import get_data_path, get_root_path
+
+
+def parse_workflow_file(file_path: Path, source: str) -> Dict[str, Any]:
+    """
+    Parse workflow file and extract metadata
+
+    Args:
+        file_path: Path to workflow JSON file
+        source: Source directory name (e.g., "selfhost", "runninghub")
+
+    Returns:
+        Workflow info dict with structure:
+        {
+            "name": "image_flux.json",
+            "display_name": "image_flux.json - Runninghub",
+            "source": "runninghub",
+            "path": "workflows/runninghub/image_flux.json",
+            "key": "runninghub/image_flux.json",
+            "workflow_id": "123456"  # Only for RunningHub
+        }
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = json.load(f)
+
+    # Build base info
+    workflow_info = {
+        "name": file_path.name,
+        "display_name": f"{file_path.name} - {source.title()}",
+        "source": source,
+        "path": str(file_path),
+        "key": f"{source}/{file_path.name}"
+    }
+
+    # Check if it's a wrapper format (RunningHub, etc.)
+    if "source" in content:
+        # Wrapper format: {"source": "runninghub", "workflow_id": "xxx", ...}
+        if "workflow_id" in content:
+            workflow_info["workflow_id"] = content["workflow_id"]
+
+    return workflow_info
+
+
+class WorkflowRegistry:
+    """
+    Cached index of all workflow files
+
+    Usage:
+        >>> registry = get_workflow_registry()
+        >>> registry.list("tts_")
+        [{'key': 'runninghub/tts_edge.json', ...}, ...]
+        >>> registry.get("selfhost/image_flux.json")
+        {'key': 'selfhost/image_flux.json', 'path': '...', ...}
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        """
+        Initialize workflow registry
+
+        Args:
+            check_interval: Min seconds between directory change checks
+        """
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._workflows: Dict[str, Dict[str, Any]] = {}
+        self._signature: Optional[tuple] = None
+        self._checked_at = 0.0
+        # Parsed files by path, reused while (mtime, size) is unchanged
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+    def _workflow_dirs(self) -> List[Path]:
+        """Workflow root directories, lowest priority first"""
+        return [Path(get_root_path("workflows")), Path(get_data_path("workflows"))]
+
+    def _compute_signature(self) -> tuple:
+        """Mtimes of the workflow roots and their source directories"""
+        signature = []
+        for root in self._workflow_dirs():
+            try:
+                signature.append((str(root), root.stat().st_mtime_ns))
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            signature.append((entry.path, entry.stat().st_mtime_ns))
+            except FileNotFoundError:
+                signature.append((str(root), None))
+        return tuple(sorted(signature, key=lambda item: item[0]))
+
+    def _refresh(self):
+        """Rebuild the index if a workflow directory changed (throttled)"""
+        now = time.monotonic()
+        if self._signature is not None and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+
+        signature = self._compute_signature()
+        if signature == self._signature:
+            return
+
+        # Collect files per source, custom (data/) overrides default
+        files: Dict[str, Path] = {}
+        for root in self._workflow_dirs():
+            if not root.is_dir():
+                continue
+            for source_dir in root.iterdir():
+                if not source_dir.is_dir():
+                    continue
+                for file_path in source_dir.iterdir():
+                    if file_path.is_file() and file_path.suffix == ".json":
+                        files[f"{source_dir.name}/{file_path.name}"] = file_path
+
+        workflows = {}
+        parsed = {}
+        for key, file_path in files.items():
+            source = key.split("/", 1)[0]
+            try:
+                stat = file_path.stat()
+                version = (stat.st_mtime_ns, stat.st_size)
+                cached = self._parsed.get(str(file_path))
+                if cached is not None and cached[0] == version:
+                    info = cached[1]
+                else:
+                    info = parse_workflow_file(file_path, source)
+                    logger.debug(f"Found workflow: {key}")
+                parsed[str(file_path)] = (version, info)
+                workflows[key] = info
+            except Exception as e:
+                logger.error(f"Failed to parse workflow {key}: {e}")
+
+        if not workflows:
+            logger.warning("No workflow files found")
+
+        self._workflows = dict(sorted(workflows.items()))
+        self._parsed = parsed
+        self._signature = signature
+
+    def list(self, prefix: Union[str, Tuple[str, ...]] = "") -> List[Dict[str, Any]]:
+        """
+        List workflows whose filename starts with prefix
+
+        Args:
+            prefix: Filename prefix, or a tuple of prefixes (e.g., ("image_", "video_"))
+
+        Returns:
+            List of workflow info dicts (sorted by key)
+        """
+        with self._lock:
+            self._refresh()
+            return [dict(info) for info in self._workflows.values() if info["name"].startswith(prefix)]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get workflow info by key
+
+        Args:
+            key: Workflow key (e.g., "runninghub/image_flux.json")
+
+        Returns:
+            Workflow info dict, or None if not found
+        """
+        with self._lock:
+            self._refresh()
+            info = self._workflows.get(key)
+            return dict(info) if info is not None else None
+
+    def invalidate(self):
+        """Force a directory check on next access (e.g. after saving a workflow in place)"""
+        with self._lock:
+            self._signature = None
+
+
+# Global workflow registry (created on first use)
+_workflow_registry: Optional[WorkflowRegistry] = None
+
+
+def get_workflow_registry() -> WorkflowRegistry:
+    """Get the process-wide workflow registry"""
+    global _workflow_registry
+
+    if _workflow_registry is None:
+        _workflow_registry = WorkflowRegistry()
+    return _workflow_registry
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Async utilities shared by services and pipelines
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Deque, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class SlotPool:
+    """
+    Counting semaphore shared by all event loops of the process
+
+    asyncio.Semaphore is bound to one loop, and Streamlit runs each action in
+    a fresh loop while the API has its own, so the count is kept under a
+    threading lock and a released slot is handed straight to the oldest
+    waiter, whichever loop it is waiting on.
+
+    Usage:
+        >>> slots = SlotPool(4)
+        >>> async with slots:
+        ...     await work()
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._free = size
+        self._lock = threading.Lock()
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                    handed_over = False
+                except ValueError:
+                    handed_over = True
+            # The slot was already handed to us: pass it on
+            if handed_over:
+                self.release()
+            raise
+
+    async def __aexit__(self, *exc_info):
+        self.release()
+
+    def release(self):
+        """Free a slot (callable from any thread or loop)"""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_wake, waiter)
+                    return
+                except RuntimeError:
+                    # Waiter's loop is closed, try the next one
+                    continue
+            self._free += 1
+
+
+async def gather_limited(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[R]],
+    limit: Optional[int] = None
+) -> List[R]:
+    """
+    Run func over items concurrently, with at most `limit` calls in flight
+
+    Results keep the order of items. If one call fails (or the caller is
+    cancelled), the others are cancelled and awaited before the error is
+    raised, so no call outlives the gather.
+
+    Args:
+        items: Inputs, one call each
+        func: Coroutine function called with each item
+        limit: Max concurrent calls (None = no limit)
+
+    Returns:
+        Results in the order of items
+    """
+    semaphore = asyncio.Semaphore(max(1, limit)) if limit is not None else None
+
+    async def run(item: T) -> R:
+        if semaphore is None:
+            return await func(item)
+        async with semaphore:
+            return await func(item)
+
+    tasks = [asyncio.create_task(run(item)) for item in items]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -19,10 +19,12 @@ These functions are reusable across different pipelines.
 
 import json
 import re
-from typing import List, Optional, Literal
+from typing import Any, Callable, Dict, List, Optional, Literal
 
 from loguru import logger
 
+from pixelle_video.utils.async_util import gather_limited
+
 
 async def generate_title(
     llm_service,
@@ -155,17 +157,25 @@ async def generate_narrations_from_content(
     content: str,
     n_scenes: int = 5,
     min_words: int = 5,
-    max_words: int = 20
+    max_words: int = 20,
+    batch_size: int = 10,
+    max_concurrency: Optional[int] = None
 ) -> List[str]:
     """
     Generate narrations from user-provided content using LLM
     
+    Long content with more than batch_size scenes is split into sections at
+    paragraph (or sentence) boundaries, and each section is refined by its
+    own LLM request, dispatched concurrently.
+    
     Args:
         llm_service: LLM service instance
         content: User-provided content
         n_scenes: Number of narrations to generate
         min_words: Minimum narration length
         max_words: Maximum narration length
+        batch_size: Max narrations per LLM request (default: 10)
+        max_concurrency: Max concurrent LLM requests (default: llm.max_concurrency)
     
     Returns:
         List of narration texts
@@ -174,33 +184,48 @@ async def generate_narrations_from_content(
     
     logger.info(f"Generating {n_scenes} narrations from content ({len(content)} chars)")
     
-    prompt = build_content_narration_prompt(
-        content=content,
-        n_storyboard=n_scenes,
-        min_words=min_words,
-        max_words=max_words
-    )
-    
-    response = await llm_service(
-        prompt=prompt,
-        temperature=0.8,
-        max_tokens=2000
-    )
-    
-    # Parse JSON
-    result = _parse_json(response)
-    
-    if "narrations" not in result:
-        raise ValueError("Invalid response format: missing 'narrations' key")
-    
-    narrations = result["narrations"]
+    sections = _split_content(content, -(-n_scenes // batch_size)) if n_scenes > batch_size else [content]
+    
+    # Spread scenes over sections, earlier sections take the remainder
+    base, extra = divmod(n_scenes, len(sections))
+    counts = [base + (1 if i < extra else 0) for i in range(len(sections))]
+    if len(sections) > 1:
+        logger.info(f"Split content into {len(sections)} sections ({counts} narrations)")
+    
+    async def refine(index: int) -> List[str]:
+        section, count = sections[index], counts[index]
+        prompt = build_content_narration_prompt(
+            content=section,
+            n_storyboard=count,
+            min_words=min_words,
+            max_words=max_words
+        )
+        
+        response = await llm_service(
+            prompt=prompt,
+            temperature=0.8,
+            max_tokens=2000
+        )
+        
+        # Parse JSON
+        result = _parse_json(response)
+        
+        if "narrations" not in result:
+            raise ValueError("Invalid response format: missing 'narrations' key")
+        
+        narrations = result["narrations"]
+        
+        # Validate count
+        if len(narrations) > count:
+            logger.warning(f"Got {len(narrations)} narrations, taking first {count}")
+            narrations = narrations[:count]
+        elif len(narrations) < count:
+            raise ValueError(f"Expected {count} narrations, got only {len(narrations)}")
+        
+        return narrations
     
-    # Validate count
-    if len(narrations) > n_scenes:
-        logger.warning(f"Got {len(narrations)} narrations, taking first {n_scenes}")
-        narrations = narrations[:n_scenes]
-    elif len(narrations) < n_scenes:
-        raise ValueError(f"Expected {n_scenes} narrations, got only {len(narrations)}")
+    results = await gather_limited(range(len(sections)), refine, _llm_concurrency(max_concurrency))
+    narrations = [narration for section_narrations in results for narration in section_narrations]
     
     logger.info(f"Generated {len(narrations)} narrations successfully")
     return narrations
@@ -273,10 +298,11 @@ async def generate_image_prompts(
     max_words: int = 60,
     batch_size: int = 10,
     max_retries: int = 3,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_concurrency: Optional[int] = None
 ) -> List[str]:
     """
-    Generate image prompts from narrations (with batching and retry)
+    Generate image prompts from narrations (with concurrent batches and retry)
     
     Args:
         llm_service: LLM service instance
@@ -284,8 +310,9 @@ async def generate_image_prompts(
         min_words: Min image prompt length
         max_words: Max image prompt length
         batch_size: Max narrations per batch (default: 10)
-        max_retries: Max retry attempts per batch (default: 3)
+        max_retries: Max attempts per batch, including repair requests (default: 3)
         progress_callback: Optional callback(completed, total, message) for progress updates
+        max_concurrency: Max batches in flight (default: llm.max_concurrency)
     
     Returns:
         List of image prompts (base prompts, without prefix applied)
@@ -294,79 +321,21 @@ async def generate_image_prompts(
     
     logger.info(f"Generating image prompts for {len(narrations)} narrations (batch_size={batch_size})")
     
-    # Split narrations into batches
-    batches = [narrations[i:i + batch_size] for i in range(0, len(narrations), batch_size)]
-    logger.info(f"Split into {len(batches)} batches")
-    
-    all_prompts = []
-    
-    # Process each batch
-    for batch_idx, batch_narrations in enumerate(batches, 1):
-        logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
-        
-        # Retry logic for this batch
-        for attempt in range(1, max_retries + 1):
-            try:
-                # Generate prompts for this batch
-                prompt = build_image_prompt_prompt(
-                    narrations=batch_narrations,
-                    min_words=min_words,
-                    max_words=max_words
-                )
-                
-                response = await llm_service(
-                    prompt=prompt,
-                    temperature=0.7,
-                    max_tokens=8192
-                )
-                
-                logger.debug(f"Batch {batch_idx} attempt {attempt}: LLM response length: {len(response)} chars")
-                
-                # Parse JSON
-                result = _parse_json(response)
-                
-                if "image_prompts" not in result:
-                    raise KeyError("Invalid response format: missing 'image_prompts'")
-                
-                batch_prompts = result["image_prompts"]
-                
-                # Validate count
-                if len(batch_prompts) != len(batch_narrations):
-                    error_msg = (
-                        f"Batch {batch_idx} prompt count mismatch (attempt {attempt}/{max_retries}):\n"
-                        f"  Expected: {len(batch_narrations)} prompts\n"
-                        f"  Got: {len(batch_prompts)} prompts"
-                    )
-                    logger.warning(error_msg)
-                    
-                    if attempt < max_retries:
-                        logger.info(f"Retrying batch {batch_idx}...")
-                        continue
-                    else:
-                        raise ValueError(error_msg)
-                
-                # Success!
-                logger.info(f"✅ Batch {batch_idx} completed successfully ({len(batch_prompts)} prompts)")
-                all_prompts.extend(batch_prompts)
-                
-                # Report progress
-                if progress_callback:
-                    progress_callback(
-                        len(all_prompts),
-                        len(narrations),
-                        f"Batch {batch_idx}/{len(batches)} completed"
-                    )
-                
-                break
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Batch {batch_idx} JSON parse error (attempt {attempt}/{max_retries}): {e}")
-                if attempt >= max_retries:
-                    raise
-                logger.info(f"Retrying batch {batch_idx}...")
+    prompts = await _generate_prompts_in_batches(
+        llm_service,
+        narrations,
+        build_prompt=build_image_prompt_prompt,
+        result_key="image_prompts",
+        min_words=min_words,
+        max_words=max_words,
+        batch_size=batch_size,
+        max_retries=max_retries,
+        progress_callback=progress_callback,
+        max_concurrency=max_concurrency
+    )
     
-    logger.info(f"✅ Generated {len(all_prompts)} image prompts")
-    return all_prompts
+    logger.info(f"✅ Generated {len(prompts)} image prompts")
+    return prompts
 
 
 async def generate_video_prompts(
@@ -376,10 +345,11 @@ async def generate_video_prompts(
     max_words: int = 60,
     batch_size: int = 10,
     max_retries: int = 3,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_concurrency: Optional[int] = None
 ) -> List[str]:
     """
-    Generate video prompts from narrations (with batching and retry)
+    Generate video prompts from narrations (with concurrent batches and retry)
     
     Args:
         llm_service: LLM service instance
@@ -387,8 +357,9 @@ async def generate_video_prompts(
         min_words: Min video prompt length
         max_words: Max video prompt length
         batch_size: Max narrations per batch (default: 10)
-        max_retries: Max retry attempts per batch (default: 3)
+        max_retries: Max attempts per batch, including repair requests (default: 3)
         progress_callback: Optional callback(completed, total, message) for progress updates
+        max_concurrency: Max batches in flight (default: llm.max_concurrency)
     
     Returns:
         List of video prompts (base prompts, without prefix applied)
@@ -397,24 +368,71 @@ async def generate_video_prompts(
     
     logger.info(f"Generating video prompts for {len(narrations)} narrations (batch_size={batch_size})")
     
+    prompts = await _generate_prompts_in_batches(
+        llm_service,
+        narrations,
+        build_prompt=build_video_prompt_prompt,
+        result_key="video_prompts",
+        min_words=min_words,
+        max_words=max_words,
+        batch_size=batch_size,
+        max_retries=max_retries,
+        progress_callback=progress_callback,
+        max_concurrency=max_concurrency
+    )
+    
+    logger.info(f"✅ Generated {len(prompts)} video prompts")
+    return prompts
+
+
+async def _generate_prompts_in_batches(
+    llm_service,
+    narrations: List[str],
+    build_prompt: Callable[..., str],
+    result_key: str,
+    min_words: int,
+    max_words: int,
+    batch_size: int,
+    max_retries: int,
+    progress_callback: Optional[callable],
+    max_concurrency: Optional[int]
+) -> List[str]:
+    """
+    Generate one prompt per narration, dispatching batches concurrently
+    
+    Narrations are sent with their index and prompts must come back keyed by
+    it, so a reply that skips a narration can't shift the others. Prompts
+    received so far are kept, and a repair request asks only for the
+    missing indices.
+    
+    Returns:
+        Prompts in narration order
+    """
     # Split narrations into batches
-    batches = [narrations[i:i + batch_size] for i in range(0, len(narrations), batch_size)]
+    batches = [list(range(i, min(i + batch_size, len(narrations)))) for i in range(0, len(narrations), batch_size)]
     logger.info(f"Split into {len(batches)} batches")
     
-    all_prompts = []
+    completed = 0
     
-    # Process each batch
-    for batch_idx, batch_narrations in enumerate(batches, 1):
-        logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
+    async def run_batch(batch_idx: int) -> List[str]:
+        nonlocal completed
+        batch_indices = batches[batch_idx - 1]
+        batch_prompts: Dict[int, str] = {}
         
-        # Retry logic for this batch
         for attempt in range(1, max_retries + 1):
+            pending = [index for index in batch_indices if index not in batch_prompts]
+            if batch_prompts:
+                logger.info(
+                    f"Batch {batch_idx}: requesting {len(pending)} missing prompts "
+                    f"(attempt {attempt}/{max_retries})"
+                )
+            
             try:
-                # Generate prompts for this batch
-                prompt = build_video_prompt_prompt(
-                    narrations=batch_narrations,
+                prompt = build_prompt(
+                    narrations=[narrations[index] for index in pending],
                     min_words=min_words,
-                    max_words=max_words
+                    max_words=max_words,
+                    indices=pending
                 )
                 
                 response = await llm_service(
@@ -428,37 +446,110 @@ async def generate_video_prompts(
                 # Parse JSON
                 result = _parse_json(response)
                 
-                if "video_prompts" not in result:
-                    raise KeyError("Invalid response format: missing 'video_prompts'")
-                
-                batch_prompts = result["video_prompts"]
-                
-                # Validate batch result
-                if len(batch_prompts) != len(batch_narrations):
-                    raise ValueError(
-                        f"Prompt count mismatch: expected {len(batch_narrations)}, got {len(batch_prompts)}"
-                    )
-                
-                # Success - add to all_prompts
-                all_prompts.extend(batch_prompts)
-                logger.info(f"✓ Batch {batch_idx} completed: {len(batch_prompts)} video prompts")
+                if result_key not in result:
+                    raise KeyError(f"Invalid response format: missing '{result_key}'")
                 
-                # Report progress
-                if progress_callback:
-                    completed = len(all_prompts)
-                    total = len(narrations)
-                    progress_callback(completed, total, f"Batch {batch_idx}/{len(batches)} completed")
-                
-                break  # Success, move to next batch
-            
+                received = _match_prompts(result[result_key], pending)
             except Exception as e:
-                logger.warning(f"✗ Batch {batch_idx} attempt {attempt} failed: {e}")
+                logger.warning(f"✗ Batch {batch_idx} attempt {attempt}/{max_retries} failed: {e}")
                 if attempt >= max_retries:
                     raise
-                logger.info(f"Retrying batch {batch_idx}...")
+                continue
+            
+            batch_prompts.update(received)
+            
+            if len(batch_prompts) == len(batch_indices):
+                logger.info(f"✅ Batch {batch_idx} completed successfully ({len(batch_prompts)} prompts)")
+                completed += len(batch_prompts)
+                if progress_callback:
+                    progress_callback(completed, len(narrations), f"Batch {batch_idx}/{len(batches)} completed")
+                return [batch_prompts[index] for index in batch_indices]
+            
+            logger.warning(
+                f"Batch {batch_idx} prompt count mismatch (attempt {attempt}/{max_retries}): "
+                f"expected {len(pending)}, got {len(received)}"
+            )
+        
+        raise ValueError(
+            f"Batch {batch_idx} prompt count mismatch after {max_retries} attempts:\n"
+            f"  Expected: {len(batch_indices)} prompts\n"
+            f"  Got: {len(batch_prompts)} prompts"
+        )
+    
+    results = await gather_limited(range(1, len(batches) + 1), run_batch, _llm_concurrency(max_concurrency))
+    return [prompt for batch_prompts in results for prompt in batch_prompts]
+
+
+def _match_prompts(items: List[Any], pending: List[int]) -> Dict[int, str]:
+    """
+    Map prompts of an LLM reply to the narration indices they belong to
     
-    logger.info(f"✅ Generated {len(all_prompts)} video prompts")
-    return all_prompts
+    Items are {"index": i, "prompt": "..."} objects. Items with an unknown
+    or repeated index, or without a prompt, are dropped. Plain strings (no
+    index) are only accepted when there is exactly one per requested
+    narration; otherwise nothing can tell which narration was skipped.
+    
+    Returns:
+        {narration index: prompt} for the usable items
+    """
+    if items and all(isinstance(item, str) for item in items):
+        if len(items) == len(pending):
+            return dict(zip(pending, items))
+        logger.warning(f"Got {len(items)} prompts without indices for {len(pending)} narrations, discarding them")
+        return {}
+    
+    matched = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        index, prompt = item.get("index"), item.get("prompt")
+        if isinstance(index, str) and index.strip().isdigit():
+            index = int(index)
+        if index not in pending or index in matched or not isinstance(prompt, str) or not prompt.strip():
+            logger.warning(f"Ignoring prompt with unexpected index or content: {str(item)[:100]}")
+            continue
+        matched[index] = prompt
+    return matched
+
+
+def _llm_concurrency(max_concurrency: Optional[int] = None) -> int:
+    """Max concurrent LLM requests (explicit value, else llm.max_concurrency)"""
+    if max_concurrency is not None:
+        return max_concurrency
+    
+    from pixelle_video.config import config_manager
+    return config_manager.config.llm.max_concurrency
+
+
+def _split_content(content: str, n_parts: int) -> List[str]:
+    """
+    Split content into up to n_parts sections of similar length
+    
+    Cuts only at paragraph boundaries, or at sentence boundaries when there
+    are fewer paragraphs than parts. Short content may yield fewer sections.
+    """
+    units = [p for p in re.split(r'\n\s*\n', content.strip()) if p.strip()]
+    if len(units) < n_parts:
+        units = [s for s in re.split(r'(?<=[。.!?！？])\s*', content.strip()) if s.strip()]
+    if len(units) <= 1 or n_parts <= 1:
+        return [content]
+    
+    n_parts = min(n_parts, len(units))
+    target = sum(len(u) for u in units) / n_parts
+    
+    sections, current, size = [], [], 0
+    for i, unit in enumerate(units):
+        current.append(unit)
+        size += len(unit)
+        remaining_units = len(units) - i - 1
+        remaining_parts = n_parts - len(sections) - 1
+        # Close the section once it reaches its share, keeping a unit for every remaining part
+        if remaining_parts > 0 and (size >= target or remaining_units == remaining_parts):
+            sections.append("\n\n".join(current))
+            current, size = [], 0
+    if current:
+        sections.append("\n\n".join(current))
+    return sections
 
 
 def _parse_json(text: str) -> dict:
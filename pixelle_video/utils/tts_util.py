@@ -235,11 +235,8 @@ def get_audio_duration(audio_path: str) -> float:
         Duration in seconds
     """
     try:
-        # Try using ffmpeg-python
-        import ffmpeg
-        probe = ffmpeg.probe(audio_path)
-        duration = float(probe['format']['duration'])
-        return duration
+        from pixelle_video.services.media_info import probe_media
+        return probe_media(audio_path).duration
     except Exception as e:
         logger.warning(f"Failed to get audio duration: {e}, using estimate")
         # Fallback: estimate based on file size (very rough)
@@ -0,0 +1,132 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Render workers - Run API tasks outside the API process
+
+Each worker process takes one task at a time from the shared task database
+(data/tasks.db) and runs the full pipeline, so ffmpeg and Chromium load never
+competes with the API event loop. Progress and results are written back to
+the database, where the API reads them.
+
+Usage:
+    # API only enqueues
+    uv run python api/app.py --task-execution worker
+
+    # Render capacity, scaled independently (default: max_concurrent_tasks processes)
+    uv run python -m pixelle_video.worker --processes 8
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+# Project root on sys.path, so the api package (task handlers) is importable
+_project_root = Path(__file__).resolve().parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from loguru import logger
+
+
+async def _serve(name: str):
+    """Run one worker until cancelled, then release its resources"""
+    # Importing the routers registers the task handlers
+    import api.routers  # noqa: F401
+    from api.dependencies import shutdown_pixelle_video
+    from api.tasks import task_manager
+    from pixelle_video.services.browser_pool import close_render_pool
+
+    main_task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, main_task.cancel)
+    except (NotImplementedError, RuntimeError):
+        pass  # Windows: rely on KeyboardInterrupt
+
+    try:
+        await task_manager.run_worker(name)
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await shutdown_pixelle_video()
+        await close_render_pool()
+
+
+def _worker_main(index: int):
+    """Worker process entry point"""
+    name = f"{socket.gethostname()}:{os.getpid()}:{index}"
+    try:
+        asyncio.run(_serve(name))
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    from api.config import api_config
+
+    parser = argparse.ArgumentParser(description="Run Pixelle-Video render workers")
+    parser.add_argument(
+        "-n", "--processes",
+        type=int,
+        default=api_config.max_concurrent_tasks,
+        help="Number of worker processes (each runs one task at a time)"
+    )
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    processes = {}
+    stopping = False
+
+    def start(index: int):
+        process = ctx.Process(target=_worker_main, args=(index,), name=f"pixelle-worker-{index}")
+        process.start()
+        processes[index] = process
+
+    def stop(*_):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+
+    logger.info(f"Starting {args.processes} render workers")
+    for index in range(args.processes):
+        start(index)
+
+    try:
+        # Supervise: restart workers that die unexpectedly
+        while not stopping:
+            time.sleep(1)
+            for index, process in list(processes.items()):
+                if not process.is_alive() and not stopping:
+                    logger.warning(f"Worker {index} exited with code {process.exitcode}, restarting")
+                    start(index)
+    except KeyboardInterrupt:
+        # Children received SIGINT from the terminal as well
+        pass
+
+    for process in processes.values():
+        if process.is_alive():
+            process.terminate()
+    for process in processes.values():
+        process.join()
+    logger.info("All render workers stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Segment encode benchmark - "standard" vs "still" image segment encoding
+
+Renders every bundled image template of a size with sample content, then
+encodes each frame with VideoService.create_video_from_image in both
+encode modes (segment_encode_mode) against the same narration-length audio.
+Reports wall time and output size per template and mode, and checks that
+both outputs match the segment spec (so they stay concat-compatible).
+
+Requires ffmpeg/ffprobe, and Chrome/Chromium to render the templates. Without
+a browser, pass --frames with already rendered frames (e.g. the frames of a
+finished task under output/<task_id>/frames/).
+
+Usage:
+    uv run python scripts/benchmark_segment_encode.py
+    uv run python scripts/benchmark_segment_encode.py --duration 8 --repeat 3
+    uv run python scripts/benchmark_segment_encode.py --frames output/<task_id>/frames
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Project root on sys.path, so pixelle_video is importable when run as a script
+_project_root = Path(__file__).resolve().parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+import ffmpeg
+from loguru import logger
+
+ENCODE_MODES = ("standard", "still")
+
+SAMPLE_TITLE = "Why reading matters"
+SAMPLE_TEXT = (
+    "Reading builds new neural pathways. Every page asks the brain to imagine "
+    "places, voices and ideas it has never met before."
+)
+SAMPLE_IMAGE = "resources/example.png"
+
+
+def _make_audio(path: str, duration: float):
+    """Narration stand-in: a tone of the given length, encoded like TTS output"""
+    (
+        ffmpeg
+        .input(f"sine=frequency=220:sample_rate=44100:duration={duration}", f="lavfi")
+        .output(path, acodec="libmp3lame", audio_bitrate="128k", ac=2)
+        .overwrite_output()
+        .run(quiet=True)
+    )
+
+
+async def _render_frames(size: str, output_dir: Path) -> List[Tuple[str, str]]:
+    """Render every image template of a size with sample content"""
+    from pixelle_video.services.browser_pool import close_render_pool
+    from pixelle_video.services.frame_html import HTMLFrameGenerator
+
+    templates = sorted(
+        path for path in (_project_root / "templates" / size).glob("*.html")
+        # Video templates are composed over video media (overlay path), not encoded from a still
+        if not path.name.startswith("video_")
+    )
+
+    frames = []
+    try:
+        for template in templates:
+            output_path = str(output_dir / f"{template.stem}.png")
+            try:
+                await HTMLFrameGenerator(str(template)).generate_frame(
+                    title=SAMPLE_TITLE,
+                    text=SAMPLE_TEXT,
+                    image=str(_project_root / SAMPLE_IMAGE),
+                    ext={"index": 1},
+                    output_path=output_path
+                )
+            except Exception as e:
+                logger.error(f"Failed to render {template.name}: {e}")
+                continue
+            frames.append((template.stem, output_path))
+    finally:
+        await close_render_pool()
+    return frames
+
+
+async def _encode(video_service, image: str, audio: str, output: str, fps: int, mode: str, repeat: int) -> float:
+    """Best wall time in seconds over repeat runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await video_service.create_video_from_image(image, audio, output, fps=fps, encode_mode=mode)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+async def run(args) -> int:
+    from pixelle_video.services.media_info import probe_media
+    from pixelle_video.services.segment_spec import SegmentSpec
+    from pixelle_video.services.video import VideoService
+
+    output_dir = Path(args.output)
+    (output_dir / "frames").mkdir(parents=True, exist_ok=True)
+
+    if args.frames:
+        frames = [(path.stem, str(path)) for path in sorted(Path(args.frames).glob("*.png"))]
+    else:
+        frames = await _render_frames(args.size, output_dir / "frames")
+    if not frames:
+        logger.error("No frames to encode")
+        return 1
+
+    audio = str(output_dir / "narration.mp3")
+    _make_audio(audio, args.duration)
+
+    video_service = VideoService()
+    spec = SegmentSpec(fps=args.fps)
+    results: Dict[str, Dict[str, Tuple[float, int]]] = {}
+
+    for name, image in frames:
+        results[name] = {}
+        for mode in ENCODE_MODES:
+            output = str(output_dir / f"{name}.{mode}.mp4")
+            elapsed = await _encode(video_service, image, audio, output, args.fps, mode, args.repeat)
+            problems = spec.mismatches(probe_media(output))
+            if problems:
+                logger.warning(f"{name} ({mode}) does not match the segment spec: {', '.join(problems)}")
+            results[name][mode] = (elapsed, os.path.getsize(output))
+        logger.info(f"Encoded {name}")
+
+    header = f"{'frame':<32} {'standard s':>10} {'still s':>8} {'speedup':>8} {'standard KB':>12} {'still KB':>9}"
+    print(f"\n{len(frames)} frames, {args.duration:g}s audio, {args.fps} fps, best of {args.repeat}\n")
+    print(header)
+    print("-" * len(header))
+    totals = {mode: [0.0, 0] for mode in ENCODE_MODES}
+    for name, by_mode in results.items():
+        (standard_s, standard_size), (still_s, still_size) = by_mode["standard"], by_mode["still"]
+        for mode, (elapsed, size) in by_mode.items():
+            totals[mode][0] += elapsed
+            totals[mode][1] += size
+        print(
+            f"{name:<32} {standard_s:>10.2f} {still_s:>8.2f} {standard_s / still_s:>7.1f}x "
+            f"{standard_size / 1024:>12.0f} {still_size / 1024:>9.0f}"
+        )
+    (standard_s, standard_size), (still_s, still_size) = totals["standard"], totals["still"]
+    print("-" * len(header))
+    print(
+        f"{'total':<32} {standard_s:>10.2f} {still_s:>8.2f} {standard_s / still_s:>7.1f}x "
+        f"{standard_size / 1024:>12.0f} {still_size / 1024:>9.0f}"
+    )
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark standard vs still image segment encoding")
+    parser.add_argument("--size", default="1080x1920", help="Template size directory under templates/")
+    parser.add_argument("--frames", help="Directory of rendered frame PNGs to encode instead of rendering templates")
+    parser.add_argument("--duration", type=float, default=5.0, help="Segment (audio) duration in seconds")
+    parser.add_argument("--fps", type=int, default=30, help="Output frame rate")
+    parser.add_argument("--repeat", type=int, default=1, help="Encodes per frame and mode (best time is reported)")
+    parser.add_argument("--output", default="output/benchmark_segment_encode", help="Directory for frames and encoded segments")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the file service: Range requests and conditional requests
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers.files import router as files_router
+
+CONTENT = bytes(range(256)) * 40  # 10240 bytes, every offset has a known value
+SIZE = len(CONTENT)
+URL = "/api/files/task/final.mp4"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client serving a known file at output/task/final.mp4 (cwd is the file root)"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "output" / "task").mkdir(parents=True)
+    (tmp_path / "output" / "task" / "final.mp4").write_bytes(CONTENT)
+
+    app = FastAPI()
+    app.include_router(files_router, prefix="/api")
+    return TestClient(app)
+
+
+def test_full_response_has_validators(client):
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-type"] == "video/mp4"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"].startswith('"')
+    assert "last-modified" in response.headers
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_single_range(client):
+    response = client.get(URL, headers={"Range": "bytes=100-199"})
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 100-199/{SIZE}"
+    assert response.headers["content-length"] == "100"
+    assert response.content == CONTENT[100:200]
+
+
+def test_suffix_range(client):
+    response = client.get(URL, headers={"Range": "bytes=-16"})
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes {SIZE - 16}-{SIZE - 1}/{SIZE}"
+    assert response.content == CONTENT[-16:]
+
+
+def test_multi_range(client):
+    response = client.get(URL, headers={"Range": "bytes=0-9,1000-1019"})
+
+    assert response.status_code == 206
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=", 1)[1].encode()
+
+    parts = [part for part in response.content.split(b"--" + boundary) if part.strip(b"\r\n-")]
+    assert len(parts) == 2
+    for part, (start, end) in zip(parts, [(0, 9), (1000, 1019)]):
+        head, body = part.split(b"\r\n\r\n", 1)
+        assert f"content-range: bytes {start}-{end}/{SIZE}".encode() in head.lower()
+        assert body.rstrip(b"\r\n") == CONTENT[start:end + 1]
+
+
+def test_if_range_with_current_etag_returns_range(client):
+    etag = client.get(URL).headers["etag"]
+
+    response = client.get(URL, headers={"Range": "bytes=0-9", "If-Range": etag})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[:10]
+
+
+def test_if_range_with_stale_etag_returns_full_file(client):
+    response = client.get(URL, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_unsatisfiable_range(client):
+    response = client.get(URL, headers={"Range": f"bytes={SIZE + 100}-"})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{SIZE}"
+
+
+def test_if_none_match_returns_304(client):
+    etag = client.get(URL).headers["etag"]
+
+    response = client.get(URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_if_none_match_with_other_etag_returns_file(client):
+    response = client.get(URL, headers={"If-None-Match": '"other"'})
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_if_modified_since_returns_304(client):
+    last_modified = client.get(URL).headers["last-modified"]
+
+    response = client.get(URL, headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == 304
+
+
+def test_versioned_url_is_immutable(client):
+    version = client.get(URL).headers["etag"].strip('"')
+
+    response = client.get(URL, params={"v": version})
+
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_missing_file(client):
+    assert client.get("/api/files/task/missing.mp4").status_code == 404
@@ -0,0 +1,75 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for task event streaming: replay on subscribe
+"""
+
+import asyncio
+
+import pytest
+
+from api.tasks.manager import TaskManager
+from api.tasks.models import Task, TaskProgress, TaskStatus, TaskType
+
+
+@pytest.fixture
+def manager():
+    """In-process manager (not started) holding one task with three buffered events"""
+    manager = TaskManager()
+    task = Task(task_id="task", task_type=TaskType.VIDEO_GENERATION, status=TaskStatus.RUNNING)
+    manager._tasks[task.task_id] = task
+
+    manager._publish(task, "status")                                   # seq 1
+    task.progress = TaskProgress(current=1, total=2, percentage=50.0)
+    manager._publish(task, "progress")                                 # seq 2
+    return manager
+
+
+async def collect(manager: TaskManager, last_seq: int) -> list:
+    return [event async for event in manager.subscribe("task", last_seq=last_seq)]
+
+
+def finish(manager: TaskManager):
+    task = manager._tasks["task"]
+    task.status = TaskStatus.COMPLETED
+    manager._publish(task, "status")                                   # seq 3
+
+
+async def test_replays_events_after_last_seq(manager):
+    finish(manager)
+
+    events = await collect(manager, last_seq=1)
+
+    assert [event["seq"] for event in events] == [2, 3]
+    assert events[-1]["status"] == "completed"
+
+
+async def test_stale_last_seq_replays_from_start(manager):
+    finish(manager)
+
+    # e.g. a Last-Event-ID from before a server restart
+    events = await collect(manager, last_seq=42)
+
+    assert [event["seq"] for event in events] == [1, 2, 3]
+
+
+async def test_stale_last_seq_still_receives_live_events(manager):
+    subscriber = asyncio.create_task(collect(manager, last_seq=42))
+    await asyncio.sleep(0.01)
+    finish(manager)
+
+    events = await asyncio.wait_for(subscriber, timeout=1)
+
+    assert [event["seq"] for event in events] == [1, 2, 3]
+    assert not manager._subscribers
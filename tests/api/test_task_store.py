@@ -0,0 +1,140 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for the SQLite task store: claiming, stale task recovery and cancellation
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from api.tasks.models import Task, TaskStatus, TaskType
+from api.tasks.store import TaskStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TaskStore(str(tmp_path / "tasks.db"))
+    yield store
+    store.close()
+
+
+def add_task(store: TaskStore, task_id: str, priority: int = 0) -> Task:
+    task = Task(task_id=task_id, task_type=TaskType.VIDEO_GENERATION, priority=priority)
+    store.save(task)
+    return task
+
+
+def test_claim_next_takes_highest_priority_then_oldest(store):
+    add_task(store, "old")
+    add_task(store, "new")
+    add_task(store, "urgent", priority=5)
+
+    claimed = [store.claim_next("worker-1").task_id for _ in range(3)]
+
+    assert claimed == ["urgent", "old", "new"]
+    assert store.claim_next("worker-1") is None
+
+
+def test_claim_next_marks_task_running(store):
+    add_task(store, "task")
+
+    task = store.claim_next("worker-1")
+
+    assert task.status == TaskStatus.RUNNING
+    assert task.attempts == 1
+    assert task.started_at is not None
+    assert store.load("task").status == TaskStatus.RUNNING
+
+
+def test_each_task_is_claimed_once_across_connections(store, tmp_path):
+    other = TaskStore(str(tmp_path / "tasks.db"))
+    try:
+        for i in range(6):
+            add_task(store, f"task-{i}")
+
+        claimed = []
+        for _ in range(4):
+            for worker in (store, other):
+                task = worker.claim_next("worker")
+                if task is not None:
+                    claimed.append(task.task_id)
+
+        assert sorted(claimed) == [f"task-{i}" for i in range(6)]
+    finally:
+        other.close()
+
+
+def test_requeue_stale_requeues_then_fails(store):
+    add_task(store, "task")
+    store.claim_next("worker-1")
+    time.sleep(0.01)
+
+    assert store.requeue_stale(stale_after=0, max_attempts=2) == ["task"]
+    task = store.load("task")
+    assert task.status == TaskStatus.PENDING
+    assert task.started_at is None
+
+    store.claim_next("worker-2")
+    time.sleep(0.01)
+
+    assert store.requeue_stale(stale_after=0, max_attempts=2) == ["task"]
+    task = store.load("task")
+    assert task.status == TaskStatus.FAILED
+    assert "2 attempt(s)" in task.error
+
+
+def test_requeue_stale_keeps_live_tasks(store):
+    add_task(store, "task")
+    store.claim_next("worker-1")
+    store.heartbeat("task")
+
+    assert store.requeue_stale(stale_after=60, max_attempts=3) == []
+    assert store.load("task").status == TaskStatus.RUNNING
+
+
+def test_cancel_pending_task(store):
+    add_task(store, "task")
+
+    assert store.cancel("task") is True
+
+    task = store.load("task")
+    assert task.status == TaskStatus.CANCELLED
+    assert task.completed_at is not None
+    assert store.claim_next("worker-1") is None
+
+
+def test_cancel_running_task_discards_its_result(store):
+    add_task(store, "task")
+    task = store.claim_next("worker-1")
+
+    assert store.cancel("task") is True
+    assert store.heartbeat("task") == TaskStatus.CANCELLED
+
+    task.status = TaskStatus.COMPLETED
+    assert store.finish(task) is False
+    assert store.load("task").status == TaskStatus.CANCELLED
+
+
+def test_cancel_finished_or_missing_task(store):
+    add_task(store, "task")
+    task = store.claim_next("worker-1")
+    task.status = TaskStatus.COMPLETED
+    task.completed_at = datetime.now()
+    assert store.finish(task) is True
+
+    assert store.cancel("task") is False
+    assert store.load("task").status == TaskStatus.COMPLETED
+    assert store.cancel("missing") is False
@@ -0,0 +1,109 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for the asset cache: in-flight dedupe of identical generations
+"""
+
+import asyncio
+
+import pytest
+
+from pixelle_video.services.asset_cache import AssetCache, make_cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AssetCache(str(tmp_path / "cache"), max_bytes=1024 * 1024, name="Test")
+
+
+def make_create(cache: AssetCache, calls: list, release: asyncio.Event):
+    """create() writing a small file once release is set"""
+    async def create() -> str:
+        calls.append(1)
+        await release.wait()
+        path = cache.temp_path(".txt")
+        with open(path, "w") as f:
+            f.write("generated")
+        return path
+    return create
+
+
+async def test_concurrent_identical_requests_share_one_generation(cache):
+    key = make_cache_key(text="Hello", voice="test")
+    calls = []
+    release = asyncio.Event()
+    create = make_create(cache, calls, release)
+
+    requests = [asyncio.create_task(cache.get_or_create_entry(key, create)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    release.set()
+    entries = await asyncio.gather(*requests)
+
+    assert len(calls) == 1
+    assert len({entry["path"] for entry in entries}) == 1
+    with open(entries[0]["path"]) as f:
+        assert f.read() == "generated"
+
+
+async def test_stored_entry_is_a_hit(cache):
+    key = make_cache_key(text="Hello", voice="test")
+    calls = []
+    release = asyncio.Event()
+    release.set()
+    create = make_create(cache, calls, release)
+
+    first = await cache.get_or_create_entry(key, create, extra={"voice": "test"})
+    second = await cache.get_or_create_entry(key, create)
+
+    assert len(calls) == 1
+    assert second["path"] == first["path"]
+    assert second["voice"] == "test"
+
+
+async def test_waiter_generates_when_leader_is_cancelled(cache):
+    key = make_cache_key(text="Hello", voice="test")
+    calls = []
+    release = asyncio.Event()
+    create = make_create(cache, calls, release)
+
+    leader = asyncio.create_task(cache.get_or_create_entry(key, create))
+    await asyncio.sleep(0.05)
+    waiter = asyncio.create_task(cache.get_or_create_entry(key, create))
+    await asyncio.sleep(0.05)
+    leader.cancel()
+    release.set()
+
+    entry = await waiter
+
+    assert leader.cancelled()
+    assert len(calls) == 2
+    assert entry is not None
+
+
+async def test_failed_generation_is_not_cached(cache):
+    key = make_cache_key(text="Hello", voice="test")
+
+    async def fail() -> str:
+        raise RuntimeError("generation failed")
+
+    with pytest.raises(RuntimeError, match="generation failed"):
+        await cache.get_or_create_entry(key, fail)
+
+    calls = []
+    release = asyncio.Event()
+    release.set()
+    entry = await cache.get_or_create_entry(key, make_create(cache, calls, release))
+
+    assert len(calls) == 1
+    assert entry is not None
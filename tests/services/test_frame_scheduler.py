@@ -0,0 +1,133 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for the frame scheduler: stage ordering and failure handling
+"""
+
+import asyncio
+
+import pytest
+
+from pixelle_video.models.storyboard import Storyboard, StoryboardConfig, StoryboardFrame
+from pixelle_video.services.frame_processor import FRAME_STAGES
+from pixelle_video.services.frame_scheduler import FrameScheduler, StageSpec
+
+
+class FakeFrameProcessor:
+    """Records stage runs; optionally fails one (frame, stage) and slows others"""
+
+    def __init__(self, fail_at=None, delay=0.0):
+        self.fail_at = fail_at
+        self.delay = delay
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+
+    def stage_fingerprint(self, stage, frame, storyboard, config):
+        return f"{stage}:{frame.index}"
+
+    def has_stage_output(self, stage, frame):
+        return True
+
+    def clear_stage_output(self, stage, frame):
+        pass
+
+    async def run_stage(self, stage, frame, storyboard, config):
+        self.started.append((frame.index, stage))
+        if (frame.index, stage) == self.fail_at:
+            raise RuntimeError(f"{stage} failed for frame {frame.index}")
+        try:
+            await asyncio.sleep(self.delay * (frame.index + 1))
+        except asyncio.CancelledError:
+            self.cancelled.append((frame.index, stage))
+            raise
+        self.finished.append((frame.index, stage))
+
+
+def make_storyboard(n_frames: int) -> Storyboard:
+    config = StoryboardConfig(media_width=1080, media_height=1920)
+    frames = [StoryboardFrame(index=i, narration=f"Narration {i}", image_prompt=f"Prompt {i}") for i in range(n_frames)]
+    return Storyboard(title="Test", config=config, frames=frames)
+
+
+def make_scheduler(processor, workers: int = 2) -> FrameScheduler:
+    return FrameScheduler(processor, [StageSpec(name, workers) for name in FRAME_STAGES], queue_size=2)
+
+
+async def test_each_frame_runs_stages_in_order():
+    processor = FakeFrameProcessor(delay=0.001)
+    storyboard = make_storyboard(5)
+
+    frames = await make_scheduler(processor).run(storyboard, storyboard.config)
+
+    assert frames is storyboard.frames
+    assert len(processor.finished) == 5 * len(FRAME_STAGES)
+    for frame in frames:
+        order = [stage for index, stage in processor.finished if index == frame.index]
+        assert order == list(FRAME_STAGES)
+        assert frame.completed_stages == list(FRAME_STAGES)
+
+
+async def test_callbacks_follow_stage_completion():
+    processor = FakeFrameProcessor()
+    storyboard = make_storyboard(3)
+    stages_done = []
+    frames_done = []
+
+    async def on_stage_complete(frame, stage):
+        stages_done.append((frame.index, stage))
+
+    async def on_frame_complete(frame):
+        # A frame is reported only once all its stages are done
+        assert (frame.index, FRAME_STAGES[-1]) in stages_done
+        frames_done.append(frame.index)
+
+    await make_scheduler(processor).run(
+        storyboard,
+        storyboard.config,
+        on_stage_complete=on_stage_complete,
+        on_frame_complete=on_frame_complete
+    )
+
+    assert sorted(stages_done) == sorted(processor.finished)
+    assert sorted(frames_done) == [0, 1, 2]
+
+
+async def test_up_to_date_stages_are_skipped():
+    processor = FakeFrameProcessor()
+    storyboard = make_storyboard(2)
+    await make_scheduler(processor).run(storyboard, storyboard.config)
+
+    rerun = FakeFrameProcessor()
+    await make_scheduler(rerun).run(storyboard, storyboard.config)
+
+    assert rerun.started == []
+
+
+async def test_failure_cancels_other_frames():
+    processor = FakeFrameProcessor(fail_at=(0, "media"), delay=0.05)
+    storyboard = make_storyboard(4)
+
+    with pytest.raises(RuntimeError, match="media failed for frame 0"):
+        await make_scheduler(processor).run(storyboard, storyboard.config)
+
+    # Work in flight when frame 0 failed was cancelled, nothing ran to the end
+    assert processor.cancelled
+    assert not any(stage == FRAME_STAGES[-1] for _, stage in processor.finished)
+    assert "media" not in storyboard.frames[0].completed_stages
+
+    # Nothing is left running after run() returns
+    started = len(processor.started)
+    await asyncio.sleep(0.3)
+    assert len(processor.started) == started
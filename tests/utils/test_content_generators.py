@@ -0,0 +1,54 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for matching LLM prompt replies to narration indices
+"""
+
+from pixelle_video.utils.content_generators import _match_prompts
+
+
+def test_items_are_keyed_by_index():
+    items = [{"index": 4, "prompt": "b"}, {"index": 3, "prompt": "a"}]
+
+    assert _match_prompts(items, [3, 4]) == {3: "a", 4: "b"}
+
+
+def test_skipped_index_is_left_missing():
+    items = [{"index": 3, "prompt": "a"}, {"index": 5, "prompt": "c"}]
+
+    assert _match_prompts(items, [3, 4, 5]) == {3: "a", 5: "c"}
+
+
+def test_duplicate_index_keeps_first_prompt():
+    items = [{"index": 3, "prompt": "a"}, {"index": 3, "prompt": "again"}, {"index": 4, "prompt": "b"}]
+
+    assert _match_prompts(items, [3, 4]) == {3: "a", 4: "b"}
+
+
+def test_unknown_index_or_empty_prompt_is_dropped():
+    items = [
+        {"index": 9, "prompt": "not requested"},
+        {"index": 3, "prompt": "  "},
+        {"index": 4},
+        "stray",
+        {"index": "5", "prompt": "string index"},
+    ]
+
+    assert _match_prompts(items, [3, 4, 5]) == {5: "string index"}
+
+
+def test_plain_strings_need_one_per_narration():
+    assert _match_prompts(["a", "b"], [3, 4]) == {3: "a", 4: "b"}
+    # One missing: no way to tell which narration was skipped
+    assert _match_prompts(["a"], [3, 4]) == {}
@@ -238,8 +238,15 @@ def render_bgm_section(key_prefix=""):
                 key=f"{key_prefix}bgm_volume_slider",
                 help=tr("bgm.volume_help")
             )
+            bgm_ducking = st.checkbox(
+                tr("bgm.ducking"),
+                value=False,
+                key=f"{key_prefix}bgm_ducking_checkbox",
+                help=tr("bgm.ducking_help")
+            )
         else:
             bgm_volume = 0.2  # Default value when no BGM selected
+            bgm_ducking = False
         
         # BGM preview button (only if BGM is not "None")
         if bgm_choice != tr("bgm.none"):
@@ -259,7 +266,8 @@ def render_bgm_section(key_prefix=""):
     
     return {
         "bgm_path": bgm_path,
-        "bgm_volume": bgm_volume
+        "bgm_volume": bgm_volume,
+        "bgm_ducking": bgm_ducking
     }
 
 
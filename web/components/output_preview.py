@@ -25,6 +25,8 @@ from web.i18n import tr, get_language
 from web.utils.async_helpers import run_async
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.config import config_manager
+from pixelle_video.services.live_preview import get_preview_playlist_path
+from pixelle_video.utils.os_util import create_task_id, get_task_frame_path
 
 
 def render_output_preview(pixelle_video, video_params):
@@ -50,6 +52,7 @@ def render_single_output(pixelle_video, video_params):
     split_mode = video_params.get("split_mode", "paragraph")
     bgm_path = video_params.get("bgm_path")
     bgm_volume = video_params.get("bgm_volume", 0.2)
+    bgm_ducking = video_params.get("bgm_ducking", False)
     
     tts_mode = video_params.get("tts_inference_mode", "local")
     selected_voice = video_params.get("tts_voice")
@@ -84,6 +87,11 @@ def render_single_output(pixelle_video, video_params):
             # Show progress
             progress_bar = st.progress(0)
             status_text = st.empty()
+            preview_slot = st.empty()
+            
+            # Task ID assigned up front, so the live preview can be located while generating
+            task_id = create_task_id()
+            preview_shown = False
             
             # Record start time for generation
             import time
@@ -93,6 +101,8 @@ def render_single_output(pixelle_video, video_params):
                 # Progress callback to update UI
                 def update_progress(event: ProgressEvent):
                     """Update progress bar and status text from ProgressEvent"""
+                    nonlocal preview_shown
+                    
                     # Translate event to user-facing message
                     if event.event_type == "frame_step":
                         # Frame step: "分镜 3/5 - 步骤 2/4: 生成插图"
@@ -122,10 +132,19 @@ def render_single_output(pixelle_video, video_params):
                     
                     status_text.text(message)
                     progress_bar.progress(min(int(event.progress * 100), 99))  # Cap at 99% until complete
+                    
+                    # Live preview: play the first scene's segment as soon as it's rendered
+                    # (only that scene: the growing HLS playlist needs an HLS-capable player, see API preview_url)
+                    if not preview_shown and os.path.exists(get_preview_playlist_path(task_id)):
+                        preview_shown = True
+                        with preview_slot.container():
+                            st.caption(tr("progress.preview_ready"))
+                            st.video(get_task_frame_path(task_id, 0, "segment"))
                 
                 # Generate video (directly pass parameters)
                 # Note: media_width and media_height are auto-determined from template
                 video_params = {
+                    "task_id": task_id,
                     "text": text,
                     "mode": mode,
                     "title": title if title else None,
@@ -136,6 +155,7 @@ def render_single_output(pixelle_video, video_params):
                     "prompt_prefix": prompt_prefix,
                     "bgm_path": bgm_path,
                     "bgm_volume": bgm_volume if bgm_path else 0.2,
+                    "bgm_ducking": bgm_ducking,
                     "progress_callback": update_progress,
                     "media_width": st.session_state.get('template_media_width'),
                     "media_height": st.session_state.get('template_media_height'),
@@ -162,6 +182,7 @@ def render_single_output(pixelle_video, video_params):
                 
                 progress_bar.progress(100)
                 status_text.text(tr("status.success"))
+                preview_slot.empty()
                 
                 # Display success message
                 st.success(tr("status.video_generated", path=result.video_path))
@@ -254,6 +275,7 @@ def render_batch_output(pixelle_video, video_params):
                 "prompt_prefix": video_params.get("prompt_prefix") or "",
                 "bgm_path": video_params.get("bgm_path"),
                 "bgm_volume": video_params.get("bgm_volume") or 0.2,
+                "bgm_ducking": video_params.get("bgm_ducking", False),
                 "tts_inference_mode": video_params.get("tts_inference_mode") or "local",
                 "media_width": video_params.get("media_width"),
                 "media_height": video_params.get("media_height"),
@@ -388,6 +388,7 @@ class AssetBasedPipelineUI(PipelineUI):
                         bgm_path=video_params.get("bgm_path"),
                         bgm_volume=video_params.get("bgm_volume", 0.2),
                         bgm_mode=video_params.get("bgm_mode", "loop"),
+                        bgm_ducking=video_params.get("bgm_ducking", False),
                         voice_id=video_params.get("voice_id", "zh-CN-YunjianNeural"),
                         tts_speed=video_params.get("tts_speed", 1.2),
                         progress_callback=update_progress
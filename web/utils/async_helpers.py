@@ -22,8 +22,35 @@ from loguru import logger
 
 
 def run_async(coro):
-    """Run async coroutine in sync context"""
-    return asyncio.run(coro)
+    """
+    Run async coroutine in sync context
+
+    Every call runs in a fresh event loop, so loop-bound pooled clients are
+    closed before the loop ends instead of leaking their connections.
+    """
+    async def _run():
+        try:
+            return await coro
+        finally:
+            await _close_loop_clients()
+
+    return asyncio.run(_run())
+
+
+async def _close_loop_clients():
+    """Close the pooled clients bound to the current event loop"""
+    from pixelle_video.services.downloader import close_downloader
+    from pixelle_video.services.llm_service import close_llm_clients
+
+    try:
+        await close_llm_clients()
+    except Exception as e:
+        logger.warning(f"Failed to close LLM clients: {e}")
+
+    try:
+        await close_downloader()
+    except Exception as e:
+        logger.warning(f"Failed to close download client: {e}")
 
 
 def get_project_version():